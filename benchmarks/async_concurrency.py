@@ -0,0 +1,92 @@
+"""Blocking vs async database stack under high concurrency.
+
+Every simulated request runs one query that takes ``--db-latency-ms`` on the
+server (``pg_sleep``). The blocking engine is driven through anyio's threadpool,
+exactly like Starlette runs sync ``def`` endpoints (40 worker tokens); the async
+engine runs the same query directly on the event loop. Both pools are sized to
+the concurrency level so the threadpool is the only difference.
+
+Usage (needs the database from docker-compose):
+    PYTHONPATH=src python -m benchmarks.async_concurrency --concurrency 200 --requests 4000
+"""
+
+import argparse
+import asyncio
+import time
+
+import anyio.to_thread
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.common import emit, summarize
+from common.config import settings
+
+
+QUERY = text('SELECT pg_sleep(:latency)')
+
+
+async def run_sync(concurrency: int, requests: int, latency: float) -> dict[str, float]:
+    engine = create_engine(settings.database_url, pool_size=concurrency, max_overflow=0)
+    latencies: list[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    def query() -> None:
+        with engine.connect() as conn:
+            conn.execute(QUERY, {'latency': latency})
+
+    async def one() -> None:
+        async with gate:
+            start = time.perf_counter()
+            await anyio.to_thread.run_sync(query)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    return summarize(latencies, elapsed)
+
+
+async def run_async(concurrency: int, requests: int, latency: float) -> dict[str, float]:
+    engine = create_async_engine(settings.async_database_url, pool_size=concurrency, max_overflow=0)
+    latencies: list[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with gate:
+            start = time.perf_counter()
+            async with engine.connect() as conn:
+                await conn.execute(QUERY, {'latency': latency})
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return summarize(latencies, elapsed)
+
+
+async def main(args: argparse.Namespace) -> None:
+    latency = args.db_latency_ms / 1000
+    results = {
+        'sync_threadpool': await run_sync(args.concurrency, args.requests, latency),
+        'async': await run_async(args.concurrency, args.requests, latency),
+    }
+    emit(
+        {
+            'benchmark': 'async_concurrency',
+            'concurrency': args.concurrency,
+            'db_latency_ms': args.db_latency_ms,
+            'results': results,
+        },
+        args.output,
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=4000)
+    parser.add_argument('--db-latency-ms', type=float, default=10.0)
+    parser.add_argument('--output', default=None, help='Optional path for the JSON results')
+    asyncio.run(main(parser.parse_args()))
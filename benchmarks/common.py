@@ -0,0 +1,48 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+def summarize(latencies_s: list[float], elapsed_s: float) -> dict[str, float]:
+    """Throughput and latency percentiles (ms) for one benchmark run."""
+    ordered = sorted(latencies_s)
+    cuts = statistics.quantiles(ordered, n=100) if len(ordered) > 1 else ordered * 99
+    return {
+        'requests': len(ordered),
+        'elapsed_s': round(elapsed_s, 4),
+        'throughput_rps': round(len(ordered) / elapsed_s, 2) if elapsed_s else 0.0,
+        'p50_ms': round(cuts[49] * 1000, 3),
+        'p95_ms': round(cuts[94] * 1000, 3),
+        'p99_ms': round(cuts[98] * 1000, 3),
+    }
+
+
+def run_metadata() -> dict[str, Any]:
+    """Where and on what code a run happened, so results are compared like for like."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': datetime.now(UTC).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def emit(payload: dict[str, Any], output: str | None = None) -> None:
+    """Print the results as JSON and optionally write them to a file."""
+    text = json.dumps(payload, indent=2, default=str)
+    print(text)
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text(text + '\n')
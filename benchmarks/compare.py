@@ -0,0 +1,124 @@
+"""Compare two benchmark result files (baseline vs candidate) and print the deltas.
+
+Works with any file written by the benchmarks in this package: every object that
+holds ``p50_ms`` is treated as one measurement and matched by its path.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.compare base/load.json head/load.json --max-regression 10
+
+With ``--max-regression PCT`` the exit status is 1 when a p95/p99 gets more than
+PCT percent slower, or a throughput more than PCT percent lower.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import emit
+
+
+METRICS = ('throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms', 'mean_us')
+# Metrics where a higher value is better; for the rest lower is better
+HIGHER_IS_BETTER = {'throughput_rps'}
+GATED_METRICS = ('throughput_rps', 'p95_ms', 'p99_ms')
+
+
+def measurements(payload: Any, path: str = '') -> dict[str, dict[str, float]]:
+    """Every summary in a result file, keyed by its dotted path."""
+    if not isinstance(payload, dict):
+        return {}
+    if 'p50_ms' in payload:
+        return {path: payload}
+    found: dict[str, dict[str, float]] = {}
+    for key, value in payload.items():
+        if key != 'meta':
+            found |= measurements(value, f'{path}.{key}' if path else key)
+    return found
+
+
+def change_pct(baseline: float, candidate: float) -> float | None:
+    if not baseline:
+        return None
+    return round((candidate - baseline) / baseline * 100, 2)
+
+
+def compare(baseline: Any, candidate: Any) -> dict[str, dict[str, dict[str, float | None]]]:
+    """Per measurement and metric: baseline, candidate and change in percent."""
+    base, head = measurements(baseline), measurements(candidate)
+    return {
+        path: {
+            metric: {
+                'baseline': base[path][metric],
+                'candidate': head[path][metric],
+                'change_pct': change_pct(base[path][metric], head[path][metric]),
+            }
+            for metric in METRICS
+            if metric in base[path] and metric in head[path]
+        }
+        for path in base
+        if path in head
+    }
+
+
+def regressions(
+    deltas: dict[str, dict[str, dict[str, float | None]]], max_regression_pct: float
+) -> list[str]:
+    found = []
+    for path, metrics in deltas.items():
+        for metric in GATED_METRICS:
+            change = metrics.get(metric, {}).get('change_pct')
+            if change is None:
+                continue
+            worse_by = -change if metric in HIGHER_IS_BETTER else change
+            if worse_by > max_regression_pct:
+                found.append(f'{path} {metric} {worse_by:+.1f}% worse')
+    return found
+
+
+def print_table(deltas: dict[str, dict[str, dict[str, float | None]]]) -> None:
+    print(f'{"measurement":40} {"metric":15} {"baseline":>12} {"candidate":>12} {"change":>9}')
+    for path, metrics in deltas.items():
+        for metric, values in metrics.items():
+            change = values['change_pct']
+            print(
+                f'{path:40} {metric:15} {values["baseline"]:>12} {values["candidate"]:>12} '
+                f'{"n/a" if change is None else f"{change:+.1f}%":>9}'
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument('--max-regression', type=float, help='Fail above this percentage')
+    parser.add_argument('--output', help='Write the deltas as JSON to this file')
+    args = parser.parse_args()
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    candidate = json.loads(Path(args.candidate).read_text())
+    if baseline.get('meta', {}).get('machine') != candidate.get('meta', {}).get('machine'):
+        print('warning: the runs come from different machines', file=sys.stderr)
+
+    deltas = compare(baseline, candidate)
+    print_table(deltas)
+    if args.output:
+        emit(
+            {
+                'baseline': baseline.get('meta'),
+                'candidate': candidate.get('meta'),
+                'deltas': deltas,
+            },
+            args.output,
+        )
+    if args.max_regression is not None:
+        found = regressions(deltas, args.max_regression)
+        for line in found:
+            print(f'regression: {line}', file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""Load scenario against a running API: GET /Employees, GET /Employees/{id}, POST /Employees.
+
+Run it against a locally seeded database so results are comparable between runs:
+
+    PYTHONPATH=src python seed.py bulk --qty 100000
+    make run   # or: uvicorn main:app --app-dir src --workers 4
+    PYTHONPATH=src python -m benchmarks.load --duration 30 --output benchmarks/results/load.json
+
+Every virtual user loops until the deadline, picking an operation from ``--mix``.
+Request choices come from a seeded RNG; only the ids found on the server vary.
+Latencies of the warm-up period are discarded.
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Any
+
+import httpx
+
+from benchmarks.common import emit, run_metadata, summarize
+from common.config import settings
+
+
+LIST_LIMITS = (10, 50, 100)
+LIST_STATUSES = (None, None, 'ACTIVE', 'INACTIVE')
+LIST_NAMES = (None, None, None, 'ana', 'mar', 'luis')
+ID_POOL_PAGES = 10
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        mix[name.strip()] = float(weight)
+    unknown = set(mix) - {'list', 'get', 'create'}
+    if unknown:
+        raise ValueError(f'Unknown operations in --mix: {", ".join(sorted(unknown))}')
+    return mix
+
+
+def auth_headers() -> dict[str, str]:
+    if not settings.require_client_auth:
+        return {}
+    return {'X-Client-Key': settings.client_key, 'X-Client-Secret': settings.client_secret}
+
+
+class Scenario:
+    def __init__(self, client: httpx.AsyncClient, ids: list[str]) -> None:
+        self.client = client
+        self.ids = ids
+        # Codes are ZXX-000 with a per-run offset, away from the seeder's AAA-000 onwards
+        self.code_offset = random.Random(time.time_ns()).randrange(26 * 26 * 1000)
+        self.created = 0
+
+    async def list_page(self, rng: random.Random) -> httpx.Response:
+        params: dict[str, Any] = {'limit': rng.choice(LIST_LIMITS), 'page': rng.randint(1, 20)}
+        if status := rng.choice(LIST_STATUSES):
+            params['status'] = status
+        if name := rng.choice(LIST_NAMES):
+            params['name'] = name
+        return await self.client.get('/Employees/', params=params)
+
+    async def get_one(self, rng: random.Random) -> httpx.Response:
+        return await self.client.get(f'/Employees/{rng.choice(self.ids)}')
+
+    async def create(self, rng: random.Random) -> httpx.Response:
+        number = (self.code_offset + self.created) % (26 * 26 * 1000)
+        self.created += 1
+        prefix, suffix = divmod(number, 1000)
+        letters = string.ascii_uppercase[prefix // 26] + string.ascii_uppercase[prefix % 26]
+        unique = uuid.uuid4().hex
+        return await self.client.post(
+            '/Employees/',
+            json={
+                'employee_code': f'Z{letters}-{suffix:03d}',
+                'first_name': 'load',
+                'last_name': 'test',
+                'document_number': unique[:20],
+                'personal_email': f'{unique}@load.example.com',
+                'city': rng.choice(('bogotá', 'medellín', 'cali')),
+            },
+        )
+
+
+async def collect_ids(client: httpx.AsyncClient) -> list[str]:
+    ids: list[str] = []
+    for page in range(1, ID_POOL_PAGES + 1):
+        response = await client.get('/Employees/', params={'limit': 100, 'page': page})
+        response.raise_for_status()
+        items = response.json()['items']
+        ids += [item['id'] for item in items]
+        if len(items) < 100:
+            break
+    return ids
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, headers=auth_headers(), limits=limits, timeout=args.timeout
+    ) as client:
+        ids = await collect_ids(client)
+        if not ids and mix.get('get'):
+            raise SystemExit('No employees found: seed the database first (seed.py bulk)')
+        scenario = Scenario(client, ids)
+        operations = {
+            'list': scenario.list_page,
+            'get': scenario.get_one,
+            'create': scenario.create,
+        }
+        names = [name for name, weight in mix.items() if weight > 0]
+        weights = [mix[name] for name in names]
+
+        latencies: dict[str, list[float]] = defaultdict(list)
+        statuses: dict[str, Counter[int]] = defaultdict(Counter)
+        errors: Counter[str] = Counter()
+        started = time.perf_counter()
+        measure_from = started + args.warmup
+        deadline = measure_from + args.duration
+
+        async def user(number: int) -> None:
+            rng = random.Random(args.seed * 10_000 + number)
+            while (now := time.perf_counter()) < deadline:
+                name = rng.choices(names, weights)[0]
+                try:
+                    response = await operations[name](rng)
+                except httpx.HTTPError as exc:
+                    errors[type(exc).__name__] += 1
+                    continue
+                if now >= measure_from:
+                    latencies[name].append(time.perf_counter() - now)
+                    statuses[name][response.status_code] += 1
+
+        await asyncio.gather(*(user(number) for number in range(args.concurrency)))
+        elapsed = time.perf_counter() - measure_from
+
+    if not latencies:
+        raise SystemExit('No request finished within the measured window')
+    results = {name: summarize(values, elapsed) for name, values in sorted(latencies.items())}
+    results['all'] = summarize(
+        [value for values in latencies.values() for value in values], elapsed
+    )
+    return {
+        'results': results,
+        'statuses': {name: dict(counts) for name, counts in sorted(statuses.items())},
+        'errors': dict(errors),
+        'id_pool': len(ids),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--concurrency', type=int, default=32, help='Virtual users')
+    parser.add_argument('--duration', type=float, default=30, help='Measured seconds')
+    parser.add_argument('--warmup', type=float, default=5, help='Seconds discarded first')
+    parser.add_argument('--mix', default='list=0.5,get=0.4,create=0.1')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--output', help='Write the JSON results to this file')
+    args = parser.parse_args()
+
+    outcome = asyncio.run(run(args))
+    emit(
+        {
+            'benchmark': 'load',
+            'meta': run_metadata(),
+            'config': {
+                'base_url': args.base_url,
+                'concurrency': args.concurrency,
+                'duration_s': args.duration,
+                'warmup_s': args.warmup,
+                'mix': args.mix,
+                'seed': args.seed,
+            },
+            **outcome,
+        },
+        args.output,
+    )
+
+
+if __name__ == '__main__':
+    main()
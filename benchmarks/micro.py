@@ -0,0 +1,138 @@
+"""Micro-benchmarks for the per-request hot paths. No database is needed.
+
+- ``validation``: ``EmployeeCreate`` validation of a POST /Employees body.
+- ``flattening``: a page of flat result rows (SQLAlchemy ``Row`` objects, as the
+  repository selects them) turned into dicts, versions popped, response items built.
+- ``serialization``: the page rendered to JSON bytes, as the list endpoint sends it.
+- ``middleware_*``: one request through the ASGI app and its middleware, against a
+  stub repository (see ``benchmarks.middleware_overhead``).
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.micro --iterations 5000 --output benchmarks/results/micro.json
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.engine import Row
+from sqlalchemy.engine.result import result_tuple
+
+from benchmarks.common import emit, run_metadata, summarize
+from benchmarks.middleware_overhead import EMPLOYEE_ID, build_app, measure as measure_requests
+from models.employee_model import EmployeeCreate, EmployeePaginationResponse, EmployeeStatus
+from repositories.employee_repository import PUBLIC_FIELDS, VERSION_FIELDS
+from services.employee_service import _pop_versions, _trusted_items
+
+
+PAYLOAD = {
+    'employee_code': 'EMP-001',
+    'status': 'ACTIVE',
+    'first_name': 'Ana',
+    'last_name': 'Pérez',
+    'document_number': '1.234.567-8',
+    'tax_id': None,
+    'gender': 'female',
+    'personal_email': 'Ana.Perez@Example.com',
+    'phone': '+57 300 000 0001',
+    'city': 'Bogotá',
+    'country_id': str(uuid.uuid4()),
+}
+
+
+def build_rows(limit: int) -> list[Row[Any]]:
+    make_row = result_tuple([*PUBLIC_FIELDS, *VERSION_FIELDS])
+    stamp = datetime(2026, 1, 1)
+    values: dict[str, Any] = {
+        'version': 1,
+        'status': EmployeeStatus.ACTIVE,
+        'tax_id': None,
+        'gender': 'female',
+        'education_level': None,
+        'photo': None,
+        'nickname': None,
+        'city': 'bogotá',
+        'country_id': uuid.uuid4(),
+        'address': None,
+    }
+    rows = []
+    for i in range(limit):
+        values |= {
+            'id': uuid.uuid4(),
+            'employee_code': f'EMP-{i:03d}',
+            'first_name': f'name{i}',
+            'last_name': f'surname{i}',
+            'document_number': f'{10_000_000 + i}',
+            'personal_email': f'user{i}@example.com',
+            'phone': f'+57 300 000 {i:04d}',
+            VERSION_FIELDS[0]: stamp,
+            VERSION_FIELDS[1]: stamp,
+        }
+        rows.append(make_row(tuple(values[name] for name in (*PUBLIC_FIELDS, *VERSION_FIELDS))))
+    return rows
+
+
+def flatten(rows: list[Row[Any]]) -> EmployeePaginationResponse:
+    items = [row._asdict() for row in rows]
+    _pop_versions(items)
+    return EmployeePaginationResponse.model_construct(
+        items=_trusted_items(items), total=len(items), total_kind='exact', page=1, limit=len(items)
+    )
+
+
+def time_calls(call: Callable[[], Any], iterations: int) -> dict[str, float]:
+    for _ in range(min(iterations, 100)):
+        call()
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+    elapsed = time.perf_counter() - start
+    summary = summarize(latencies, elapsed)
+    # Percentiles are rounded to the microsecond: the mean keeps the resolution
+    summary['mean_us'] = round(elapsed / iterations * 1_000_000, 3)
+    return summary
+
+
+def run(iterations: int, limit: int) -> dict[str, dict[str, float]]:
+    rows = build_rows(limit)
+    page = flatten(rows)
+    app = build_app(pipeline=True)
+    return {
+        'validation': time_calls(lambda: EmployeeCreate.model_validate(PAYLOAD), iterations),
+        'flattening': time_calls(lambda: flatten(rows), iterations),
+        'serialization': time_calls(page.model_dump_json, iterations),
+        'middleware_root': asyncio.run(measure_requests(app, '/', iterations)),
+        'middleware_employee': asyncio.run(
+            measure_requests(app, f'/Employees/{EMPLOYEE_ID}', iterations)
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=5000)
+    parser.add_argument('--limit', type=int, default=100, help='Rows per page')
+    parser.add_argument('--output', help='Write the JSON results to this file')
+    args = parser.parse_args()
+
+    emit(
+        {
+            'benchmark': 'micro',
+            'meta': run_metadata(),
+            'iterations': args.iterations,
+            'limit': args.limit,
+            'results': run(args.iterations, args.limit),
+        },
+        args.output,
+    )
+
+
+if __name__ == '__main__':
+    main()
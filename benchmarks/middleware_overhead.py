@@ -0,0 +1,162 @@
+"""Per-request overhead: stacked BaseHTTPMiddleware layers vs the single ASGI pipeline.
+
+Both apps serve the same routes. The ``legacy`` app rebuilds the previous stack,
+one ``@app.middleware('http')`` layer each for auth, version header, request log
+and metrics, out of the same helpers. The ``pipeline`` app uses
+``RequestPipelineMiddleware``. /Employees/{id} runs against a stub repository
+(and no cache), so no database is needed and only the middleware cost differs.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.middleware_overhead --requests 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+
+from benchmarks.common import emit, summarize
+from common.query_metrics import track_queries
+from dependencies import get_employee_cache, get_employee_list_cache, get_employees_repo
+from middleware import RequestPipelineMiddleware
+from middleware.auth import is_authorized, missing_auth_response
+from middleware.metrics import record_request, route_template
+from middleware.request_log import SKIP_PATHS, log_request, server_timing
+from middleware.version import add_version_header
+from models.employee_model import EmployeeStatus
+from router.router import router as api_router
+
+
+CallNext = Callable[[Request], Awaitable[Response]]
+EMPLOYEE_ID = uuid.uuid4()
+ROW = {
+    'id': EMPLOYEE_ID,
+    'version': 1,
+    'employee_code': 'EMP-001',
+    'status': EmployeeStatus.ACTIVE,
+    'first_name': 'ana',
+    'last_name': 'pérez',
+    'document_number': '12345678',
+    'tax_id': None,
+    'gender': None,
+    'education_level': None,
+    'personal_email': 'ana@example.com',
+    'phone': None,
+    'photo': None,
+    'nickname': None,
+    'city': 'bogotá',
+    'country_id': None,
+    'address': None,
+    'employee_updated_at': datetime(2026, 1, 1),
+    'personal_info_updated_at': datetime(2026, 1, 1),
+}
+
+
+class StubRepository:
+    async def get_employee_by_id(self, employee_id: uuid.UUID) -> dict[str, Any]:
+        return dict(ROW)
+
+
+async def check_client_auth(request: Request, call_next: CallNext) -> Response:
+    if not is_authorized(request.url.path, request.headers):
+        return missing_auth_response()
+    return await call_next(request)
+
+
+async def version_header(request: Request, call_next: CallNext) -> Response:
+    response = await call_next(request)
+    add_version_header(MutableHeaders(raw=response.raw_headers))
+    return response
+
+
+async def log_requests(request: Request, call_next: CallNext) -> Response:
+    start = time.perf_counter()
+    with track_queries() as stats:
+        response = await call_next(request)
+    duration_ms = (time.perf_counter() - start) * 1000
+    if request.url.path not in SKIP_PATHS:
+        response.headers['Server-Timing'] = server_timing(stats, duration_ms)
+        log_request(request.method, request.url.path, response.status_code, duration_ms, stats)
+    return response
+
+
+async def record_metrics(request: Request, call_next: CallNext) -> Response:
+    start = time.perf_counter()
+    with track_queries() as stats:
+        response = await call_next(request)
+    duration_s = time.perf_counter() - start
+    route = route_template(request.scope)
+    record_request(request.method, route, response.status_code, duration_s, stats)
+    return response
+
+
+def build_app(pipeline: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(api_router)
+
+    @app.get('/')
+    def read_root() -> dict[str, str]:
+        return {'status': 'API is running'}
+
+    app.dependency_overrides[get_employees_repo] = StubRepository
+    app.dependency_overrides[get_employee_cache] = lambda: None
+    app.dependency_overrides[get_employee_list_cache] = lambda: None
+    if pipeline:
+        app.add_middleware(RequestPipelineMiddleware)
+    else:
+        for middleware in (check_client_auth, version_header, log_requests, record_metrics):
+            app.middleware('http')(middleware)
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> dict[str, float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        for _ in range(min(requests, 200)):
+            await client.get(path)
+        latencies: list[float] = []
+        start = time.perf_counter()
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+        return summarize(latencies, time.perf_counter() - start)
+
+
+async def run(requests: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for path in ('/', f'/Employees/{EMPLOYEE_ID}'):
+        legacy = await measure(build_app(pipeline=False), path, requests)
+        pipeline = await measure(build_app(pipeline=True), path, requests)
+        results[path] = {
+            'legacy': legacy,
+            'pipeline': pipeline,
+            'saved_p50_us': round((legacy['p50_ms'] - pipeline['p50_ms']) * 1000, 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--output', help='Write the JSON results to this file')
+    args = parser.parse_args()
+
+    # Keep the request log out of the measurement
+    logging.getLogger('app.request').disabled = True
+    emit({'requests': args.requests, **asyncio.run(run(args.requests))}, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Per-item cost of rendering a page of employees: ORM merge path vs flat fast path.
+
+No database is needed: the same 100 rows are fed to both paths.
+
+- ``orm``: what the list endpoint used to do. Two ORM entities per row, two
+  ``model_dump()`` calls merged into one dict, ``EmployeePaginationResponse``
+  validation, then FastAPI's response_model re-validation, JSON-mode dump and
+  ``json.dumps``.
+- ``flat``: flat column rows, ``model_construct`` (no validators) and a single
+  pydantic-core ``model_dump_json``, as ``EmployeeService`` renders pages.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.serialization --limit 100 --iterations 2000
+"""
+
+import argparse
+import json
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from benchmarks.common import emit, summarize
+from models.employee_model import (
+    Employee,
+    EmployeePaginationResponse,
+    EmployeePersonalInfo,
+    EmployeePublicResponse,
+    EmployeeStatus,
+)
+from repositories.employee_repository import PUBLIC_FIELDS
+
+
+def build_rows(limit: int) -> list[tuple[Employee, EmployeePersonalInfo]]:
+    rows = []
+    for i in range(limit):
+        employee = Employee(employee_code=f'EMP-{i:03d}', status=EmployeeStatus.ACTIVE)
+        info = EmployeePersonalInfo(
+            employee_id=employee.id,
+            first_name=f'name{i}',
+            last_name=f'surname{i}',
+            document_number=f'{10_000_000 + i}',
+            personal_email=f'user{i}@example.com',
+            phone=f'+57 300 000 {i:04d}',
+            city='bogotá',
+            country_id=uuid.uuid4(),
+        )
+        rows.append((employee, info))
+    return rows
+
+
+def orm_path(pairs: list[tuple[Employee, EmployeePersonalInfo]], limit: int) -> bytes:
+    adapter = TypeAdapter(EmployeePaginationResponse)
+    items = [{**info.model_dump(), **emp.model_dump()} for emp, info in pairs]
+    response = EmployeePaginationResponse(items=items, total=limit, page=1, limit=limit)
+    # FastAPI: validate against response_model, dump in JSON mode, then json.dumps
+    content = adapter.dump_python(adapter.validate_python(response), mode='json')
+    return json.dumps(content, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def flat_path(rows: list[dict[str, Any]], limit: int) -> bytes:
+    response = EmployeePaginationResponse.model_construct(
+        items=[EmployeePublicResponse.model_construct(**row) for row in rows],
+        total=limit,
+        total_kind='exact',
+        page=1,
+        limit=limit,
+    )
+    return response.model_dump_json().encode()
+
+
+def measure(render: Callable[[], bytes], iterations: int, limit: int) -> dict[str, float]:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        started = time.perf_counter()
+        render()
+        latencies.append(time.perf_counter() - started)
+    elapsed = time.perf_counter() - start
+    summary = summarize(latencies, elapsed)
+    summary['per_item_us'] = round(elapsed / iterations / limit * 1_000_000, 3)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--output', help='Write the JSON results to this file')
+    args = parser.parse_args()
+
+    pairs = build_rows(args.limit)
+    flat_rows = [
+        {field: getattr(emp if hasattr(emp, field) else info, field) for field in PUBLIC_FIELDS}
+        for emp, info in pairs
+    ]
+    assert json.loads(orm_path(pairs, args.limit)) == json.loads(flat_path(flat_rows, args.limit))
+
+    orm = measure(lambda: orm_path(pairs, args.limit), args.iterations, args.limit)
+    flat = measure(lambda: flat_path(flat_rows, args.limit), args.iterations, args.limit)
+    emit(
+        {
+            'limit': args.limit,
+            'iterations': args.iterations,
+            'orm': orm,
+            'flat': flat,
+            'speedup': round(orm['per_item_us'] / flat['per_item_us'], 2),
+        },
+        args.output,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c2e7d9b10'
+down_revision: str | Sequence[str] | None = '3bc9c59952e9'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_employee_created_at_id', 'employee', ['created_at', 'id'], unique=False)
+    op.create_index('ix_employee_updated_at_id', 'employee', ['updated_at', 'id'], unique=False)
+    op.create_index(
+        'ix_employee_employee_code_id', 'employee', ['employee_code', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_employee_employee_code_id', table_name='employee')
+    op.drop_index('ix_employee_updated_at_id', table_name='employee')
+    op.drop_index('ix_employee_created_at_id', table_name='employee')
@@ -0,0 +1,115 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e1c9b382'
+down_revision: str | Sequence[str] | None = 'f2c8b7e4a610'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = 'employee_financial_info'
+OLD_TABLE = f'{TABLE}_old'
+
+# Must stay identical to FINANCIAL_INFO_PERIOD in models/employee_model.py
+FINANCIAL_INFO_PERIOD = "daterange(effective_from, effective_to, '[]'::text)"
+
+# Must stay identical to PAYROLL_SUMMARY_QUERY in models/payroll_model.py
+PAYROLL_SUMMARY_QUERY = """
+SELECT e.status,
+       p.city,
+       f.salary_currency_id,
+       count(*) AS employees,
+       sum(f.salary_amount) AS salary_total,
+       sum(f.company_cost_amount) AS company_cost_total,
+       (now() AT TIME ZONE 'utc') AS refreshed_at
+FROM employee e
+JOIN employees_personal_info p ON p.employee_id = e.id
+JOIN employee_financial_info f ON f.employee_id = e.id AND f.effective_to IS NULL
+WHERE e.deleted_at IS NULL
+GROUP BY e.status, p.city, f.salary_currency_id
+"""
+
+# One partition per year from the oldest record to next year (utils/financial_partitions.py
+# keeps creating them); anything else goes to the default partition
+CREATE_YEARLY_PARTITIONS = f"""
+DO $$
+DECLARE
+    this_year int := extract(year FROM now())::int;
+    first_year int := coalesce(
+        (SELECT extract(year FROM min(effective_from))::int FROM {OLD_TABLE}), this_year
+    );
+BEGIN
+    FOR y IN first_year..this_year + 1 LOOP
+        EXECUTE format(
+            'CREATE TABLE {TABLE}_p%s PARTITION OF {TABLE} FOR VALUES FROM (%L) TO (%L)',
+            y, make_date(y, 1, 1), make_date(y + 1, 1, 1)
+        );
+    END LOOP;
+END $$
+"""
+
+
+def _rename_old_table() -> None:
+    # The view depends on the table; it is rebuilt once the new table is in place
+    op.execute('DROP MATERIALIZED VIEW payroll_summary')
+    op.execute(f'ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}')
+
+
+def _finish_new_table(primary_key: list[str]) -> None:
+    op.execute(f'INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}')
+    # Takes the old indexes, constraints and trigger with it, freeing their names
+    op.drop_table(OLD_TABLE)
+
+    op.create_primary_key(f'{TABLE}_pkey', TABLE, primary_key)
+    op.create_foreign_key(f'{TABLE}_employee_id_fkey', TABLE, 'employee', ['employee_id'], ['id'])
+    op.create_index(f'ix_{TABLE}_employee_id', TABLE, ['employee_id'], unique=False)
+    op.create_index(
+        f'ix_{TABLE}_current',
+        TABLE,
+        ['employee_id'],
+        unique=False,
+        postgresql_where=sa.text('effective_to IS NULL'),
+    )
+    op.create_index(
+        f'ix_{TABLE}_period',
+        TABLE,
+        ['employee_id', sa.text(FINANCIAL_INFO_PERIOD)],
+        unique=False,
+        postgresql_using='gist',
+    )
+    op.execute(
+        f'CREATE TRIGGER set_updated_at_{TABLE} BEFORE UPDATE ON {TABLE} '
+        f'FOR EACH ROW EXECUTE PROCEDURE update_updated_at_column()'
+    )
+
+    op.execute(f'CREATE MATERIALIZED VIEW payroll_summary AS {PAYROLL_SUMMARY_QUERY}')
+    op.execute(
+        'CREATE UNIQUE INDEX ux_payroll_summary_key '
+        'ON payroll_summary (status, city, salary_currency_id)'
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rename_old_table()
+    op.execute(
+        f'CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE (effective_from)'
+    )
+    op.execute(CREATE_YEARLY_PARTITIONS)
+    op.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+    # The primary key of a partitioned table must include the partition key
+    _finish_new_table(['id', 'effective_from'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_old_table()
+    op.execute(
+        f'CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    # Dropping the partitioned table drops every partition with it
+    _finish_new_table(['id'])
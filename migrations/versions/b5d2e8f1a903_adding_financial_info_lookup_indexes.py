@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d2e8f1a903'
+down_revision: str | Sequence[str] | None = 'e3a91c4d7f20'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to FINANCIAL_INFO_PERIOD in models/employee_model.py
+FINANCIAL_INFO_PERIOD = "daterange(effective_from, effective_to, '[]'::text)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    op.create_index(
+        'ix_employee_financial_info_current',
+        'employee_financial_info',
+        ['employee_id'],
+        unique=False,
+        postgresql_where=sa.text('effective_to IS NULL'),
+    )
+    op.create_index(
+        'ix_employee_financial_info_period',
+        'employee_financial_info',
+        ['employee_id', sa.text(FINANCIAL_INFO_PERIOD)],
+        unique=False,
+        postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_employee_financial_info_period', table_name='employee_financial_info')
+    op.drop_index('ix_employee_financial_info_current', table_name='employee_financial_info')
@@ -0,0 +1,44 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f9a2d7e845'
+down_revision: str | Sequence[str] | None = 'a7d4e1c9b382'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to LIVE_ROWS in models/employee_model.py
+LIVE_ROWS = 'deleted_at IS NULL'
+
+
+def _rebuild_freshness_index(include: list[str]) -> None:
+    op.drop_index('ix_employee_id_updated_at', table_name='employee')
+    op.create_index(
+        'ix_employee_id_updated_at',
+        'employee',
+        ['id'],
+        unique=False,
+        postgresql_include=include,
+        postgresql_where=sa.text(LIVE_ROWS),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in ('employee', 'employee_archive'):
+        op.add_column(
+            table_name,
+            sa.Column('version', sa.Integer(), nullable=False, server_default=sa.text('1')),
+        )
+    # The ETag probe reads the version too; keep it index-only
+    _rebuild_freshness_index(['updated_at', 'version'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_freshness_index(['updated_at'])
+    for table_name in ('employee_archive', 'employee'):
+        op.drop_column(table_name, 'version')
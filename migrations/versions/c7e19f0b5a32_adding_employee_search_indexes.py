@@ -0,0 +1,60 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e19f0b5a32'
+down_revision: str | Sequence[str] | None = 'a41c2e7d9b10'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to PERSONAL_INFO_SEARCH_DOCUMENT in models/employee_model.py
+SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, first_name || ' ' || last_name || ' ' || personal_email)"
+)
+
+TRIGRAM_INDEXES = [
+    ('ix_employee_employee_code_trgm', 'employee', 'employee_code'),
+    ('ix_employees_personal_info_first_name_trgm', 'employees_personal_info', 'first_name'),
+    ('ix_employees_personal_info_last_name_trgm', 'employees_personal_info', 'last_name'),
+    (
+        'ix_employees_personal_info_personal_email_trgm',
+        'employees_personal_info',
+        'personal_email',
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column_name: 'gin_trgm_ops'},
+        )
+
+    op.create_index(
+        'ix_employees_personal_info_search_document',
+        'employees_personal_info',
+        [sa.text(SEARCH_DOCUMENT)],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_employees_personal_info_search_document', table_name='employees_personal_info'
+    )
+    for index_name, table_name, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
+    # pg_trgm is left installed: other objects may depend on it
@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f3a6c2e514'
+down_revision: str | Sequence[str] | None = 'b5d2e8f1a903'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to PAYROLL_SUMMARY_QUERY in models/payroll_model.py
+PAYROLL_SUMMARY_QUERY = """
+SELECT e.status,
+       p.city,
+       f.salary_currency_id,
+       count(*) AS employees,
+       sum(f.salary_amount) AS salary_total,
+       sum(f.company_cost_amount) AS company_cost_total,
+       (now() AT TIME ZONE 'utc') AS refreshed_at
+FROM employee e
+JOIN employees_personal_info p ON p.employee_id = e.id
+JOIN employee_financial_info f ON f.employee_id = e.id AND f.effective_to IS NULL
+GROUP BY e.status, p.city, f.salary_currency_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f'CREATE MATERIALIZED VIEW payroll_summary AS {PAYROLL_SUMMARY_QUERY}')
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        'CREATE UNIQUE INDEX ux_payroll_summary_key '
+        'ON payroll_summary (status, city, salary_currency_id)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP MATERIALIZED VIEW payroll_summary')
@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a91c4d7f20'
+down_revision: str | Sequence[str] | None = 'c7e19f0b5a32'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_employee_id_updated_at',
+        'employee',
+        ['id'],
+        unique=False,
+        postgresql_include=['updated_at'],
+    )
+    op.create_index(
+        'ix_employees_personal_info_employee_id_updated_at',
+        'employees_personal_info',
+        ['employee_id'],
+        unique=False,
+        postgresql_include=['updated_at'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_employees_personal_info_employee_id_updated_at', table_name='employees_personal_info'
+    )
+    op.drop_index('ix_employee_id_updated_at', table_name='employee')
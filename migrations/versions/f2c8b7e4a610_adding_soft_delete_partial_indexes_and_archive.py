@@ -0,0 +1,121 @@
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8b7e4a610'
+down_revision: str | Sequence[str] | None = 'd8f3a6c2e514'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to LIVE_ROWS in models/employee_model.py
+LIVE_ROWS = 'deleted_at IS NULL'
+
+# Hot indexes rebuilt over live rows only: (name, table, columns, unique, extra kwargs)
+PARTIAL_INDEXES: list[tuple[str, str, list[str], bool, dict[str, Any]]] = [
+    ('ix_employee_employee_code', 'employee', ['employee_code'], True, {}),
+    ('ix_employee_created_at_id', 'employee', ['created_at', 'id'], False, {}),
+    ('ix_employee_updated_at_id', 'employee', ['updated_at', 'id'], False, {}),
+    ('ix_employee_employee_code_id', 'employee', ['employee_code', 'id'], False, {}),
+    (
+        'ix_employee_id_updated_at',
+        'employee',
+        ['id'],
+        False,
+        {'postgresql_include': ['updated_at']},
+    ),
+    *(
+        (f'ix_employees_personal_info_{column}', 'employees_personal_info', [column], True, {})
+        for column in ('document_number', 'tax_id', 'personal_email', 'phone')
+    ),
+    (
+        'ix_employees_personal_info_employee_id_updated_at',
+        'employees_personal_info',
+        ['employee_id'],
+        False,
+        {'postgresql_include': ['updated_at']},
+    ),
+]
+
+ARCHIVE_TABLES = ['employee', 'employees_personal_info', 'employee_financial_info']
+
+# Must stay identical to PAYROLL_SUMMARY_QUERY in models/payroll_model.py
+PAYROLL_SUMMARY_QUERY = """
+SELECT e.status,
+       p.city,
+       f.salary_currency_id,
+       count(*) AS employees,
+       sum(f.salary_amount) AS salary_total,
+       sum(f.company_cost_amount) AS company_cost_total,
+       (now() AT TIME ZONE 'utc') AS refreshed_at
+FROM employee e
+JOIN employees_personal_info p ON p.employee_id = e.id
+JOIN employee_financial_info f ON f.employee_id = e.id AND f.effective_to IS NULL
+WHERE e.deleted_at IS NULL
+GROUP BY e.status, p.city, f.salary_currency_id
+"""
+
+PREVIOUS_PAYROLL_SUMMARY_QUERY = PAYROLL_SUMMARY_QUERY.replace('WHERE e.deleted_at IS NULL\n', '')
+
+
+def _create_payroll_summary(query: str) -> None:
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS payroll_summary')
+    op.execute(f'CREATE MATERIALIZED VIEW payroll_summary AS {query}')
+    op.execute(
+        'CREATE UNIQUE INDEX ux_payroll_summary_key '
+        'ON payroll_summary (status, city, salary_currency_id)'
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # f6867092327c created the type without TERMINATED; soft deletes set it.
+    # ADD VALUE cannot be used in the transaction that adds it.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE employeestatus ADD VALUE IF NOT EXISTS 'TERMINATED'")
+
+    for index_name, table_name, columns, unique, kwargs in PARTIAL_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            unique=unique,
+            postgresql_where=sa.text(LIVE_ROWS),
+            **kwargs,
+        )
+    op.create_index(
+        'ix_employee_deleted_at',
+        'employee',
+        ['deleted_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+
+    # Same columns as the live table, no foreign keys or secondary indexes
+    for table_name in ARCHIVE_TABLES:
+        op.execute(f'CREATE TABLE {table_name}_archive (LIKE {table_name} INCLUDING DEFAULTS)')
+        op.execute(
+            f'ALTER TABLE {table_name}_archive ADD PRIMARY KEY (id), '
+            f"ADD COLUMN archived_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')"
+        )
+
+    _create_payroll_summary(PAYROLL_SUMMARY_QUERY)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _create_payroll_summary(PREVIOUS_PAYROLL_SUMMARY_QUERY)
+
+    for table_name in reversed(ARCHIVE_TABLES):
+        op.drop_table(f'{table_name}_archive')
+
+    op.drop_index('ix_employee_deleted_at', table_name='employee')
+    # Recreating the full unique indexes fails if a deleted row shares a value with a live one
+    for index_name, table_name, columns, unique, kwargs in reversed(PARTIAL_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
+        op.create_index(index_name, table_name, columns, unique=unique, **kwargs)
+    # The TERMINATED enum value stays: Postgres cannot drop a value from an enum type
@@ -3,7 +3,11 @@ from typing import TYPE_CHECKING, Any, TypeVar
 
 import typer
 
+from src.utils.employees_archive import archive_terminated_employees
+from src.utils.employees_bulk_seed import bulk_seed_employees, shape_from_options
+from src.utils.employees_csv_import import import_employees_csv
 from src.utils.employees_seed_factory import seed_employees
+from src.utils.financial_partitions import manage_partitions
 
 
 F = TypeVar('F', bound=Callable[..., Any])
@@ -29,6 +33,24 @@ def employees(qty: int = 10) -> None:
     seed_employees(qty)
 
 
+@app.command()
+def bulk(
+    qty: int = 100_000,
+    seed: int = 42,
+    workers: int | None = None,
+    batch_size: int = 10_000,
+    status_mix: str = 'ACTIVE=0.85,INACTIVE=0.10,TERMINATED=0.05',
+    history: str = '1-4',
+    cities: str | None = None,
+) -> None:
+    """Genera un dataset grande y reproducible (COPY en paralelo) para pruebas de carga.
+
+    Ejemplo: seed.py bulk --qty 1000000 --history 2-6 --cities "bogotá=0.6,cali=0.4"
+    """
+    shape = shape_from_options(seed, status_mix, history, cities)
+    bulk_seed_employees(qty, shape, batch_size=batch_size, workers=workers)
+
+
 @app.command()
 def all(qty: int = 10) -> None:
     """Ejecuta TODOS los seeders disponibles."""
@@ -37,6 +59,46 @@ def all(qty: int = 10) -> None:
     typer.echo('✨ Carga completa finalizada.')
 
 
+@app.command()
+def import_csv(path: str, rejects: str | None = None) -> None:
+    """Importa empleados desde un CSV (altas y actualizaciones por employee_code)."""
+    typer.echo(f'📥 Importando {path}...')
+    result = import_employees_csv(path, rejects)
+    typer.echo(
+        f'✅ {result.received} filas: {result.inserted} nuevas, '
+        f'{result.updated} actualizadas, {result.rejected} rechazadas.'
+    )
+
+
+@app.command()
+def archive(
+    older_than_days: int | None = None,
+    batch_size: int | None = None,
+    pause: float = 0.0,
+) -> None:
+    """Archiva por lotes los empleados dados de baja hace más de `older_than_days` días.
+
+    Por defecto usa ARCHIVE_AFTER_DAYS y ARCHIVE_BATCH_SIZE; `pause` espera entre lotes.
+    """
+    typer.echo('🗄️  Archivando empleados dados de baja...')
+    moved = archive_terminated_employees(older_than_days, batch_size, pause)
+    typer.echo(f'✅ {moved} empleados archivados.')
+
+
+@app.command()
+def partitions(ahead: int = 1, detach_before: int | None = None, archive: bool = False) -> None:
+    """Crea las particiones anuales de employee_financial_info de este año y `ahead` más.
+
+    Con `detach_before` separa las particiones anteriores a ese año; con `archive`
+    además copia sus filas a employee_financial_info_archive y las elimina.
+    """
+    created, detached = manage_partitions(ahead, detach_before, archive)
+    typer.echo(f'✅ Particiones creadas: {", ".join(created) or "ninguna"}')
+    if detach_before is not None:
+        action = 'archivadas' if archive else 'separadas'
+        typer.echo(f'📦 Particiones {action}: {", ".join(detached) or "ninguna"}')
+
+
 if __name__ == '__main__':
     if not TYPE_CHECKING:
         # Use type cast or internal check to call the real app
@@ -1,6 +1,13 @@
 from common.config import settings
-from common.database import create_db_and_tables, get_session
-from common.logging_config import configure_logging
+from common.database import create_db_and_tables, get_async_session, get_session
+from common.logging_config import configure_logging, shutdown_logging
 
 
-__all__ = ['settings', 'create_db_and_tables', 'get_session', 'configure_logging']
+__all__ = [
+    'settings',
+    'create_db_and_tables',
+    'get_async_session',
+    'get_session',
+    'configure_logging',
+    'shutdown_logging',
+]
@@ -0,0 +1,250 @@
+import importlib
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Protocol
+
+from common.config import settings
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Entries dropped to stay within the size bounds (expired entries are not evictions)
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {**asdict(self), 'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0}
+
+
+class CacheBackend(Protocol):
+    """Byte-value cache. Implementations count their own hits/misses/evictions."""
+
+    name: str
+    stats: CacheStats
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes) -> None: ...
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """Store `value` only if `key` holds nothing; False when it already did.
+
+        The entry is a claim: it is not evicted by the size bounds before it expires.
+        """
+        ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def clear(self) -> None: ...
+
+    async def generation(self, name: str) -> int: ...
+
+    async def bump_generation(self, name: str) -> None: ...
+
+    def snapshot(self) -> dict[str, Any]: ...
+
+
+class MemoryCache:
+    """Bounded LRU cache with a per-entry TTL, local to the worker process.
+
+    Bounded by entry count and, optionally, by the total size of the stored values.
+    Each worker holds its own copy, so invalidations only reach the worker that
+    made the write; other workers see the change once the TTL expires. Entries
+    stored with add() are claims, not cached values: they are kept outside the LRU
+    and only go away when they expire, are replaced by set() or are deleted.
+    """
+
+    name = 'memory'
+
+    def __init__(self, max_entries: int, ttl_seconds: float, max_bytes: int | None = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._generations: dict[str, int] = {}
+        # add() claims: never evicted, so the bounds cannot drop one that is still in use
+        self._held: dict[str, tuple[float, bytes]] = {}
+
+    def _drop(self, key: str) -> bytes | None:
+        held = self._held.pop(key, None)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return held[1] if held else None
+        self._bytes -= len(entry[1])
+        return entry[1]
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._held.get(key) or self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._drop(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def _store(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        # An oversized value is not stored, and must not leave the previous one behind
+        self._drop(key)
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._bytes += len(value)
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            self._drop(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    async def set(self, key: str, value: bytes) -> None:
+        self._store(key, value, self.ttl_seconds)
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        # Single-threaded event loop: the check and the store cannot interleave
+        now = time.monotonic()
+        for expired in [k for k, (expires_at, _) in self._held.items() if expires_at <= now]:
+            del self._held[expired]
+            self.stats.expirations += 1
+        entry = self._held.get(key) or self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return False
+        self._drop(key)
+        self._held[key] = (now + ttl_seconds, value)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            if self._drop(key) is not None:
+                self.stats.invalidations += 1
+
+    async def clear(self) -> None:
+        self.stats.invalidations += len(self._entries) + len(self._held)
+        self._entries.clear()
+        self._held.clear()
+        self._bytes = 0
+
+    async def generation(self, name: str) -> int:
+        return self._generations.get(name, 0)
+
+    async def bump_generation(self, name: str) -> None:
+        # Entries keyed on the old generation are never read again and age out of the LRU
+        self._generations[name] = self._generations.get(name, 0) + 1
+        self.stats.invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'backend': self.name,
+            'entries': len(self._entries),
+            'held': len(self._held),
+            'max_entries': self.max_entries,
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            **self.stats.snapshot(),
+        }
+
+
+# Keys per DEL command when invalidating in bulk
+REDIS_DELETE_CHUNK_SIZE = 1000
+
+
+class RedisCache:
+    """Cache shared by every worker, stored in Redis with a TTL.
+
+    Needs the optional `redis` package. Counters are per worker; evictions are
+    Redis' own business (maxmemory policy) and are not visible here.
+    """
+
+    name = 'redis'
+
+    def __init__(self, url: str, ttl_seconds: float, prefix: str) -> None:
+        try:
+            redis_asyncio = importlib.import_module('redis.asyncio')
+        except ImportError as err:
+            raise RuntimeError('CACHE_BACKEND=redis needs the redis package installed') from err
+        self.client: Any = redis_asyncio.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> bytes | None:
+        value: bytes | None = await self.client.get(self.prefix + key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self.client.set(self.prefix + key, value, px=int(self.ttl_seconds * 1000))
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        # SET NX: atomic across every worker sharing the Redis server
+        return bool(
+            await self.client.set(self.prefix + key, value, px=int(ttl_seconds * 1000), nx=True)
+        )
+
+    async def delete(self, *keys: str) -> None:
+        # One DEL per chunk of keys rather than one round trip per key
+        for start in range(0, len(keys), REDIS_DELETE_CHUNK_SIZE):
+            chunk = keys[start : start + REDIS_DELETE_CHUNK_SIZE]
+            self.stats.invalidations += await self.client.delete(
+                *(self.prefix + key for key in chunk)
+            )
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=f'{self.prefix}*'):
+            self.stats.invalidations += await self.client.delete(key)
+
+    async def generation(self, name: str) -> int:
+        return int(await self.client.get(f'{self.prefix}generation:{name}') or 0)
+
+    async def bump_generation(self, name: str) -> None:
+        await self.client.incr(f'{self.prefix}generation:{name}')
+        self.stats.invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {'backend': self.name, 'ttl_seconds': self.ttl_seconds, **self.stats.snapshot()}
+
+
+def build_cache(
+    prefix: str,
+    max_entries: int,
+    ttl_seconds: float,
+    max_bytes: int | None = None,
+    backend: str = settings.cache_backend,
+) -> CacheBackend | None:
+    """Cache of the given backend (CACHE_BACKEND by default): memory, redis or none."""
+    if backend == 'none':
+        return None
+    if backend == 'redis':
+        return RedisCache(settings.cache_redis_url, ttl_seconds, prefix=prefix)
+    if backend == 'memory':
+        return MemoryCache(max_entries, ttl_seconds, max_bytes=max_bytes)
+    raise ValueError(f'Unknown cache backend {backend!r}')
+
+
+# One cache of each kind per worker process, shared by every request
+employee_cache = build_cache(
+    'employees:item:', settings.cache_max_entries, settings.cache_ttl_seconds
+)
+# Rendered list pages, keyed on the normalized query and the 'employees' write generation
+employee_list_cache = build_cache(
+    'employees:list:',
+    settings.cache_list_max_entries,
+    settings.cache_list_ttl_seconds,
+    max_bytes=settings.cache_list_max_bytes,
+)
@@ -0,0 +1,83 @@
+import hashlib
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Freshness:
+    """Validators of one representation: a strong ETag and its Last-Modified (naive UTC)."""
+
+    etag: str
+    last_modified: datetime | None = None
+    # False when the date cannot see every change (e.g. a row leaving a list page):
+    # If-Modified-Since is then ignored and only the ETag can produce a 304
+    honors_dates: bool = True
+
+    def headers(self) -> dict[str, str]:
+        headers = {'ETag': self.etag}
+        if self.last_modified is not None:
+            headers['Last-Modified'] = format_datetime(
+                self.last_modified.replace(tzinfo=UTC), usegmt=True
+            )
+        return headers
+
+
+FreshnessCheck = Callable[[Freshness], bool]
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag from the values that identify a representation version."""
+    return f'"{hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()}"'
+
+
+def version_etag(version: int) -> str:
+    """Strong ETag of a row version number; if_match_versions reads it back."""
+    return f'"{version}"'
+
+
+def if_match_versions(if_match: str) -> set[int] | None:
+    """Row versions an If-Match header accepts; None for '*' (any version).
+
+    Weak tags never match (RFC 9110, 13.1.1) and tags that are not versions are
+    ignored, so a stale or foreign ETag yields an empty set.
+    """
+    versions: set[int] = set()
+    for tag in if_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return None
+        if tag.startswith('"') and tag.endswith('"') and tag[1:-1].isdigit():
+            versions.add(int(tag[1:-1]))
+    return versions
+
+
+def freshness_check(headers: Mapping[str, str]) -> FreshnessCheck | None:
+    """Build the test for the request's conditional headers, or None if it sent none.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110, 13.2.2).
+    """
+    if_none_match = headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return lambda freshness: '*' in tags or freshness.etag in tags
+
+    if_modified_since = headers.get('if-modified-since')
+    if not if_modified_since:
+        return None
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return None
+    if since.tzinfo is not None:
+        since = since.astimezone(UTC).replace(tzinfo=None)
+
+    def not_modified_since(freshness: Freshness) -> bool:
+        if not freshness.honors_dates or freshness.last_modified is None:
+            return False
+        # HTTP dates have one-second resolution
+        return freshness.last_modified.replace(microsecond=0) <= since
+
+    return not_modified_since
@@ -13,8 +13,64 @@ class Settings:
     db_host: str = os.getenv('DB_HOST', 'localhost')
     db_port: str = os.getenv('DB_PORT', '5432')
     db_name: str = os.getenv('DB_NAME', 'SampleApi')
+    # Connection pool (per worker process)
+    db_pool_size: int = int(os.getenv('DB_POOL_SIZE', '5'))
+    db_max_overflow: int = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+    db_pool_timeout: float = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+    db_pool_recycle: int = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+    db_pool_pre_ping: bool = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    db_echo: bool = os.getenv('DB_ECHO', 'false').lower() == 'true'
+    employee_bulk_max_items: int = int(os.getenv('EMPLOYEE_BULK_MAX_ITEMS', '1000'))
+    # Bulk status transitions update (and lock) at most this many employees per transaction
+    employee_status_batch_size: int = int(os.getenv('EMPLOYEE_STATUS_BATCH_SIZE', '500'))
+    # Read-through cache for single-employee reads: memory (per worker), redis or none
+    cache_backend: str = os.getenv('CACHE_BACKEND', 'memory').lower()
+    cache_max_entries: int = int(os.getenv('CACHE_MAX_ENTRIES', '10000'))
+    cache_ttl_seconds: float = float(os.getenv('CACHE_TTL_SECONDS', '60'))
+    # List pages: bounded by entries and by the total size of the cached bodies (memory backend)
+    cache_list_max_entries: int = int(os.getenv('CACHE_LIST_MAX_ENTRIES', '2000'))
+    cache_list_max_bytes: int = int(os.getenv('CACHE_LIST_MAX_BYTES', str(64 * 1024 * 1024)))
+    cache_list_ttl_seconds: float = float(os.getenv('CACHE_LIST_TTL_SECONDS', '30'))
+    cache_redis_url: str = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    # Idempotency-Key replay store: memory (per worker; use redis with several workers),
+    # redis or none. Responses are kept for the TTL. An in-flight key is held at most for
+    # the lock time (then a retry may run it again); a duplicate waits for it at most for
+    # the wait time, then gets a 409.
+    idempotency_backend: str = os.getenv('IDEMPOTENCY_BACKEND', 'memory').lower()
+    idempotency_ttl_seconds: float = float(os.getenv('IDEMPOTENCY_TTL_SECONDS', '86400'))
+    idempotency_lock_seconds: float = float(os.getenv('IDEMPOTENCY_LOCK_SECONDS', '60'))
+    idempotency_wait_seconds: float = float(os.getenv('IDEMPOTENCY_WAIT_SECONDS', '30'))
+    idempotency_max_entries: int = int(os.getenv('IDEMPOTENCY_MAX_ENTRIES', '10000'))
+    idempotency_max_bytes: int = int(os.getenv('IDEMPOTENCY_MAX_BYTES', str(64 * 1024 * 1024)))
+    # Payroll summary view: refreshed at least this often (0 disables the background
+    # refresh) and at most this often, even under a burst of writes
+    payroll_summary_refresh_seconds: float = float(
+        os.getenv('PAYROLL_SUMMARY_REFRESH_SECONDS', '300')
+    )
+    payroll_summary_min_refresh_seconds: float = float(
+        os.getenv('PAYROLL_SUMMARY_MIN_REFRESH_SECONDS', '15')
+    )
+    # Archival job: soft-deleted employees older than this many days move to the archive
+    # tables, this many employees per transaction
+    archive_after_days: int = int(os.getenv('ARCHIVE_AFTER_DAYS', '365'))
+    archive_batch_size: int = int(os.getenv('ARCHIVE_BATCH_SIZE', '1000'))
+    # Every worker checks this often (0 disables it) that the yearly employee_financial_info
+    # partitions exist up to this many years ahead
+    financial_partitions_check_seconds: float = float(
+        os.getenv('FINANCIAL_PARTITIONS_CHECK_SECONDS', '86400')
+    )
+    financial_partitions_ahead: int = int(os.getenv('FINANCIAL_PARTITIONS_AHEAD', '1'))
+    # Requests running more statements than this are logged as warnings (0 disables it)
+    db_query_budget: int = int(os.getenv('DB_QUERY_BUDGET', '0'))
     log_level: str = os.getenv('LOG_LEVEL', 'INFO')
     log_file: str = os.getenv('LOG_FILE', 'logs/app.log')
+    # text or json (one object per line, with the request id)
+    log_format: str = os.getenv('LOG_FORMAT', 'text').lower()
+    # Write logs from a background thread; the request path only enqueues (full queue = drop)
+    log_queue: bool = os.getenv('LOG_QUEUE', 'true').lower() == 'true'
+    log_queue_size: int = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    # Keep rates for records below WARNING, e.g. app.request=0.1 (empty keeps everything)
+    log_sample_rates: str = os.getenv('LOG_SAMPLE_RATES', '')
 
     @property
     def require_client_auth(self) -> bool:
@@ -24,5 +80,9 @@ class Settings:
     def database_url(self) -> str:
         return f'postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}'
 
+    @property
+    def async_database_url(self) -> str:
+        return f'postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}'
+
 
 settings = Settings()
@@ -1,15 +1,37 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from common.config import settings
+from common.pool_metrics import InstrumentedAsyncQueuePool
+from common.query_metrics import instrument_engine
 
 
 # 1. Database URL configuration
 DATABASE_URL = settings.database_url
 
 # 2. Engine creation
-engine = create_engine(DATABASE_URL, echo=True)
+# The blocking engine serves CLI tooling (seeders, scripts); the API runs on the async one.
+engine = create_engine(DATABASE_URL, echo=settings.db_echo)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=settings.db_echo,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+)
+# Per-request statement count / DB time (see middleware.request_log)
+instrument_engine(async_engine.sync_engine)
 
 
 # 3. Function to create tables
@@ -21,3 +43,24 @@ def create_db_and_tables() -> None:
 def get_session() -> Generator[Session, None, None]:
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    # expire_on_commit=False: attributes must stay readable after commit without
+    # triggering an implicit (sync) refresh outside the event loop.
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+# 5. EXPLAIN construct: lets the planner's row estimate be read for any statement,
+# with its bind parameters processed like a normal execution.
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}'
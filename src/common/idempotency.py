@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+
+from common.cache import CacheBackend, build_cache
+from common.config import settings
+
+
+# How often a duplicate polls a key held by another worker (same-worker waiters are woken)
+POLL_SECONDS = 0.05
+
+PENDING = b'pending'
+DONE = b'done'
+
+
+class IdempotencyError(Exception):
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    content_type: str
+    body: bytes
+
+
+def request_fingerprint(method: str, path: str, query: bytes, body: bytes) -> str:
+    """Digest of what the request asks for; a key may only be reused for the same one."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (method.encode(), path.encode(), query, body):
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _pack(fingerprint: str, response: StoredResponse | None) -> bytes:
+    if response is None:
+        return b'%s\n%s\n' % (PENDING, fingerprint.encode())
+    header = f'{fingerprint}\n{response.status_code}\n{response.content_type}\n'.encode()
+    return DONE + b'\n' + header + response.body
+
+
+def _unpack(raw: bytes) -> tuple[str, StoredResponse | None]:
+    state, fingerprint, rest = raw.split(b'\n', 2)
+    if state == PENDING:
+        return fingerprint.decode(), None
+    status_code, content_type, body = rest.split(b'\n', 2)
+    return fingerprint.decode(), StoredResponse(int(status_code), content_type.decode(), body)
+
+
+class IdempotencyStore:
+    """Request fingerprint and final response per Idempotency-Key, with a TTL.
+
+    The first request claims the key with an atomic add of a pending entry; once
+    it finishes, the entry is replaced by its response. A duplicate that arrives
+    meanwhile waits for that response instead of running the request again.
+    """
+
+    def __init__(self, backend: CacheBackend, lock_seconds: float, wait_seconds: float) -> None:
+        self.backend = backend
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        # Keys claimed by this worker, so local duplicates are woken instead of polling
+        self._in_flight: dict[str, asyncio.Event] = {}
+
+    async def claim(self, key: str, fingerprint: str) -> StoredResponse | None:
+        """None when the caller owns the key and must run the request.
+
+        Otherwise the stored response of the first request, once it is available.
+        Raises IdempotencyError when the key was used for another request (422) or
+        the first request is still running after the wait time (409).
+        """
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            if await self.backend.add(key, _pack(fingerprint, None), self.lock_seconds):
+                self._in_flight[key] = asyncio.Event()
+                return None
+            raw = await self.backend.get(key)
+            if raw is None:
+                # Released or expired between the two calls: try to claim it again
+                continue
+            stored_fingerprint, response = _unpack(raw)
+            if stored_fingerprint != fingerprint:
+                raise IdempotencyError(
+                    422, 'This Idempotency-Key was already used for a different request'
+                )
+            if response is not None:
+                return response
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise IdempotencyError(
+                    409, 'A request with this Idempotency-Key is still in progress'
+                )
+            event = self._in_flight.get(key)
+            if event is None:
+                await asyncio.sleep(min(POLL_SECONDS, remaining))
+            else:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(event.wait(), remaining)
+
+    async def complete(self, key: str, fingerprint: str, response: StoredResponse) -> None:
+        await self.backend.set(key, _pack(fingerprint, response))
+        self._wake(key)
+
+    async def release(self, key: str) -> None:
+        """Forget a claim whose request failed, so a retry runs it again."""
+        await self.backend.delete(key)
+        self._wake(key)
+
+    def _wake(self, key: str) -> None:
+        event = self._in_flight.pop(key, None)
+        if event is not None:
+            event.set()
+
+
+def build_idempotency_store() -> IdempotencyStore | None:
+    backend = build_cache(
+        'idempotency:',
+        settings.idempotency_max_entries,
+        settings.idempotency_ttl_seconds,
+        max_bytes=settings.idempotency_max_bytes,
+        backend=settings.idempotency_backend,
+    )
+    if backend is None:
+        return None
+    return IdempotencyStore(
+        backend, settings.idempotency_lock_seconds, settings.idempotency_wait_seconds
+    )
+
+
+# One store per worker process, shared by every request
+idempotency_store = build_idempotency_store()
@@ -1,18 +1,246 @@
+"""Logging setup for the API process.
+
+With LOG_QUEUE=true (the default) the request path only pushes records onto a
+bounded in-memory queue; a background thread drains it and writes the records in
+batches, one write and one flush per handler per batch. A slow disk then delays the
+log file, not the responses. When the queue is full, records are dropped and
+counted instead of blocking the caller.
+"""
+
+import copy
+import json
 import logging
 import os
+import queue
+import random
+import sys
+import threading
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from typing import Any
 
 from common.config import settings
 
 
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(request_id)s %(message)s'
+BATCH_SIZE = 512
+# Logger SQLAlchemy writes the SQL to when DB_ECHO=true
+SQL_ECHO_LOGGER = 'sqlalchemy.engine.Engine'
+
+# Set by the request pipeline for the duration of each request
+request_id: ContextVar[str | None] = ContextVar('request_id', default=None)
+
+
+def parse_sample_rates(spec: str) -> dict[str, float]:
+    """Parse 'app.request=0.1,sqlalchemy.engine=0.01' into per-logger keep rates."""
+    rates: dict[str, float] = {}
+    for part in filter(None, (part.strip() for part in spec.split(','))):
+        name, sep, rate = part.partition('=')
+        if not sep or not name.strip():
+            raise ValueError(f'Invalid sample rate {part!r}, expected LOGGER=RATE')
+        rates[name.strip()] = float(rate)
+        if not 0 <= rates[name.strip()] <= 1:
+            raise ValueError(f'Sample rate for {name.strip()!r} must be between 0 and 1')
+    return rates
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp each record with the id of the request that produced it ('-' outside requests)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get() or '-'
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of the records below WARNING from high-volume loggers.
+
+    Rates apply to the named logger and its children; warnings and errors are always kept.
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+
+    def _rate(self, name: str) -> float | None:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition('.')[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate is None or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the request id and any `extra` fields."""
+
+    # Attributes every LogRecord has; anything else came in through `extra`
+    RESERVED = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'request_id'}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            'ts': datetime.fromtimestamp(record.created, UTC).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', None),
+            'message': record.getMessage(),
+        }
+        entry.update(
+            (key, value) for key, value in vars(record).items() if key not in self.RESERVED
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class NonBlockingQueueHandler(logging.Handler):
+    """Put records on a bounded queue without ever waiting for room on it."""
+
+    def __init__(self, log_queue: 'queue.Queue[logging.LogRecord | None]') -> None:
+        super().__init__()
+        self.queue = log_queue
+        self.dropped = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Render the message and traceback here: args and exc_info may not survive the hop
+        record = copy.copy(record)
+        try:
+            record.message = record.getMessage()
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+        except Exception:
+            self.handleError(record)
+            return
+        record.msg, record.args, record.exc_info = record.message, None, None
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchingQueueListener:
+    """Background thread that drains the queue and writes records in batches."""
+
+    def __init__(
+        self,
+        log_queue: 'queue.Queue[logging.LogRecord | None]',
+        handlers: list[logging.StreamHandler[Any]],
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write whatever is still queued and stop the thread."""
+        if self._thread is None:
+            return
+        self.queue.put(None)
+        self._thread.join()
+        self._thread = None
+        for handler in self.handlers:
+            handler.close()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not None]
+            if records:
+                self._write(records)
+            if len(records) < len(batch):
+                return
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            try:
+                lines = [
+                    handler.format(record)
+                    for record in records
+                    if record.levelno >= handler.level and handler.filter(record)
+                ]
+                if not lines:
+                    continue
+                handler.acquire()
+                try:
+                    handler.stream.write(handler.terminator.join(lines) + handler.terminator)
+                    handler.flush()
+                finally:
+                    handler.release()
+            except Exception:
+                handler.handleError(records[0])
+
+
+_listener: BatchingQueueListener | None = None
+_queue_handler: NonBlockingQueueHandler | None = None
+
+
 def configure_logging() -> None:
+    """Configure the root logger from the LOG_* settings."""
+    global _listener, _queue_handler
+    shutdown_logging()
     os.makedirs(os.path.dirname(settings.log_file), exist_ok=True)
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s %(levelname)s [%(name)s] %(message)s',
-        handlers=[
-            logging.FileHandler(settings.log_file),
-            logging.StreamHandler(),
-        ],
+    formatter: logging.Formatter = (
+        JsonFormatter() if settings.log_format == 'json' else logging.Formatter(TEXT_FORMAT)
     )
+    handlers: list[logging.StreamHandler[Any]] = [
+        logging.FileHandler(settings.log_file),
+        logging.StreamHandler(),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Request id and sampling run in the caller: sampled-out records never reach the queue
+    entry_filters: list[logging.Filter] = [RequestIdFilter()]
+    sample_rates = parse_sample_rates(settings.log_sample_rates)
+    if sample_rates:
+        entry_filters.append(SamplingFilter(sample_rates))
+
+    root_handlers: list[logging.Handler]
+    if settings.log_queue:
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(settings.log_queue_size)
+        _queue_handler = NonBlockingQueueHandler(log_queue)
+        _listener = BatchingQueueListener(log_queue, handlers)
+        _listener.start()
+        root_handlers = [_queue_handler]
+    else:
+        root_handlers = list(handlers)
+    for root_handler in root_handlers:
+        for entry_filter in entry_filters:
+            root_handler.addFilter(entry_filter)
+
+    logging.basicConfig(level=log_level, handlers=root_handlers, force=True)
+
+    # DB_ECHO makes SQLAlchemy attach its own synchronous stdout handler; route the
+    # SQL lines through the root handlers instead
+    logging.getLogger(SQL_ECHO_LOGGER).handlers.clear()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background writer, reporting dropped records."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        if _queue_handler.dropped:
+            print(f'{_queue_handler.dropped} log records dropped (queue full)', file=sys.stderr)
+        _queue_handler = None
@@ -0,0 +1,91 @@
+"""Prometheus metrics for this API.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty, writable
+directory before the workers start: every worker then writes its samples to
+memory-mapped files there and /metrics aggregates all of them.
+"""
+
+import asyncio
+import os
+
+import anyio.to_thread
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy.pool import QueuePool
+
+from common.database import async_engine
+
+
+MULTIPROCESS = bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+POOL_SAMPLE_INTERVAL_SECONDS = 5.0
+
+# Route templates (e.g. /Employees/{employee_id}) keep the label cardinality bounded
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request latency by route template',
+    ['method', 'route'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS = Counter('http_requests', 'Requests by route and status', ['method', 'route', 'status'])
+IN_FLIGHT = Gauge(
+    'http_requests_in_flight', 'Requests being served', ['method'], multiprocess_mode='livesum'
+)
+DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'SQL statements per request',
+    ['route'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50),
+)
+DB_POOL = Gauge(
+    'db_pool_connections',
+    'Async engine pool connections by state',
+    ['state'],
+    multiprocess_mode='livesum',
+)
+THREADPOOL = Gauge(
+    'threadpool_tokens', 'Default anyio threadpool tokens', ['state'], multiprocess_mode='livesum'
+)
+
+
+def sample_pool_gauges() -> None:
+    """Copy the pool and threadpool gauges of this worker into the registry."""
+    pool = async_engine.pool
+    if isinstance(pool, QueuePool):
+        DB_POOL.labels('checked_out').set(pool.checkedout())
+        DB_POOL.labels('idle').set(pool.checkedin())
+        DB_POOL.labels('overflow').set(max(pool.overflow(), 0))
+        DB_POOL.labels('size').set(pool.size())
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    THREADPOOL.labels('in_use').set(limiter.borrowed_tokens)
+    THREADPOOL.labels('total').set(limiter.total_tokens)
+
+
+async def sample_pool_gauges_forever(interval: float = POOL_SAMPLE_INTERVAL_SECONDS) -> None:
+    # Gauges are sampled in the background, off the request path
+    while True:
+        sample_pool_gauges()
+        await asyncio.sleep(interval)
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess aggregation."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())  # type: ignore[no-untyped-call]
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus text exposition, aggregated across workers in multiprocess mode."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    sample_pool_gauges()
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
+
+
+CursorDirection = Literal['next', 'prev']
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Decoded keyset position: the sort key and id of a boundary row."""
+
+    sort_by: str
+    order: Literal['asc', 'desc']
+    value: Any
+    id: UUID
+    direction: CursorDirection
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    if isinstance(cursor.value, datetime):
+        value_type, value = 'datetime', cursor.value.isoformat()
+    else:
+        value_type, value = 'str', str(cursor.value)
+
+    payload = {
+        's': cursor.sort_by,
+        'o': cursor.order,
+        't': value_type,
+        'v': value,
+        'id': str(cursor.id),
+        'd': cursor.direction,
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode an opaque cursor, raising ValueError if it was tampered with."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        value = payload['v']
+        if payload['t'] == 'datetime':
+            value = datetime.fromisoformat(value)
+        if payload['o'] not in ('asc', 'desc') or payload['d'] not in ('next', 'prev'):
+            raise ValueError
+        return Cursor(
+            sort_by=payload['s'],
+            order=payload['o'],
+            value=value,
+            id=UUID(payload['id']),
+            direction=payload['d'],
+        )
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as err:
+        raise ValueError('Invalid pagination cursor') from err
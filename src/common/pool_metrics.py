@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+
+class PoolStats:
+    """Checkout counters for one pool; cheap enough to update on every checkout."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.total_checkout_s = 0.0
+        self.max_checkout_s = 0.0
+        self.peak_checked_out = 0
+
+    def record(self, elapsed_s: float, waited: bool, checked_out: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.waits += waited
+            self.total_checkout_s += elapsed_s
+            self.max_checkout_s = max(self.max_checkout_s, elapsed_s)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times every checkout.
+
+    A checkout "waits" when every pooled and overflow connection is already in
+    use, i.e. the caller blocks until another request returns a connection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_overflow = kwargs.get('max_overflow', 10)
+        self.stats = PoolStats()
+
+    def capacity(self) -> int | None:
+        """Pooled plus overflow connections; None when overflow is unlimited (negative)."""
+        if self.max_overflow < 0:
+            return None
+        return self.size() + self.max_overflow
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # Without an overflow limit a new connection is always opened: nobody waits
+        capacity = self.capacity()
+        waited = capacity is not None and self.checkedout() >= capacity
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record(time.perf_counter() - start, waited, self.checkedout())
+        return entry
+
+
+def pool_snapshot(pool: Pool) -> dict[str, Any]:
+    """Live gauges plus cumulative checkout counters for the admin endpoint."""
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        return {'pool_class': type(pool).__name__}
+
+    stats = pool.stats
+    capacity = pool.capacity()
+    checked_out = pool.checkedout()
+    return {
+        'pool_class': type(pool).__name__,
+        'pool_size': pool.size(),
+        'max_overflow': pool.max_overflow,
+        'checked_out': checked_out,
+        'checked_in': pool.checkedin(),
+        'overflow': max(pool.overflow(), 0),
+        # No saturation to report when overflow is unlimited
+        'saturation': round(checked_out / capacity, 4) if capacity else None,
+        'peak_saturation': round(stats.peak_checked_out / capacity, 4) if capacity else None,
+        'checkouts': stats.checkouts,
+        'waits': stats.waits,
+        'timeouts': stats.timeouts,
+        'avg_checkout_ms': round(stats.total_checkout_s / stats.checkouts * 1000, 3)
+        if stats.checkouts
+        else 0.0,
+        'max_checkout_ms': round(stats.max_checkout_s * 1000, 3),
+    }
@@ -0,0 +1,69 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    """Statements run on behalf of one request."""
+
+    queries: int = 0
+    db_time_s: float = 0.0
+    # Rows returned or affected, as reported by the driver (server-side cursors report none)
+    rows: int = 0
+
+    @property
+    def db_time_ms(self) -> float:
+        return self.db_time_s * 1000
+
+
+# The middleware sets a fresh QueryStats per request. The object itself is shared, so
+# the statements run in child tasks (BaseHTTPMiddleware's call_next, greenlets) count too.
+_current_stats: ContextVar[QueryStats | None] = ContextVar('query_stats', default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the statements run in this scope. Nested scopes share the outer stats."""
+    current = _current_stats.get()
+    if current is not None:
+        yield current
+        return
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = _current_stats.get()
+    started_at = getattr(context, '_query_started_at', None)
+    if stats is None or started_at is None:
+        return
+    stats.db_time_s += time.perf_counter() - started_at
+    stats.rows += max(cursor.rowcount, 0)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attribute every statement run on `engine` to the request being tracked."""
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
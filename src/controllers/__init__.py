@@ -1,8 +1,12 @@
 from controllers.employee_controller import router as employee_router
 from controllers.health_controller import router as health_router
+from controllers.metrics_controller import router as metrics_router
+from controllers.payroll_controller import router as payroll_router
 
 
 __all__ = [
     'employee_router',
     'health_router',
+    'metrics_router',
+    'payroll_router',
 ]
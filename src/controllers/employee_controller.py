@@ -1,45 +1,169 @@
+import logging
+from collections.abc import AsyncIterator
+from datetime import date
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status as http_status,
+)
+from fastapi.responses import StreamingResponse
 
-from dependencies import EmployeeService, get_employees_services
+from common.conditional import freshness_check
+from dependencies import (
+    EmployeeImportService,
+    EmployeeService,
+    get_employee_import_service,
+    get_employees_services,
+)
 from models.employee_model import (
     Employee,
+    EmployeeBulkCreateRequest,
+    EmployeeBulkCreateResponse,
     EmployeeCreate,
+    EmployeeFinancialInfoResponse,
+    EmployeeImportResult,
     EmployeePaginationResponse,
+    EmployeePatch,
     EmployeePublicResponse,
     EmployeeStatus,
+    EmployeeStatusTransitionRequest,
+    EmployeeStatusTransitionResult,
+    ExportFormat,
+    SearchMode,
+    TotalKind,
 )
 
 
+logger = logging.getLogger('app.employees')
+
 router = APIRouter(prefix='/Employees', tags=['Employee'])
 
 
-@router.patch('/{employee_id}')
-def update_employee(
-    employee_id: int,
-    employee_data: Employee,
+@router.patch('/{employee_id}', response_model=EmployeePublicResponse)
+async def update_employee(
+    employee_id: UUID,
+    patch: EmployeePatch,
+    if_match: str | None = Header(None, description='ETag of the employee, or * to overwrite'),
     service: EmployeeService = Depends(get_employees_services),
-) -> Employee:
-    """Actualiza los datos de un empleado de forma parcial.
+) -> Response:
+    """Actualiza parcialmente un empleado y su información personal.
+
+    Solo se escriben los campos enviados, en una única sentencia (un UPDATE ... RETURNING
+    por tabla). Exige If-Match con el ETag del empleado: si otro cambio llegó antes
+    responde 412 en lugar de sobrescribirlo. Un cambio de estado no permitido responde
+    409; para dar de baja se usa DELETE o /bulk/status. Devuelve el empleado y su nuevo ETag.
+    """
+    body, freshness = await service.patch_employee(employee_id, patch, if_match)
+    return Response(body, media_type='application/json', headers=freshness.headers())
+
 
-    Utiliza model_dump con exclude_unset para asegurar que solo los campos
-    enviados en el cuerpo de la petición sean procesados por el servicio.
+@router.delete('/{employee_id}', status_code=http_status.HTTP_204_NO_CONTENT)
+async def delete_employee(
+    employee_id: UUID,
+    service: EmployeeService = Depends(get_employees_services),
+) -> Response:
+    """Da de baja a un empleado con un borrado lógico.
+
+    Queda como TERMINATED con `deleted_at` y desaparece de todas las lecturas;
+    el job de archivado (`seed.py archive`) lo mueve luego a las tablas de archivo.
     """
-    return service.update(employee_id, employee_data.model_dump(exclude_unset=True))
+    await service.delete_employee(employee_id)
+    return Response(status_code=http_status.HTTP_204_NO_CONTENT)
+
+
+IMPORT_CHUNK_SIZE = 1 << 20
+EXPORT_MEDIA_TYPES: dict[str, str] = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+
+
+# Declared before /{employee_id} so "export" is not parsed as an id
+@router.get('/export', response_class=StreamingResponse)
+async def export_employees(
+    service: EmployeeService = Depends(get_employees_services),
+    export_format: ExportFormat = Query('csv', alias='format'),
+    name: str | None = Query(None),
+    status: EmployeeStatus | None = Query(None),
+    role_id: UUID | None = Query(None),
+    search: str | None = Query(None),
+    search_mode: SearchMode = Query('contains'),
+    sort_by: str = Query('created_at'),
+    order: Literal['asc', 'desc'] = Query('desc'),
+) -> StreamingResponse:
+    """Exporta todos los empleados que cumplen los filtros como CSV o NDJSON.
+
+    Usa los mismos filtros que el listado, sin paginación: las filas se leen
+    con un cursor del lado del servidor y se envían a medida que llegan.
+    """
+    content = service.export_employees(
+        export_format=export_format,
+        name=name,
+        status=status,
+        role_id=role_id,
+        search=search,
+        sort_by=sort_by,
+        order=order,
+        search_mode=search_mode,
+    )
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="employees.{export_format}"'},
+    )
+
+
+# Declared before /{employee_id} so "financial-info" is not parsed as an id
+@router.get('/financial-info', response_model=list[EmployeeFinancialInfoResponse])
+async def get_employees_financial_info(
+    employee_ids: list[UUID] = Query(..., alias='employee_id', min_length=1),
+    as_of: date | None = Query(None, description='Day to look up; omit for the current record'),
+    service: EmployeeService = Depends(get_employees_services),
+) -> list[EmployeeFinancialInfoResponse]:
+    """Información financiera vigente de varios empleados en una sola consulta.
+
+    Se pasa `employee_id` repetido; los empleados sin registro vigente se omiten.
+    """
+    return await service.get_financial_info_batch(employee_ids, as_of)
+
+
+@router.get('/{employee_id}/financial-info', response_model=EmployeeFinancialInfoResponse)
+async def get_employee_financial_info(
+    employee_id: UUID,
+    as_of: date | None = Query(None, description='Day to look up; omit for the current record'),
+    service: EmployeeService = Depends(get_employees_services),
+) -> EmployeeFinancialInfoResponse:
+    """Información financiera vigente de un empleado, hoy o en la fecha `as_of`."""
+    return await service.get_financial_info(employee_id, as_of)
 
 
 @router.get('/{employee_id}', response_model=EmployeePublicResponse)
-def get_employee(
+async def get_employee(
     employee_id: UUID,
+    request: Request,
     service: EmployeeService = Depends(get_employees_services),
-) -> EmployeePublicResponse:
-    return service.get_employee_by_id(employee_id)
+) -> Response:
+    """Devuelve un empleado; las lecturas repetidas se sirven desde la caché.
+
+    Responde 304 a If-None-Match / If-Modified-Since sin construir el cuerpo.
+    """
+    body, freshness = await service.get_employee_json(
+        employee_id, is_fresh=freshness_check(request.headers)
+    )
+    if body is None:
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers=freshness.headers())
+    return Response(body, media_type='application/json', headers=freshness.headers())
 
 
 @router.get('/', response_model=EmployeePaginationResponse)
-def get_employees(
+async def get_employees(
+    request: Request,
     service: EmployeeService = Depends(get_employees_services),
     name: str | None = Query(None),
     status: EmployeeStatus | None = Query(None),
@@ -49,10 +173,18 @@ def get_employees(
     limit: int = Query(10, ge=1, le=100),
     sort_by: str = Query('created_at'),
     order: Literal['asc', 'desc'] = Query('desc'),
-) -> EmployeePaginationResponse:
-    # Ensure page is at least 1
-
-    return service.search_employees(
+    pagination: Literal['page', 'cursor'] = Query('page'),
+    cursor: str | None = Query(None, description='Opaque next_cursor/prev_cursor token'),
+    search_mode: SearchMode = Query(
+        'contains', description='contains (ILIKE), fulltext or fuzzy (relevance-ranked)'
+    ),
+    include_total: TotalKind = Query(
+        'exact', description='exact, estimate (planner statistics) or none'
+    ),
+) -> Response:
+    # Pages come rendered from the list cache or from trusted rows.
+    # Conditional requests get a 304 after a versions-only probe of the page.
+    body, freshness = await service.search_employees_json(
         name=name,
         status=status,
         role_id=role_id,
@@ -61,11 +193,19 @@ def get_employees(
         limit=limit,
         sort_by=sort_by,
         order=order,
+        pagination=pagination,
+        cursor=cursor,
+        search_mode=search_mode,
+        include_total=include_total,
+        is_fresh=freshness_check(request.headers),
     )
+    if body is None:
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers=freshness.headers())
+    return Response(body, media_type='application/json', headers=freshness.headers())
 
 
 @router.post('/')
-def create_employee(
+async def create_employee(
     employee: EmployeeCreate,
     service: EmployeeService = Depends(get_employees_services),
 ) -> Employee:
@@ -73,7 +213,57 @@ def create_employee(
 
     Valida los datos de entrada mediante el esquema EmployeeCreate y delega
     la persistencia al servicio de empleados.
+    Con el header Idempotency-Key, un reintento con la misma clave recibe la
+    respuesta guardada de la primera petición en lugar de crear otro empleado.
+    """
+    logger.debug('Creating employee %s', employee.employee_code)
+    return await service.create_employee(employee)
+
+
+@router.post('/bulk', response_model=EmployeeBulkCreateResponse)
+async def bulk_create_employees(
+    request: EmployeeBulkCreateRequest,
+    response: Response,
+    service: EmployeeService = Depends(get_employees_services),
+) -> EmployeeBulkCreateResponse:
+    """Registra un lote de empleados con inserts multi-fila.
+
+    Devuelve el resultado de cada fila. En modo `atomic` un lote con errores
+    no inserta nada y responde 422; en modo `partial` se guardan las filas válidas.
     """
-    emp_log = employee.name if hasattr(employee, 'name') else employee
-    print(f'Creating employee: {emp_log}')
-    return service.create_employee(employee)
+    result = await service.bulk_create_employees(request)
+    if request.mode == 'atomic' and result.failed:
+        response.status_code = http_status.HTTP_422_UNPROCESSABLE_ENTITY
+    return result
+
+
+@router.post('/bulk/status', response_model=EmployeeStatusTransitionResult)
+async def transition_employees_status(
+    request: EmployeeStatusTransitionRequest,
+    service: EmployeeService = Depends(get_employees_services),
+) -> EmployeeStatusTransitionResult:
+    """Cambia el estado de muchos empleados a la vez (bajas o reactivaciones masivas).
+
+    Se eligen por `ids` o por los mismos `filters` del listado. Se actualizan por lotes
+    con un UPDATE ... RETURNING cada uno; pasar a TERMINATED los da de baja lógica.
+    Los empleados cuyo estado actual no permite el cambio se omiten.
+    """
+    return await service.transition_status(request)
+
+
+@router.post('/import', response_model=EmployeeImportResult)
+async def import_employees(
+    file: UploadFile = File(..., description='CSV with an EmployeeCreate header row'),
+    service: EmployeeImportService = Depends(get_employee_import_service),
+) -> EmployeeImportResult:
+    """Importa un CSV de empleados (altas y actualizaciones por employee_code).
+
+    El archivo se envía por COPY a una tabla de staging, se valida y normaliza
+    en SQL y se fusiona con upserts. Las filas rechazadas vuelven en el reporte.
+    """
+
+    async def chunks() -> AsyncIterator[bytes]:
+        while chunk := await file.read(IMPORT_CHUNK_SIZE):
+            yield chunk
+
+    return await service.import_csv(chunks())
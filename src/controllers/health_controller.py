@@ -1,7 +1,12 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from common.cache import employee_cache, employee_list_cache
+from common.database import async_engine
+from common.pool_metrics import pool_snapshot
 from dependencies import get_db
 from services.health_service import HealthService
 
@@ -19,12 +24,33 @@ class HealthResponse(BaseModel):
     summary='Health check',
     description='Checks database connectivity and returns API health status.',
 )
-def health_check(session: Session = Depends(get_db)) -> dict[str, str]:
+async def health_check(session: AsyncSession = Depends(get_db)) -> dict[str, str]:
     service = HealthService(session)
     try:
-        return service.check()
+        return await service.check()
     except Exception as err:
         raise HTTPException(
             status_code=503,
             detail='Database unavailable',
         ) from err
+
+
+@router.get(
+    '/health/pool',
+    summary='Connection pool stats',
+    description='Live pool gauges and cumulative checkout latency/wait counters for this worker.',
+)
+async def pool_stats() -> dict[str, Any]:
+    return pool_snapshot(async_engine.pool)
+
+
+@router.get(
+    '/health/cache',
+    summary='Employee cache stats',
+    description='Hit/miss/eviction counters of the employee read caches for this worker.',
+)
+async def cache_stats() -> dict[str, Any]:
+    return {
+        name: cache.snapshot() if cache is not None else {'backend': 'none'}
+        for name, cache in (('employee', employee_cache), ('employee_list', employee_list_cache))
+    }
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Response
+
+from common.metrics import render_metrics
+
+
+router = APIRouter(tags=['Metrics'])
+
+
+@router.get('/metrics', include_in_schema=False)
+async def metrics() -> Response:
+    """Métricas en formato de texto de Prometheus (todas las réplicas del proceso)."""
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
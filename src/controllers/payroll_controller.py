@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+
+from dependencies import PayrollService, get_payroll_service
+from models.payroll_model import PayrollDimension, PayrollRefreshResult, PayrollSummaryResponse
+
+
+router = APIRouter(prefix='/Payroll', tags=['Payroll'])
+
+
+@router.get('/summary', response_model=PayrollSummaryResponse)
+async def get_payroll_summary(
+    group_by: list[PayrollDimension] = Query(
+        ['status', 'city', 'salary_currency_id'],
+        description='Dimensions to group by (repeatable); none returns the grand total',
+    ),
+    service: PayrollService = Depends(get_payroll_service),
+) -> PayrollSummaryResponse:
+    """Totales de salario y costo empresa del registro financiero vigente.
+
+    Se leen de una vista materializada que se refresca en segundo plano:
+    `refreshed_at` y `age_seconds` indican qué tan recientes son las cifras.
+    """
+    return await service.get_summary(group_by)
+
+
+@router.post('/summary/refresh', response_model=PayrollRefreshResult)
+async def refresh_payroll_summary(
+    service: PayrollService = Depends(get_payroll_service),
+) -> PayrollRefreshResult:
+    """Refresca la vista ya, sin bloquear a los lectores (REFRESH ... CONCURRENTLY)."""
+    return await service.refresh()
@@ -1,27 +1,68 @@
 from fastapi import Depends
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from common.database import get_session
+from common.cache import CacheBackend, employee_cache, employee_list_cache
+from common.database import get_async_session
+from repositories.employee_import_repository import EmployeeImportRepositoryClass
 from repositories.employee_repository import EmployeeRepositoryClass
+from repositories.payroll_repository import PayrollRepositoryClass
 
 # Usamos el alias redundante para exportar explícitamente a MyPy
+from services.employee_import_service import EmployeeImportService as EmployeeImportService
 from services.employee_service import EmployeeService as EmployeeService
+from services.payroll_service import PayrollService as PayrollService
 
 
 # --- Dependencies ---
-def get_db(session: Session = Depends(get_session)) -> Session:
+def get_db(session: AsyncSession = Depends(get_async_session)) -> AsyncSession:
     return session
 
 
+def get_employee_cache() -> CacheBackend | None:
+    return employee_cache
+
+
+def get_employee_list_cache() -> CacheBackend | None:
+    return employee_list_cache
+
+
 # --- repositories ---
 def get_employees_repo(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> EmployeeRepositoryClass:
     return EmployeeRepositoryClass(session)
 
 
+def get_employee_import_repo(
+    session: AsyncSession = Depends(get_async_session),
+) -> EmployeeImportRepositoryClass:
+    return EmployeeImportRepositoryClass(session)
+
+
+def get_payroll_repo(
+    session: AsyncSession = Depends(get_async_session),
+) -> PayrollRepositoryClass:
+    return PayrollRepositoryClass(session)
+
+
 # --- services ---
 def get_employees_services(
     emp_repo: EmployeeRepositoryClass = Depends(get_employees_repo),
+    cache: CacheBackend | None = Depends(get_employee_cache),
+    list_cache: CacheBackend | None = Depends(get_employee_list_cache),
 ) -> EmployeeService:
-    return EmployeeService(emp_repo)
+    return EmployeeService(emp_repo, cache, list_cache)
+
+
+def get_employee_import_service(
+    import_repo: EmployeeImportRepositoryClass = Depends(get_employee_import_repo),
+    cache: CacheBackend | None = Depends(get_employee_cache),
+    list_cache: CacheBackend | None = Depends(get_employee_list_cache),
+) -> EmployeeImportService:
+    return EmployeeImportService(import_repo, cache, list_cache)
+
+
+def get_payroll_service(
+    payroll_repo: PayrollRepositoryClass = Depends(get_payroll_repo),
+) -> PayrollService:
+    return PayrollService(payroll_repo)
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -8,16 +9,28 @@ from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from common.config import settings
-from common.logging_config import configure_logging
-from middleware import add_version_header, check_client_auth, log_requests
+from common.logging_config import configure_logging, shutdown_logging
+from common.metrics import mark_worker_dead, sample_pool_gauges_forever
+from middleware import RequestPipelineMiddleware
 from router.router import router as api_router
+from services.payroll_service import refresh_payroll_summary_forever
+from utils.financial_partitions import manage_partitions_forever
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Maneja el ciclo de vida de la aplicación (Startup y Shutdown)."""
     configure_logging()
+    tasks = [asyncio.create_task(sample_pool_gauges_forever())]
+    if settings.payroll_summary_refresh_seconds > 0:
+        tasks.append(asyncio.create_task(refresh_payroll_summary_forever()))
+    if settings.financial_partitions_check_seconds > 0:
+        tasks.append(asyncio.create_task(manage_partitions_forever()))
     yield
+    for task in tasks:
+        task.cancel()
+    mark_worker_dead()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -94,10 +107,8 @@ app.add_middleware(
     expose_headers=['*'],
 )
 
-# El orden es vital: check_client_auth suele ir primero para proteger el resto
-app.middleware('http')(check_client_auth)
-app.middleware('http')(add_version_header)
-app.middleware('http')(log_requests)
+# Auth, X-Version, timing, logs y métricas en una sola capa ASGI (la más externa)
+app.add_middleware(RequestPipelineMiddleware)
 
 app.include_router(api_router)
 
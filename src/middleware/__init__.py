@@ -1,6 +1,4 @@
-from middleware.auth import check_client_auth
-from middleware.request_log import log_requests
-from middleware.version import add_version_header
+from middleware.pipeline import RequestPipelineMiddleware
 
 
-__all__ = ['add_version_header', 'check_client_auth', 'log_requests']
+__all__ = ['RequestPipelineMiddleware']
@@ -0,0 +1,109 @@
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.idempotency import (
+    IdempotencyError,
+    IdempotencyStore,
+    StoredResponse,
+    request_fingerprint,
+)
+
+
+# Writes a client may retry with an Idempotency-Key
+IDEMPOTENT_PATHS: set[str] = {'/Employees/', '/Employees/bulk', '/Employees/bulk/status'}
+
+MAX_KEY_LENGTH = 255
+
+
+def idempotency_key(method: str, path: str, headers: Headers) -> str | None:
+    if method != 'POST' or path not in IDEMPOTENT_PATHS:
+        return None
+    return headers.get('idempotency-key')
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def run_idempotent(
+    app: ASGIApp,
+    store: IdempotencyStore,
+    key: str,
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+) -> None:
+    """Run the request once per key; repeats get the stored response back.
+
+    A replay is answered from the store alone: the app never runs, so no session
+    is opened. Responses of 5xx, or requests that raise, release the key instead.
+    """
+    if not key or len(key) > MAX_KEY_LENGTH or not key.isprintable():
+        response: Response = JSONResponse(
+            status_code=400, content={'detail': 'Invalid Idempotency-Key header'}
+        )
+        await response(scope, receive, send)
+        return
+
+    body = await _read_body(receive)
+    fingerprint = request_fingerprint(scope['method'], scope['path'], scope['query_string'], body)
+    # Keys belong to the client that sent them
+    client = Headers(scope=scope).get('x-client-key', '')
+    store_key = f'{client}:{key}'
+
+    try:
+        stored = await store.claim(store_key, fingerprint)
+    except IdempotencyError as err:
+        response = JSONResponse(status_code=err.status_code, content={'detail': err.detail})
+        await response(scope, receive, send)
+        return
+    if stored is not None:
+        response = Response(
+            stored.body,
+            status_code=stored.status_code,
+            media_type=stored.content_type or None,
+            headers={'Idempotent-Replayed': 'true'},
+        )
+        await response(scope, receive, send)
+        return
+
+    body_sent = False
+
+    async def replay_body() -> Message:
+        nonlocal body_sent
+        if body_sent:
+            # Nothing more to read: wait like Starlette does for the disconnect
+            return await receive()
+        body_sent = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    status_code = 500
+    content_type = ''
+    chunks: list[bytes] = []
+
+    async def capture(message: Message) -> None:
+        nonlocal status_code, content_type
+        if message['type'] == 'http.response.start':
+            status_code = message['status']
+            content_type = Headers(raw=message['headers']).get('content-type', '')
+        elif message['type'] == 'http.response.body':
+            chunks.append(message.get('body', b''))
+        await send(message)
+
+    try:
+        await app(scope, replay_body, capture)
+    except BaseException:
+        await store.release(store_key)
+        raise
+    if status_code >= 500:
+        await store.release(store_key)
+    else:
+        await store.complete(
+            store_key, fingerprint, StoredResponse(status_code, content_type, b''.join(chunks))
+        )
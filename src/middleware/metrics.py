@@ -0,0 +1,17 @@
+from starlette.types import Scope
+
+from common.metrics import DB_QUERIES, REQUEST_LATENCY, REQUESTS
+from common.query_metrics import QueryStats
+
+
+def route_template(scope: Scope) -> str:
+    # The router stores the matched route in the scope; unmatched paths share one label
+    return getattr(scope.get('route'), 'path', 'unmatched')
+
+
+def record_request(
+    method: str, route: str, status_code: int, duration_s: float, stats: QueryStats
+) -> None:
+    REQUEST_LATENCY.labels(method, route).observe(duration_s)
+    REQUESTS.labels(method, route, str(status_code)).inc()
+    DB_QUERIES.labels(route).observe(stats.queries)
@@ -0,0 +1,88 @@
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.idempotency import idempotency_store
+from common.logging_config import request_id
+from common.metrics import IN_FLIGHT
+from common.query_metrics import track_queries
+from middleware.auth import is_authorized, missing_auth_response
+from middleware.idempotency import idempotency_key, run_idempotent
+from middleware.metrics import record_request, route_template
+from middleware.request_log import SKIP_PATHS, log_request, server_timing
+from middleware.version import add_version_header
+
+
+MAX_REQUEST_ID_LENGTH = 128
+
+
+def _request_id(headers: Headers) -> str:
+    # Reuse the caller's id so logs can be joined across services
+    incoming = headers.get('x-request-id', '')
+    if incoming and len(incoming) <= MAX_REQUEST_ID_LENGTH and incoming.isprintable():
+        return incoming
+    return uuid.uuid4().hex
+
+
+class RequestPipelineMiddleware:
+    """Auth, version header, request id, idempotency, timing, log and metrics in one layer.
+
+    Unlike @app.middleware('http') (BaseHTTPMiddleware) there is no call_next task
+    and no response wrapping: headers are added to the response start message as
+    it goes out and the body streams straight through. The log line and metrics
+    are written once the body has been sent; Server-Timing covers the work done
+    before the headers. Writes sent with an Idempotency-Key go through the replay
+    store, so a repeat never reaches the app.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        method: str = scope['method']
+        path: str = scope['path']
+        status_code = 500
+        in_flight = IN_FLIGHT.labels(method)
+        in_flight.inc()
+        request_headers = Headers(scope=scope)
+        current_request_id = _request_id(request_headers)
+        request_id_token = request_id.set(current_request_id)
+
+        with track_queries() as stats:
+
+            async def send_with_headers(message: Message) -> None:
+                nonlocal status_code
+                if message['type'] == 'http.response.start':
+                    status_code = message['status']
+                    headers = MutableHeaders(scope=message)
+                    add_version_header(headers)
+                    headers['X-Request-ID'] = current_request_id
+                    if path not in SKIP_PATHS:
+                        elapsed_ms = (time.perf_counter() - start) * 1000
+                        headers['Server-Timing'] = server_timing(stats, elapsed_ms)
+                await send(message)
+
+            try:
+                key = idempotency_key(method, path, request_headers)
+                if not is_authorized(path, request_headers):
+                    await missing_auth_response()(scope, receive, send_with_headers)
+                elif key is not None and idempotency_store is not None:
+                    await run_idempotent(
+                        self.app, idempotency_store, key, scope, receive, send_with_headers
+                    )
+                else:
+                    await self.app(scope, receive, send_with_headers)
+            finally:
+                duration_s = time.perf_counter() - start
+                in_flight.dec()
+                record_request(method, route_template(scope), status_code, duration_s, stats)
+                if path not in SKIP_PATHS:
+                    log_request(method, path, status_code, duration_s * 1000, stats)
+                request_id.reset(request_id_token)
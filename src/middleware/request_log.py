@@ -1,31 +1,35 @@
 import logging
-import time
-from collections.abc import Awaitable, Callable
 
-from starlette.requests import Request
-from starlette.responses import Response
+from common.config import settings
+from common.query_metrics import QueryStats
 
 
 logger = logging.getLogger('app.request')
 
-SKIP_PATHS: set[str] = {'/', '/health'}
+SKIP_PATHS: set[str] = {'/', '/health', '/metrics'}
 
 
-async def log_requests(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    if request.url.path in SKIP_PATHS:
-        return await call_next(request)
+def server_timing(stats: QueryStats, duration_ms: float) -> str:
+    return (
+        f'db;dur={stats.db_time_ms:.2f};desc="{stats.queries} queries, {stats.rows} rows", '
+        f'app;dur={max(duration_ms - stats.db_time_ms, 0):.2f}, '
+        f'total;dur={duration_ms:.2f}'
+    )
+
 
-    start = time.perf_counter()
-    response = await call_next(request)
-    duration_ms = (time.perf_counter() - start) * 1000
-    logger.info(
-        '%s %s -> %s %.2fms',
-        request.method,
-        request.url.path,
-        response.status_code,
+def log_request(
+    method: str, path: str, status_code: int, duration_ms: float, stats: QueryStats
+) -> None:
+    over_budget = 0 < settings.db_query_budget < stats.queries
+    logger.log(
+        logging.WARNING if over_budget else logging.INFO,
+        '%s %s -> %s %.2fms db=%.2fms queries=%d rows=%d%s',
+        method,
+        path,
+        status_code,
         duration_ms,
+        stats.db_time_ms,
+        stats.queries,
+        stats.rows,
+        f' over query budget ({settings.db_query_budget})' if over_budget else '',
     )
-    return response
@@ -1,15 +1,7 @@
-from collections.abc import Awaitable, Callable
-
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
 
 from common.config import settings
 
 
-async def add_version_header(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    response = await call_next(request)
-    response.headers['X-Version'] = settings.version
-    return response
+def add_version_header(headers: MutableHeaders) -> None:
+    headers['X-Version'] = settings.version
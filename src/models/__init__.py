@@ -1,4 +1,10 @@
+from .archive_model import (
+    employee_archive,
+    employee_financial_info_archive,
+    employees_personal_info_archive,
+)
 from .employee_model import Employee, EmployeeCreate, EmployeeFinancialInfo, EmployeePersonalInfo
+from .payroll_model import payroll_summary
 
 
 __all__ = [
@@ -6,4 +12,8 @@ __all__ = [
     'EmployeeCreate',
     'EmployeePersonalInfo',
     'EmployeeFinancialInfo',
+    'employee_archive',
+    'employees_personal_info_archive',
+    'employee_financial_info_archive',
+    'payroll_summary',
 ]
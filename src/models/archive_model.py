@@ -0,0 +1,44 @@
+from sqlalchemy import Column, DateTime, Table, text
+from sqlmodel import SQLModel
+
+from models.employee_model import Employee, EmployeeFinancialInfo, EmployeePersonalInfo
+
+
+EMPLOYEE_TABLE: Table = Employee.__table__
+PERSONAL_INFO_TABLE: Table = EmployeePersonalInfo.__table__
+FINANCIAL_INFO_TABLE: Table = EmployeeFinancialInfo.__table__
+
+ARCHIVED_AT_DEFAULT = "(now() AT TIME ZONE 'utc')"
+
+
+def _archive_table(source: Table) -> Table:
+    """Cold copy of `source`: the same columns plus archived_at.
+
+    No foreign keys and no secondary indexes, so archiving costs one insert per row
+    and the archive never constrains the live tables. The primary key is always `id`,
+    as created by the migration: the archive is not partitioned, so unlike
+    employee_financial_info it does not need the partition key in it.
+    """
+    columns = [
+        Column(column.name, column.type, primary_key=column.name == 'id', nullable=column.nullable)
+        for column in source.columns
+    ]
+    return Table(
+        f'{source.name}_archive',
+        SQLModel.metadata,
+        *columns,
+        Column('archived_at', DateTime, nullable=False, server_default=text(ARCHIVED_AT_DEFAULT)),
+    )
+
+
+# Long-terminated employees are moved here by EmployeeArchiveRepositoryClass
+employee_archive = _archive_table(EMPLOYEE_TABLE)
+employees_personal_info_archive = _archive_table(PERSONAL_INFO_TABLE)
+employee_financial_info_archive = _archive_table(FINANCIAL_INFO_TABLE)
+
+# (live table, archive table), children first: the order rows are moved in
+ARCHIVE_TABLES: tuple[tuple[Table, Table], ...] = (
+    (FINANCIAL_INFO_TABLE, employee_financial_info_archive),
+    (PERSONAL_INFO_TABLE, employees_personal_info_archive),
+    (EMPLOYEE_TABLE, employee_archive),
+)
@@ -3,21 +3,61 @@ import uuid
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from enum import Enum as PyEnum
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Literal, Optional
 
 from pydantic import BaseModel, StringConstraints, field_validator, model_validator
-from sqlalchemy import DECIMAL, Column, String
+from sqlalchemy import DDL, DECIMAL, Column, Index, String, event, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
+def utc_now() -> datetime:
+    # Timestamps are stored in TIMESTAMP WITHOUT TIME ZONE columns holding UTC;
+    # asyncpg refuses timezone-aware values for those, so the default is naive UTC.
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class EmployeeStatus(str, PyEnum):
     ACTIVE = 'ACTIVE'
     INACTIVE = 'INACTIVE'
     TERMINATED = 'TERMINATED'
 
 
+SearchMode = Literal['contains', 'fulltext', 'fuzzy']
+TotalKind = Literal['exact', 'estimate', 'none']
+BulkMode = Literal['atomic', 'partial']
+ExportFormat = Literal['csv', 'ndjson']
+
 EMPLOYEE_CODE_PATTERN = r'^[A-Z]{3}-\d{3}$'
 
+# Full-text document over the searchable personal fields. The GIN expression index and the
+# search queries must use this exact expression for the planner to match them.
+PERSONAL_INFO_SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, first_name || ' ' || last_name || ' ' || personal_email)"
+)
+
+# Validity period of a financial record; effective_to is its last day (inclusive) and NULL
+# leaves it open. The GiST index and the as-of lookups must use this exact expression.
+FINANCIAL_INFO_PERIOD = "daterange(effective_from, effective_to, '[]'::text)"
+
+# employee_financial_info is range-partitioned on effective_from, one partition per year
+# (see utils/financial_partitions.py); rows outside every range land in the default one.
+FINANCIAL_INFO_PARTITION_KEY = 'effective_from'
+FINANCIAL_INFO_DEFAULT_PARTITION = 'employee_financial_info_default'
+
+# Predicate of the partial indexes: soft-deleted rows stay out of the hot indexes, and
+# reads must filter on deleted_at IS NULL for the planner to use them
+LIVE_ROWS = 'deleted_at IS NULL'
+
+# Columns a partial update may leave out but never set to NULL
+PATCH_REQUIRED_FIELDS: tuple[str, ...] = (
+    'employee_code',
+    'status',
+    'first_name',
+    'last_name',
+    'document_number',
+    'personal_email',
+)
+
 # Corrected parameter: to_upper instead of upper_case
 EmployeeCode = Annotated[
     str,
@@ -26,9 +66,8 @@ EmployeeCode = Annotated[
 
 
 class EmployeeBase(SQLModel):
+    # Unique among live rows: the partial index lives in Employee.__table_args__
     employee_code: EmployeeCode = Field(
-        unique=True,
-        index=True,  # Enhances search speed
         nullable=False,
         min_length=7,  # Quick pydantic validation
         max_length=7,  # Avoids huge bd strings
@@ -56,25 +95,18 @@ class EmployeeBase(SQLModel):
 class EmployeePersonalInfoBase(SQLModel):
     first_name: str = Field(max_length=100)
     last_name: str = Field(max_length=100)
+    # document_number, tax_id, personal_email and phone are unique among live rows only;
+    # see the partial indexes in EmployeePersonalInfo.__table_args__
     document_number: str = Field(
         max_length=20,
-        unique=True,
-        index=True,
         nullable=False,
         schema_extra={'example': '12345678'},
     )
-    tax_id: str | None = Field(
-        default=None,
-        max_length=50,
-        unique=True,
-        index=True,
-    )
+    tax_id: str | None = Field(default=None, max_length=50)
     gender: str | None = Field(default=None, max_length=20)
     education_level: str | None = Field(default=None, max_length=50)
-    personal_email: str = Field(
-        sa_column=Column(String(255), unique=True, nullable=False, index=True)
-    )
-    phone: str | None = Field(default=None, max_length=50, unique=True, index=True)
+    personal_email: str = Field(sa_column=Column(String(255), nullable=False))
+    phone: str | None = Field(default=None, max_length=50)
     photo: str | None = Field(
         default=None, max_length=100, description='URL or storage key(S3/GCS)'
     )
@@ -132,8 +164,65 @@ class EmployeeCreate(EmployeeBase, EmployeePersonalInfoBase):
     pass
 
 
-class EmployeeUpdate(EmployeeBase, EmployeePersonalInfoBase):
-    pass
+class EmployeePatch(SQLModel):
+    """Partial update spanning Employee and EmployeePersonalInfo.
+
+    Every field is optional and only the ones sent are written. Values are
+    normalized by the same validators as on create.
+    """
+
+    employee_code: str | None = Field(default=None, min_length=7, max_length=7)
+    status: EmployeeStatus | None = None
+    first_name: str | None = Field(default=None, max_length=100)
+    last_name: str | None = Field(default=None, max_length=100)
+    document_number: str | None = Field(default=None, max_length=20)
+    tax_id: str | None = Field(default=None, max_length=50)
+    gender: str | None = Field(default=None, max_length=20)
+    education_level: str | None = Field(default=None, max_length=50)
+    personal_email: str | None = Field(default=None, max_length=255)
+    phone: str | None = Field(default=None, max_length=50)
+    photo: str | None = Field(default=None, max_length=100)
+    nickname: str | None = Field(default=None, max_length=100)
+    city: str | None = Field(default=None, max_length=50)
+    country_id: uuid.UUID | None = None
+    address: str | None = Field(default=None, max_length=100)
+
+    # Validators
+    @field_validator('employee_code')
+    @classmethod
+    def validate_employee_code_format(cls, v: str | None) -> str | None:
+        return None if v is None else EmployeeBase.validate_employee_code_format(v)
+
+    @field_validator('personal_email', 'first_name', 'last_name', 'city')
+    @classmethod
+    def lower_case(cls, v: str | None) -> str | None:
+        return None if v is None else EmployeePersonalInfoBase.lower_case(v)
+
+    @field_validator('document_number', 'tax_id')
+    @classmethod
+    def clean_document(cls, v: str | None) -> str | None:
+        return EmployeePersonalInfoBase.clean_document(v)
+
+    @field_validator('status')
+    @classmethod
+    def not_terminated(cls, v: EmployeeStatus | None) -> EmployeeStatus | None:
+        # Terminating soft-deletes the employee; a plain field update would not
+        if v == EmployeeStatus.TERMINATED:
+            raise ValueError(
+                'Use DELETE /Employees/{id} or POST /Employees/bulk/status to terminate'
+            )
+        return v
+
+    @model_validator(mode='after')
+    def required_fields_not_null(self) -> 'EmployeePatch':
+        nulls = [
+            name
+            for name in PATCH_REQUIRED_FIELDS
+            if name in self.model_fields_set and getattr(self, name) is None
+        ]
+        if nulls:
+            raise ValueError(f'{", ".join(nulls)} cannot be null')
+        return self
 
 
 class EmployeeFinancialCreate(EmployeeFinancialInfoBase):
@@ -142,6 +231,13 @@ class EmployeeFinancialCreate(EmployeeFinancialInfoBase):
 
 class EmployeePublicResponse(EmployeeBase, EmployeePersonalInfoBase):
     id: uuid.UUID
+    # Row version; the ETag of GET /Employees/{id}, expected back in If-Match on PATCH
+    version: int
+
+
+class EmployeeFinancialInfoResponse(EmployeeFinancialInfoBase):
+    id: uuid.UUID
+    employee_id: uuid.UUID
 
 
 class EmployeeFullResponse(EmployeePublicResponse, EmployeeFinancialInfoBase):
@@ -150,38 +246,190 @@ class EmployeeFullResponse(EmployeePublicResponse, EmployeeFinancialInfoBase):
 
 class EmployeePaginationResponse(BaseModel):
     items: list[EmployeePublicResponse]
-    total: int
+    # None when include_total=none; total_kind says how it was computed
+    total: int | None
+    total_kind: TotalKind = 'exact'
     page: int
     limit: int
+    # Only filled in cursor mode; opaque tokens to pass back as `cursor`
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class EmployeeBulkCreateRequest(BaseModel):
+    # atomic: any invalid row aborts the whole batch; partial: valid rows are committed
+    mode: BulkMode = 'atomic'
+    # Raw rows: each one is validated as EmployeeCreate on its own so errors are per row
+    items: list[dict[str, Any]] = Field(min_length=1)
+
+
+class EmployeeBulkItemResult(BaseModel):
+    index: int
+    status: Literal['created', 'error', 'skipped']
+    id: uuid.UUID | None = None
+    errors: list[str] = Field(default_factory=list)
+
+
+class EmployeeBulkCreateResponse(BaseModel):
+    mode: BulkMode
+    created: int
+    failed: int
+    results: list[EmployeeBulkItemResult]
+
+
+class EmployeeImportReject(BaseModel):
+    # 1-based data row of the CSV (the header is not counted)
+    row: int
+    employee_code: str | None
+    reason: str
+
+
+class EmployeeImportResult(BaseModel):
+    received: int
+    inserted: int
+    updated: int
+    rejected: int
+    rejects: list[EmployeeImportReject]
+
+
+# Allowed bulk status changes: target status -> statuses it can be reached from.
+# TERMINATED is final: it soft-deletes the employee.
+STATUS_TRANSITIONS: dict[EmployeeStatus, tuple[EmployeeStatus, ...]] = {
+    EmployeeStatus.ACTIVE: (EmployeeStatus.INACTIVE,),
+    EmployeeStatus.INACTIVE: (EmployeeStatus.ACTIVE,),
+    EmployeeStatus.TERMINATED: (EmployeeStatus.ACTIVE, EmployeeStatus.INACTIVE),
+}
+
+
+class EmployeeFilters(BaseModel):
+    # Same filters as the employee list
+    name: str | None = None
+    status: EmployeeStatus | None = None
+    search: str | None = None
+    search_mode: SearchMode = 'contains'
+
+
+class EmployeeStatusTransitionRequest(BaseModel):
+    status: EmployeeStatus
+    # Exactly one of them selects the employees
+    ids: list[uuid.UUID] | None = Field(default=None, min_length=1)
+    filters: EmployeeFilters | None = None
+
+    @model_validator(mode='after')
+    def one_selector(self) -> 'EmployeeStatusTransitionRequest':
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError('Send either ids or filters')
+        return self
+
+
+class EmployeeStatusTransitionResult(BaseModel):
+    status: EmployeeStatus
+    updated: int
+    ids: list[uuid.UUID]
+    # Requested ids left untouched: missing, deleted or not allowed to move to `status`
+    skipped: list[uuid.UUID] = Field(default_factory=list)
 
 
 class Employee(EmployeeBase, table=True):
+    __table_args__ = (
+        Index(
+            'ix_employee_employee_code',
+            'employee_code',
+            unique=True,
+            postgresql_where=text(LIVE_ROWS),
+        ),
+        # Composite (sort key, id) indexes back the keyset pagination seeks
+        Index('ix_employee_created_at_id', 'created_at', 'id', postgresql_where=text(LIVE_ROWS)),
+        Index('ix_employee_updated_at_id', 'updated_at', 'id', postgresql_where=text(LIVE_ROWS)),
+        Index(
+            'ix_employee_employee_code_id',
+            'employee_code',
+            'id',
+            postgresql_where=text(LIVE_ROWS),
+        ),
+        # Covering index: the ETag freshness probe reads its columns with an index-only scan
+        Index(
+            'ix_employee_id_updated_at',
+            'id',
+            postgresql_include=['updated_at', 'version'],
+            postgresql_where=text(LIVE_ROWS),
+        ),
+        # Only the soft-deleted rows, oldest first: the archival job's batches
+        Index(
+            'ix_employee_deleted_at',
+            'deleted_at',
+            'id',
+            postgresql_where=text('deleted_at IS NOT NULL'),
+        ),
+        # Trigram index: serves ILIKE '%term%' and similarity (%) searches
+        Index(
+            'ix_employee_employee_code_trgm',
+            'employee_code',
+            postgresql_using='gin',
+            postgresql_ops={'employee_code': 'gin_trgm_ops'},
+        ),
+    )
+
     # The table class inherits base fields and adds DB-specific fields
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     notes: str | None = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
-        sa_column_kwargs={'onupdate': lambda: datetime.now(UTC)},
+        default_factory=utc_now,
+        sa_column_kwargs={'onupdate': utc_now},
     )
     deleted_at: datetime | None = Field(default=None)
+    # Bumped by every write to the employee or its personal info (optimistic concurrency)
+    version: int = Field(default=1, sa_column_kwargs={'server_default': text('1')})
     personal_info: Optional['EmployeePersonalInfo'] = Relationship(
         back_populates='employee', sa_relationship_kwargs={'uselist': False}
     )
+    # Current / as-of records: EmployeeRepositoryClass.get_financial_info (indexed, batched)
     financial_info: list['EmployeeFinancialInfo'] = Relationship(back_populates='employee')
 
-    @property
-    def current_financial_info(self) -> Optional['EmployeeFinancialInfo']:
-        if not self.financial_info:
-            return None
-        for info in self.financial_info:
-            if info.effective_to is None:
-                return info
-        return None
-
 
 class EmployeePersonalInfo(EmployeePersonalInfoBase, table=True):
     __tablename__ = 'employees_personal_info'
+    __table_args__ = (
+        *(
+            Index(
+                f'ix_employees_personal_info_{column}',
+                column,
+                unique=True,
+                postgresql_where=text(LIVE_ROWS),
+            )
+            for column in ('document_number', 'tax_id', 'personal_email', 'phone')
+        ),
+        Index(
+            'ix_employees_personal_info_first_name_trgm',
+            'first_name',
+            postgresql_using='gin',
+            postgresql_ops={'first_name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_employees_personal_info_last_name_trgm',
+            'last_name',
+            postgresql_using='gin',
+            postgresql_ops={'last_name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_employees_personal_info_personal_email_trgm',
+            'personal_email',
+            postgresql_using='gin',
+            postgresql_ops={'personal_email': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_employees_personal_info_search_document',
+            text(PERSONAL_INFO_SEARCH_DOCUMENT),
+            postgresql_using='gin',
+        ),
+        Index(
+            'ix_employees_personal_info_employee_id_updated_at',
+            'employee_id',
+            postgresql_include=['updated_at'],
+            postgresql_where=text(LIVE_ROWS),
+        ),
+    )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     employee_id: uuid.UUID = Field(
         foreign_key='employee.id',
@@ -189,10 +437,10 @@ class EmployeePersonalInfo(EmployeePersonalInfoBase, table=True):
         index=True,
         nullable=False,
     )
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
-        sa_column_kwargs={'onupdate': lambda: datetime.now(UTC)},
+        default_factory=utc_now,
+        sa_column_kwargs={'onupdate': utc_now},
     )
     deleted_at: datetime | None = Field(default=None)
     # inverse relationship
@@ -201,12 +449,52 @@ class EmployeePersonalInfo(EmployeePersonalInfoBase, table=True):
 
 class EmployeeFinancialInfo(EmployeeFinancialInfoBase, table=True):
     __tablename__ = 'employee_financial_info'
+    __table_args__ = (
+        # Partial index: only the current record of each employee
+        Index(
+            'ix_employee_financial_info_current',
+            'employee_id',
+            postgresql_where=text('effective_to IS NULL'),
+        ),
+        # (employee_id, period) GiST index for as-of lookups; the uuid column needs btree_gist
+        Index(
+            'ix_employee_financial_info_period',
+            'employee_id',
+            text(FINANCIAL_INFO_PERIOD),
+            postgresql_using='gist',
+        ),
+        {'postgresql_partition_by': f'RANGE ({FINANCIAL_INFO_PARTITION_KEY})'},
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     employee_id: uuid.UUID = Field(foreign_key='employee.id', index=True, nullable=False)
+    # A partitioned table's primary key must include the partition key
+    effective_from: date = Field(primary_key=True)
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
     # inverse relationship
     employee: Employee | None = Relationship(back_populates='financial_info')
+
+
+# create_all (seeders, tests) gets the catch-all partition; the yearly ones are managed
+event.listen(
+    SQLModel.metadata,
+    'after_create',
+    DDL(
+        f'CREATE TABLE IF NOT EXISTS {FINANCIAL_INFO_DEFAULT_PARTITION} '
+        f'PARTITION OF employee_financial_info DEFAULT'
+    ).execute_if(dialect='postgresql'),  # type: ignore[no-untyped-call]
+)
+
+# The trigram indexes need pg_trgm and the period index btree_gist; make sure create_all
+# (seeders, tests) can build them.
+for extension in ('pg_trgm', 'btree_gist'):
+    event.listen(
+        SQLModel.metadata,
+        'before_create',
+        DDL(f'CREATE EXTENSION IF NOT EXISTS {extension}').execute_if(  # type: ignore[no-untyped-call]
+            dialect='postgresql'
+        ),
+    )
@@ -0,0 +1,105 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal
+
+from pydantic import BaseModel
+from sqlalchemy import (
+    DDL,
+    DECIMAL,
+    BigInteger,
+    Column,
+    DateTime,
+    Enum,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    event,
+)
+from sqlmodel import SQLModel
+
+from models.employee_model import EmployeeStatus
+
+
+PayrollDimension = Literal['status', 'city', 'salary_currency_id']
+
+PAYROLL_SUMMARY_VIEW = 'payroll_summary'
+
+# Current financial record of every live employee, pre-aggregated by the finance dimensions.
+# Reads re-aggregate these few rows, so their cost does not grow with the headcount.
+PAYROLL_SUMMARY_QUERY = """
+SELECT e.status,
+       p.city,
+       f.salary_currency_id,
+       count(*) AS employees,
+       sum(f.salary_amount) AS salary_total,
+       sum(f.company_cost_amount) AS company_cost_total,
+       (now() AT TIME ZONE 'utc') AS refreshed_at
+FROM employee e
+JOIN employees_personal_info p ON p.employee_id = e.id
+JOIN employee_financial_info f ON f.employee_id = e.id AND f.effective_to IS NULL
+WHERE e.deleted_at IS NULL
+GROUP BY e.status, p.city, f.salary_currency_id
+"""
+
+# REFRESH ... CONCURRENTLY needs a unique index on the view
+PAYROLL_SUMMARY_KEY_INDEX = 'ux_payroll_summary_key'
+
+# Read-only handle on the materialized view. It lives in its own MetaData so that
+# create_all never tries to create it as a table; the DDL events below manage it.
+payroll_summary = Table(
+    PAYROLL_SUMMARY_VIEW,
+    MetaData(),
+    Column('status', Enum(EmployeeStatus, name='employeestatus', create_type=False)),
+    Column('city', String),
+    Column('salary_currency_id', Uuid),
+    Column('employees', BigInteger),
+    Column('salary_total', DECIMAL),
+    Column('company_cost_total', DECIMAL),
+    Column('refreshed_at', DateTime),
+)
+
+
+class PayrollGroup(BaseModel):
+    # Dimensions that were not grouped on stay None
+    status: EmployeeStatus | None = None
+    city: str | None = None
+    salary_currency_id: uuid.UUID | None = None
+    employees: int
+    salary_total: Decimal
+    company_cost_total: Decimal
+
+
+class PayrollSummaryResponse(BaseModel):
+    group_by: list[PayrollDimension]
+    groups: list[PayrollGroup]
+    # When the figures were computed; None until the first refresh with data
+    refreshed_at: datetime | None
+    age_seconds: float | None
+
+
+class PayrollRefreshResult(BaseModel):
+    # False when another worker was already refreshing
+    refreshed: bool
+    refreshed_at: datetime | None
+
+
+# Keep create_all / drop_all (seeders, tests) working with the view depending on the tables
+for statement in (
+    f'CREATE MATERIALIZED VIEW IF NOT EXISTS {PAYROLL_SUMMARY_VIEW} AS {PAYROLL_SUMMARY_QUERY}',
+    f'CREATE UNIQUE INDEX IF NOT EXISTS {PAYROLL_SUMMARY_KEY_INDEX} '
+    f'ON {PAYROLL_SUMMARY_VIEW} (status, city, salary_currency_id)',
+):
+    event.listen(
+        SQLModel.metadata,
+        'after_create',
+        DDL(statement).execute_if(dialect='postgresql'),  # type: ignore[no-untyped-call]
+    )
+event.listen(
+    SQLModel.metadata,
+    'before_drop',
+    DDL(f'DROP MATERIALIZED VIEW IF EXISTS {PAYROLL_SUMMARY_VIEW}').execute_if(  # type: ignore[no-untyped-call]
+        dialect='postgresql'
+    ),
+)
@@ -1,6 +1,8 @@
+from repositories.employee_import_repository import EmployeeImportRepositoryClass
 from repositories.employee_repository import EmployeeRepositoryClass
 
 
 __all__ = [
+    'EmployeeImportRepositoryClass',
     'EmployeeRepositoryClass',
 ]
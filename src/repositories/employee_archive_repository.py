@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.archive_model import ARCHIVE_TABLES, EMPLOYEE_TABLE
+
+
+def _archive_batch_sql() -> str:
+    """One statement moving a batch of employees and their rows, children first.
+
+    Each table gets a DELETE ... RETURNING feeding an INSERT into its archive. Being a
+    single statement, a batch is either fully moved or not at all.
+    """
+    # SKIP LOCKED: rows held by a concurrent transaction are left for the next batch
+    ctes = [
+        'batch AS (SELECT id FROM employee WHERE deleted_at < :cutoff '
+        'ORDER BY deleted_at, id LIMIT :batch_size FOR UPDATE SKIP LOCKED)'
+    ]
+    for source, archive in ARCHIVE_TABLES:
+        key = 'id' if source is EMPLOYEE_TABLE else 'employee_id'
+        columns = ', '.join(column.name for column in source.columns)
+        ctes.append(
+            f'moved_{source.name} AS (DELETE FROM {source.name} t USING batch b '
+            f'WHERE t.{key} = b.id RETURNING t.*)'
+        )
+        ctes.append(
+            f'archived_{source.name} AS (INSERT INTO {archive.name} ({columns}) '
+            f'SELECT {columns} FROM moved_{source.name})'
+        )
+    return f'WITH {", ".join(ctes)} SELECT count(*) FROM moved_{EMPLOYEE_TABLE.name}'
+
+
+ARCHIVE_BATCH_SQL = _archive_batch_sql()
+
+
+class EmployeeArchiveRepositoryClass:
+    """Moves soft-deleted employees, with their personal and financial rows, to the archive."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def archive_batch(self, cutoff: datetime, batch_size: int) -> int:
+        """Move up to `batch_size` employees deleted before `cutoff`; returns how many."""
+        try:
+            moved = await self.session.scalar(
+                text(ARCHIVE_BATCH_SQL), {'cutoff': cutoff, 'batch_size': batch_size}
+            )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return int(moved or 0)
@@ -0,0 +1,218 @@
+from collections.abc import AsyncIterable
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.employee_model import (
+    EMPLOYEE_CODE_PATTERN,
+    EmployeeCreate,
+    EmployeePersonalInfo,
+    EmployeeStatus,
+)
+
+
+STAGING_TABLE = 'employee_import_staging'
+
+# Columns a CSV file may carry: exactly the EmployeeCreate fields
+IMPORT_COLUMNS: tuple[str, ...] = tuple(EmployeeCreate.model_fields)
+REQUIRED_COLUMNS: tuple[str, ...] = (
+    'employee_code',
+    'first_name',
+    'last_name',
+    'document_number',
+    'personal_email',
+)
+PERSONAL_COLUMNS: tuple[str, ...] = tuple(
+    name for name in IMPORT_COLUMNS if name not in ('employee_code', 'status')
+)
+
+# Same normalization as EmployeePersonalInfoBase.lower_case / clean_document
+LOWER_CASE_COLUMNS = ('first_name', 'last_name', 'personal_email', 'city')
+DOCUMENT_COLUMNS = ('document_number', 'tax_id')
+UNIQUE_PERSONAL_COLUMNS = ('document_number', 'tax_id', 'personal_email', 'phone')
+
+UUID_PATTERN = '^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+
+
+def _normalize_expression(column: str) -> str:
+    if column == 'employee_code':
+        return 'upper(btrim(employee_code))'
+    if column == 'status':
+        return "coalesce(upper(nullif(btrim(status), '')), 'ACTIVE')"
+    if column in LOWER_CASE_COLUMNS:
+        return f"lower(nullif(btrim({column}), ''))"
+    if column in DOCUMENT_COLUMNS:
+        return f"nullif(upper(translate({column}, '-. ', '')), '')"
+    return f"nullif(btrim({column}), '')"
+
+
+def _validation_rules() -> list[tuple[str, str]]:
+    """(SQL condition, reject reason) pairs, evaluated in order."""
+    rules = [
+        (
+            'employee_code IS NULL OR employee_code !~ :code_pattern',
+            'employee_code must follow the pattern XXX-000',
+        ),
+        ('status NOT IN :statuses', 'status is not a valid employee status'),
+        # The upsert cannot soft-delete: a TERMINATED row would stay live
+        (
+            "status = 'TERMINATED'",
+            'status TERMINATED cannot be imported; terminate with DELETE or /Employees/bulk/status',
+        ),
+    ]
+    rules += [(f'{column} IS NULL', f'{column} is required') for column in REQUIRED_COLUMNS[1:]]
+    for column in PERSONAL_COLUMNS:
+        length = getattr(EmployeePersonalInfo.__table__.c[column].type, 'length', None)
+        if length:
+            rules.append((f'length({column}) > {length}', f'{column} exceeds {length} characters'))
+    rules.append(
+        ('country_id IS NOT NULL AND country_id !~ :uuid_pattern', 'country_id must be a UUID')
+    )
+    return rules
+
+
+class EmployeeImportRepositoryClass:
+    """Set-based CSV import: COPY into a temp staging table, validate, then upsert."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _execute(self, sql: str, params: dict[str, Any] | None = None) -> Any:
+        return await self.session.execute(text(sql), params or {})
+
+    async def import_csv(
+        self, source: AsyncIterable[bytes], columns: list[str]
+    ) -> tuple[int, int, int, list[tuple[int, str | None, str]]]:
+        """Load a CSV stream (header included) and merge it in one transaction.
+
+        Returns (received, inserted, updated, rejects) where each reject is
+        (data row number, employee_code, reason).
+        """
+        try:
+            await self._create_staging_table()
+            received = await self._copy(source, columns)
+            await self._normalize(columns)
+            await self._validate()
+            inserted, updated = await self._merge(columns)
+            rejects = await self._rejects()
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+
+        return received, inserted, updated, rejects
+
+    async def _create_staging_table(self) -> None:
+        column_defs = ', '.join(f'{column} text' for column in IMPORT_COLUMNS)
+        await self._execute(
+            f'CREATE TEMP TABLE {STAGING_TABLE} ('
+            f'line_no bigint GENERATED ALWAYS AS IDENTITY, {column_defs}, error text'
+            f') ON COMMIT DROP'
+        )
+
+    async def _copy(self, source: AsyncIterable[bytes], columns: list[str]) -> int:
+        # COPY runs on the session's own asyncpg connection, inside its transaction
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None:
+            raise RuntimeError('The import needs a live asyncpg connection')
+        status = await driver_connection.copy_to_table(
+            STAGING_TABLE, source=source, columns=columns, format='csv', header=True
+        )
+        await self._execute(f'ANALYZE {STAGING_TABLE}')
+        return int(status.split()[-1])
+
+    async def _normalize(self, columns: list[str]) -> None:
+        assignments = ', '.join(f'{column} = {_normalize_expression(column)}' for column in columns)
+        if 'status' not in columns:
+            assignments += ", status = 'ACTIVE'"
+        await self._execute(f'UPDATE {STAGING_TABLE} SET {assignments}')
+
+    async def _validate(self) -> None:
+        cases = ' '.join(
+            f"WHEN {condition} THEN '{reason}'" for condition, reason in _validation_rules()
+        )
+        statement = text(f'UPDATE {STAGING_TABLE} SET error = CASE {cases} END').bindparams(
+            bindparam('statuses', [status.value for status in EmployeeStatus], expanding=True),
+            code_pattern=EMPLOYEE_CODE_PATTERN,
+            uuid_pattern=UUID_PATTERN,
+        )
+        await self.session.execute(statement)
+
+        # Repeated unique values inside the file: the first occurrence wins
+        for column in ('employee_code', *UNIQUE_PERSONAL_COLUMNS):
+            await self._execute(
+                f"""
+                UPDATE {STAGING_TABLE} s
+                SET error = '{column} repeated in the file (first seen at row ' || d.first_line || ')'
+                FROM (
+                    SELECT line_no, first_value(line_no) OVER w AS first_line,
+                           row_number() OVER w AS position
+                    FROM {STAGING_TABLE}
+                    WHERE error IS NULL AND {column} IS NOT NULL
+                    WINDOW w AS (PARTITION BY {column} ORDER BY line_no)
+                ) d
+                WHERE s.line_no = d.line_no AND d.position > 1
+                """
+            )
+
+        # Unique values already owned by a different live employee
+        for column in UNIQUE_PERSONAL_COLUMNS:
+            await self._execute(
+                f"""
+                UPDATE {STAGING_TABLE} s
+                SET error = '{column} already belongs to another employee'
+                FROM employees_personal_info p
+                JOIN employee e ON e.id = p.employee_id
+                WHERE s.error IS NULL
+                  AND p.{column} = s.{column}
+                  AND p.deleted_at IS NULL
+                  AND e.employee_code <> s.employee_code
+                """
+            )
+
+    async def _merge(self, columns: list[str]) -> tuple[int, int]:
+        now = "(now() AT TIME ZONE 'utc')"
+        employee_result = await self._execute(
+            f"""
+            INSERT INTO employee (id, employee_code, status, created_at, updated_at)
+            SELECT gen_random_uuid(), employee_code, CAST(status AS employeestatus), {now}, {now}
+            FROM {STAGING_TABLE}
+            WHERE error IS NULL
+            ON CONFLICT (employee_code) WHERE deleted_at IS NULL
+            DO UPDATE SET status = EXCLUDED.status, version = employee.version + 1
+            RETURNING (xmax = 0) AS inserted
+            """
+        )
+        flags = employee_result.scalars().all()
+        inserted = sum(1 for flag in flags if flag)
+
+        values = ', '.join(
+            f'CAST(s.{column} AS uuid)' if column == 'country_id' else f's.{column}'
+            for column in PERSONAL_COLUMNS
+        )
+        # Only the columns present in the file overwrite existing values
+        updates = ', '.join(
+            f'{column} = EXCLUDED.{column}' for column in PERSONAL_COLUMNS if column in columns
+        )
+        await self._execute(
+            f"""
+            INSERT INTO employees_personal_info
+                (id, employee_id, {', '.join(PERSONAL_COLUMNS)}, created_at, updated_at)
+            SELECT gen_random_uuid(), e.id, {values}, {now}, {now}
+            FROM {STAGING_TABLE} s
+            JOIN employee e ON e.employee_code = s.employee_code AND e.deleted_at IS NULL
+            WHERE s.error IS NULL
+            ON CONFLICT (employee_id) DO UPDATE SET {updates}
+            """
+        )
+        return inserted, len(flags) - inserted
+
+    async def _rejects(self) -> list[tuple[int, str | None, str]]:
+        result = await self._execute(
+            f'SELECT line_no, employee_code, error FROM {STAGING_TABLE} '
+            f'WHERE error IS NOT NULL ORDER BY line_no'
+        )
+        return [(row.line_no, row.employee_code, row.error) for row in result]
@@ -1,24 +1,101 @@
+import json
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import date, datetime
 from typing import Any, Literal
 from uuid import UUID
 
-from sqlalchemy import asc, desc, func, or_
-from sqlmodel import Session, col, select
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    func,
+    literal_column,
+    or_,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import DATERANGE, insert as pg_insert
+from sqlalchemy.sql.elements import Label
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select
 
+from common.database import Explain
+from common.pagination import Cursor, CursorDirection, decode_cursor, encode_cursor
 from models.employee_model import (
+    FINANCIAL_INFO_PERIOD,
+    STATUS_TRANSITIONS,
     Employee,
     EmployeeBase,
     EmployeeCreate,
+    EmployeeFinancialInfo,
+    EmployeeFinancialInfoBase,
     EmployeePersonalInfo,
     EmployeePersonalInfoBase,
     EmployeeStatus,
+    SearchMode,
+    TotalKind,
+    utc_now,
+)
+from repositories.employee_search import search_predicate, search_rank
+
+
+# Columns backed by a (column, id) index, so a keyset seek never degrades to a scan
+KEYSET_SORT_COLUMNS: set[str] = {'created_at', 'updated_at', 'employee_code'}
+
+# Unique columns per table, checked up front by the bulk insert
+EMPLOYEE_UNIQUE_FIELDS: tuple[str, ...] = ('employee_code',)
+PERSONAL_INFO_UNIQUE_FIELDS: tuple[str, ...] = (
+    'document_number',
+    'tax_id',
+    'personal_email',
+    'phone',
+)
+
+# Soft-deleted rows are invisible to every read. Both tables carry the predicate so the
+# partial (WHERE deleted_at IS NULL) indexes on each side stay usable.
+LIVE_EMPLOYEE: tuple[ColumnElement[bool], ...] = (
+    col(Employee.deleted_at).is_(None),
+    col(EmployeePersonalInfo.deleted_at).is_(None),
+)
+
+# Flat columns for reads and the export: exactly the EmployeePublicResponse fields, id first.
+# Selecting them directly avoids loading two ORM entities per row and merging their dumps.
+EMPLOYEE_PUBLIC_FIELDS: tuple[str, ...] = ('id', 'version', *EmployeeBase.model_fields)
+PUBLIC_FIELDS: tuple[str, ...] = (
+    *EMPLOYEE_PUBLIC_FIELDS,
+    *EmployeePersonalInfoBase.model_fields,
 )
+PUBLIC_COLUMNS = [
+    getattr(Employee if name in EMPLOYEE_PUBLIC_FIELDS else EmployeePersonalInfo, name)
+    for name in PUBLIC_FIELDS
+]
+
+# Row version of a flat read: both updated_at columns feed the ETag / Last-Modified
+VERSION_FIELDS: tuple[str, ...] = ('employee_updated_at', 'personal_info_updated_at')
+VERSION_COLUMNS: list[Label[datetime]] = [
+    col(Employee.updated_at).label(VERSION_FIELDS[0]),
+    col(EmployeePersonalInfo.updated_at).label(VERSION_FIELDS[1]),
+]
+
+# Flat columns of a financial record: exactly the EmployeeFinancialInfoResponse fields
+FINANCIAL_FIELDS: tuple[str, ...] = ('id', 'employee_id', *EmployeeFinancialInfoBase.model_fields)
+FINANCIAL_COLUMNS = [getattr(EmployeeFinancialInfo, name) for name in FINANCIAL_FIELDS]
+# Same expression as the GiST index, so `period @> date` can use it
+FINANCIAL_PERIOD: ColumnElement[Any] = literal_column(FINANCIAL_INFO_PERIOD, type_=DATERANGE)
+
+# Rows per multi-row INSERT; keeps every statement well under the 32767 bind-parameter limit
+BULK_INSERT_CHUNK_SIZE = 1000
 
 
 class EmployeeRepositoryClass:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    def create_employee(self, employee_in: EmployeeCreate) -> Employee:
+    async def create_employee(self, employee_in: EmployeeCreate) -> Employee:
         # 1. Extraer campos de Información Personal
         # Usamos el esquema base para saber qué llaves extraer
         personal_fields = EmployeePersonalInfoBase.model_fields.keys()
@@ -37,57 +114,366 @@ class EmployeeRepositoryClass:
         # 4. Persistir en la DB
         try:
             self.session.add(db_employee)
-            self.session.commit()
-            self.session.refresh(db_employee)
+            await self.session.commit()
+            await self.session.refresh(db_employee)
             return db_employee
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise e
 
-    def update_employee(self, employee_id: int, update_data: dict[str, Any]) -> Employee | None:
-        db_employee = self.session.get(Employee, employee_id)
-        if not db_employee:
-            return None
+    async def find_existing_unique_values(self, values: dict[str, set[str]]) -> dict[str, set[str]]:
+        """Return which of the given unique-column values are already stored.
+
+        One query per table: `values` maps each unique field to the candidates.
+        """
+        existing: dict[str, set[str]] = {field: set() for field in values}
+
+        for model, fields in (
+            (Employee, EMPLOYEE_UNIQUE_FIELDS),
+            (EmployeePersonalInfo, PERSONAL_INFO_UNIQUE_FIELDS),
+        ):
+            conditions = [
+                col(getattr(model, field)).in_(values[field])
+                for field in fields
+                if values.get(field)
+            ]
+            if not conditions:
+                continue
+            columns = [getattr(model, field) for field in fields]
+            # Uniqueness only holds among live rows (partial unique indexes)
+            statement = select(*columns).where(or_(*conditions), col(model.deleted_at).is_(None))
+            rows = (await self.session.execute(statement)).all()
+            for row in rows:
+                for field, value in zip(fields, row, strict=True):
+                    if value in values.get(field, ()):
+                        existing[field].add(value)
 
-        for key, value in update_data.items():
-            setattr(db_employee, key, value)
+        return existing
 
-        self.session.add(db_employee)
-        self.session.commit()
-        self.session.refresh(db_employee)
-        return db_employee
+    async def bulk_create_employees(
+        self,
+        employees_in: list[EmployeeCreate],
+        skip_conflicts: bool = False,
+    ) -> list[UUID | None]:
+        """Insert employees with multi-row INSERT ... RETURNING, in one transaction.
+
+        Returns the new id for each input position. With `skip_conflicts`, rows that
+        hit a unique index (e.g. a concurrent insert) are skipped and come back as
+        None; otherwise the first conflict aborts the whole batch.
+        """
+        personal_fields = set(EmployeePersonalInfoBase.model_fields.keys())
+        employee_fields = set(EmployeeBase.model_fields.keys())
+
+        employee_rows: list[dict[str, Any]] = []
+        personal_rows: list[dict[str, Any]] = []
+        for employee_in in employees_in:
+            db_employee = Employee(**employee_in.model_dump(include=employee_fields))
+            db_personal_info = EmployeePersonalInfo(
+                **employee_in.model_dump(include=personal_fields), employee_id=db_employee.id
+            )
+            employee_rows.append(db_employee.model_dump())
+            personal_rows.append(db_personal_info.model_dump())
 
-    def get_employee_by_id(self, employee_id: UUID) -> dict[str, Any] | None:
-        # Realizamos el JOIN para obtener ambas partes de la información en una sola consulta
+        try:
+            inserted: set[UUID] = set()
+            for start in range(0, len(employee_rows), BULK_INSERT_CHUNK_SIZE):
+                chunk = employee_rows[start : start + BULK_INSERT_CHUNK_SIZE]
+                stmt = pg_insert(Employee).values(chunk)
+                if skip_conflicts:
+                    stmt = stmt.on_conflict_do_nothing()
+                result = await self.session.execute(stmt.returning(col(Employee.id)))
+                inserted.update(result.scalars().all())
+
+            personal_rows = [row for row in personal_rows if row['employee_id'] in inserted]
+            with_personal_info: set[UUID] = set()
+            for start in range(0, len(personal_rows), BULK_INSERT_CHUNK_SIZE):
+                chunk = personal_rows[start : start + BULK_INSERT_CHUNK_SIZE]
+                personal_stmt = pg_insert(EmployeePersonalInfo).values(chunk)
+                if skip_conflicts:
+                    personal_stmt = personal_stmt.on_conflict_do_nothing()
+                result = await self.session.execute(
+                    personal_stmt.returning(col(EmployeePersonalInfo.employee_id))
+                )
+                with_personal_info.update(result.scalars().all())
+
+            # An employee whose personal info conflicted must not be left half-created
+            orphans = inserted - with_personal_info
+            if orphans:
+                await self.session.execute(delete(Employee).where(col(Employee.id).in_(orphans)))
+
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+
+        return [row['id'] if row['id'] in with_personal_info else None for row in employee_rows]
+
+    async def patch_employee(
+        self,
+        employee_id: UUID,
+        changes: dict[str, Any],
+        versions: Collection[int] | None = None,
+    ) -> dict[str, Any] | None:
+        """Partial update of both tables in one statement; returns the new flat row.
+
+        One UPDATE ... RETURNING per table, chained as CTEs: a single round trip and a
+        single transaction. The employee row is always written, so its version goes up
+        even when only personal fields change. With `versions`, nothing is written
+        unless the current version is one of them; a status change is only written
+        when STATUS_TRANSITIONS allows it. None when no live row matched.
+        """
+        now = utc_now()
+        employee_values = {k: v for k, v in changes.items() if k in EmployeeBase.model_fields}
+        personal_values = {
+            k: v for k, v in changes.items() if k in EmployeePersonalInfoBase.model_fields
+        }
+
+        employee_update = (
+            update(Employee)
+            .where(col(Employee.id) == employee_id, col(Employee.deleted_at).is_(None))
+            .values(**employee_values, version=col(Employee.version) + 1, updated_at=now)
+        )
+        if versions is not None:
+            employee_update = employee_update.where(col(Employee.version).in_(versions))
+        if 'status' in employee_values:
+            # Same rule as the bulk transitions; keeping the current status is allowed
+            target = employee_values['status']
+            employee_update = employee_update.where(
+                col(Employee.status).in_((target, *STATUS_TRANSITIONS[target]))
+            )
+        employee = employee_update.returning(
+            *[getattr(Employee, name) for name in EMPLOYEE_PUBLIC_FIELDS],
+            col(Employee.updated_at),
+        ).cte('patched_employee')
+
+        personal_columns = [
+            col(EmployeePersonalInfo.employee_id),
+            *[
+                getattr(EmployeePersonalInfo, name)
+                for name in EmployeePersonalInfoBase.model_fields
+            ],
+            col(EmployeePersonalInfo.updated_at),
+        ]
+        personal_source = (
+            update(EmployeePersonalInfo)
+            .where(col(EmployeePersonalInfo.employee_id) == employee.c.id)
+            .values(**personal_values, updated_at=now)
+            .returning(*personal_columns)
+            if personal_values
+            else select(*personal_columns).where(
+                col(EmployeePersonalInfo.employee_id) == employee.c.id
+            )
+        )
+        personal = personal_source.cte('patched_personal_info')
+
+        columns: list[Any] = [
+            (employee if name in EMPLOYEE_PUBLIC_FIELDS else personal).c[name]
+            for name in PUBLIC_FIELDS
+        ]
+        columns += [
+            employee.c.updated_at.label(VERSION_FIELDS[0]),
+            personal.c.updated_at.label(VERSION_FIELDS[1]),
+        ]
+        statement = select(*columns).join_from(
+            employee, personal, personal.c.employee_id == employee.c.id
+        )
+
+        try:
+            row = (await self.session.execute(statement)).first()
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return row._asdict() if row else None
+
+    async def soft_delete_employee(self, employee_id: UUID) -> bool:
+        """Mark a live employee and its personal info as deleted and TERMINATED.
+
+        Returns False when there is no live employee with that id. The rows stay in
+        place, hidden from every read, until the archival job moves them out.
+        """
+        now = utc_now()
+        try:
+            result = await self.session.execute(
+                update(Employee)
+                .where(col(Employee.id) == employee_id, col(Employee.deleted_at).is_(None))
+                .values(
+                    status=EmployeeStatus.TERMINATED,
+                    deleted_at=now,
+                    updated_at=now,
+                    version=col(Employee.version) + 1,
+                )
+                .returning(col(Employee.id))
+            )
+            deleted = result.first() is not None
+            if deleted:
+                await self.session.execute(
+                    update(EmployeePersonalInfo)
+                    .where(col(EmployeePersonalInfo.employee_id) == employee_id)
+                    .values(deleted_at=now, updated_at=now)
+                )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return deleted
+
+    async def _transition_batch(
+        self,
+        status: EmployeeStatus,
+        from_statuses: Collection[EmployeeStatus],
+        selection: ColumnElement[bool],
+    ) -> list[UUID]:
+        """Move the `selection` employees that are live and in `from_statuses` to `status`.
+
+        One statement and one transaction: the UPDATE re-checks the allowed source
+        statuses on each row it locks, so a concurrent change is never overridden.
+        Moving to TERMINATED soft-deletes the personal info in the same statement.
+        """
+        now = utc_now()
+        values: dict[str, Any] = {
+            'status': status,
+            'updated_at': now,
+            'version': col(Employee.version) + 1,
+        }
+        if status == EmployeeStatus.TERMINATED:
+            values['deleted_at'] = now
+        moved = (
+            update(Employee)
+            .where(
+                selection,
+                col(Employee.status).in_(from_statuses),
+                col(Employee.deleted_at).is_(None),
+            )
+            .values(**values)
+            .returning(col(Employee.id))
+            .cte('moved_employee')
+        )
+        statement = select(moved.c.id)
+        if status == EmployeeStatus.TERMINATED:
+            hidden = (
+                update(EmployeePersonalInfo)
+                .where(col(EmployeePersonalInfo.employee_id).in_(select(moved.c.id)))
+                .values(deleted_at=now, updated_at=now)
+                .cte('hidden_personal_info')
+            )
+            statement = statement.add_cte(hidden)
+
+        try:
+            moved_ids = list((await self.session.execute(statement)).scalars().all())
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return moved_ids
+
+    async def transition_status(
+        self,
+        status: EmployeeStatus,
+        from_statuses: Collection[EmployeeStatus],
+        employee_ids: Sequence[UUID] | None = None,
+        filters: dict[str, Any] | None = None,
+        batch_size: int = 500,
+    ) -> list[UUID]:
+        """Set-based status change of many employees; returns the ids that moved.
+
+        The employees are picked by id or by the list filters, and updated at most
+        `batch_size` per UPDATE ... RETURNING, each in its own transaction, so no row
+        lock outlives its batch. `status` must not be one of `from_statuses`: a moved
+        row leaves the filtered set, which is what ends the filter loop once a batch
+        comes back empty.
+        """
+        moved: list[UUID] = []
+        if employee_ids is not None:
+            for start in range(0, len(employee_ids), batch_size):
+                chunk = employee_ids[start : start + batch_size]
+                selection = col(Employee.id).in_(chunk)
+                moved += await self._transition_batch(status, from_statuses, selection)
+            return moved
+
+        candidates = (
+            self._build_filtered_query(**(filters or {}))
+            .with_only_columns(col(Employee.id))
+            .where(col(Employee.status).in_(from_statuses))
+            .order_by(col(Employee.id))
+            .limit(batch_size)
+        )
+        selection = col(Employee.id).in_(candidates.scalar_subquery())
+        while True:
+            batch = await self._transition_batch(status, from_statuses, selection)
+            # Only an empty batch means the filtered set is exhausted: a short one may
+            # just have lost rows that a concurrent write changed during the re-check
+            if not batch:
+                return moved
+            moved += batch
+
+    async def get_employee_by_id(self, employee_id: UUID) -> dict[str, Any] | None:
+        # Realizamos el JOIN para obtener ambas partes de la información en una sola consulta,
+        # ya aplanada: solo las columnas de la respuesta pública
         statement = (
-            select(Employee, EmployeePersonalInfo)
+            select(*PUBLIC_COLUMNS, *VERSION_COLUMNS)
             .join(EmployeePersonalInfo)
-            .where(Employee.id == employee_id)
+            .where(Employee.id == employee_id, *LIVE_EMPLOYEE)
         )
 
-        result = self.session.exec(statement).first()
+        row = (await self.session.execute(statement)).first()
+        return row._asdict() if row else None
 
-        if not result:
-            return None
+    async def get_employee_versions(self, employee_id: UUID) -> dict[str, Any] | None:
+        """Freshness probe: only the id, version and updated_at columns, from covering indexes."""
+        statement = (
+            select(col(Employee.id), col(Employee.version), *VERSION_COLUMNS)
+            .join(EmployeePersonalInfo)
+            .where(Employee.id == employee_id, *LIVE_EMPLOYEE)
+        )
+        row = (await self.session.execute(statement)).first()
+        return row._asdict() if row else None
 
-        emp, info = result
-        # Aplanamos: Los campos de 'info' (first_name, etc) y 'emp' (employee_code, id)
-        # se mezclan en un único diccionario.
-        return {**info.model_dump(), **emp.model_dump()}
+    async def get_financial_info(
+        self, employee_ids: Sequence[UUID], as_of: date | None = None
+    ) -> list[dict[str, Any]]:
+        """Financial record in force for each employee, in one query for any number of ids.
 
-    def get_filtered_employees(
+        Without `as_of` it is the current record (partial index on effective_to IS NULL);
+        with it, the record whose period contains that day (GiST period index).
+        Employees without a matching record, or soft-deleted, are left out.
+        """
+        in_force: list[ColumnElement[bool]] = [col(EmployeeFinancialInfo.effective_to).is_(None)]
+        if as_of is not None:
+            day = bindparam('as_of', as_of, type_=Date)
+            # The bound on the partition key prunes the partitions starting after that day
+            in_force = [
+                FINANCIAL_PERIOD.contains(day),
+                col(EmployeeFinancialInfo.effective_from) <= day,
+            ]
+        statement = (
+            select(*FINANCIAL_COLUMNS)
+            .join(Employee)
+            .where(
+                col(EmployeeFinancialInfo.employee_id).in_(employee_ids),
+                *in_force,
+                col(Employee.deleted_at).is_(None),
+            )
+            # Overlapping periods should not exist; if they do, the latest one wins
+            .distinct(col(EmployeeFinancialInfo.employee_id))
+            .order_by(
+                col(EmployeeFinancialInfo.employee_id),
+                desc(col(EmployeeFinancialInfo.effective_from)),
+            )
+        )
+        return [row._asdict() for row in await self.session.execute(statement)]
+
+    def _build_filtered_query(
         self,
         name: str | None = None,
         status: EmployeeStatus | None = None,
-        role_id: UUID | None = None,
         search: str | None = None,
-        page: int = 1,
-        limit: int = 10,
-        sort_by: str = 'created_at',
-        order: Literal['asc', 'desc'] = 'desc',
-    ) -> tuple[list[dict[str, Any]], int]:
+        search_mode: SearchMode = 'contains',
+    ) -> Select[tuple[Employee, EmployeePersonalInfo]]:
         # 1. Base query fetching both tables to flatten later
-        base_query = select(Employee, EmployeePersonalInfo).join(EmployeePersonalInfo)
+        base_query = (
+            select(Employee, EmployeePersonalInfo).join(EmployeePersonalInfo).where(*LIVE_EMPLOYEE)
+        )
 
         # 2. Apply filters
         if status:
@@ -103,36 +489,204 @@ class EmployeeRepositoryClass:
             )
 
         if search and search.strip():
-            s = f'%{search.strip()}%'
-            base_query = base_query.where(
-                or_(
-                    col(Employee.employee_code).ilike(s),
-                    col(EmployeePersonalInfo.first_name).ilike(s),
-                    col(EmployeePersonalInfo.last_name).ilike(s),
-                    col(EmployeePersonalInfo.personal_email).ilike(s),
-                )
-            )
+            base_query = base_query.where(search_predicate(search.strip(), search_mode))
+
+        return base_query
 
-        # 3. Get total count using a subquery
+    async def _count(self, base_query: Select[tuple[Employee, EmployeePersonalInfo]]) -> int:
         count_stmt = select(func.count()).select_from(base_query.subquery())
-        total = self.session.exec(count_stmt).one()
+        return (await self.session.exec(count_stmt)).one()
+
+    async def _estimate_count(
+        self, base_query: Select[tuple[Employee, EmployeePersonalInfo]]
+    ) -> int:
+        """Row estimate from planner statistics: EXPLAIN only, nothing is scanned."""
+        plan = (await self.session.execute(Explain(base_query))).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    async def _total(
+        self,
+        base_query: Select[tuple[Employee, EmployeePersonalInfo]],
+        include_total: TotalKind,
+    ) -> int | None:
+        if include_total == 'exact':
+            return await self._count(base_query)
+        if include_total == 'estimate':
+            return await self._estimate_count(base_query)
+        return None
 
-        # 4. Apply sorting
+    async def get_filtered_employees(
+        self,
+        name: str | None = None,
+        status: EmployeeStatus | None = None,
+        role_id: UUID | None = None,
+        search: str | None = None,
+        page: int = 1,
+        limit: int = 10,
+        sort_by: str = 'created_at',
+        order: Literal['asc', 'desc'] = 'desc',
+        search_mode: SearchMode = 'contains',
+        include_total: TotalKind = 'exact',
+        versions_only: bool = False,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Flat rows of one OFFSET page plus the total.
+
+        With `versions_only` the rows carry just the id and updated_at columns: the
+        same page, cheap enough to probe before building a conditional response.
+        """
+        base_query = self._build_filtered_query(
+            name=name, status=status, search=search, search_mode=search_mode
+        )
+
+        # 3. Totals: an exact count rides along the page query as a window function,
+        # so it costs no extra round trip. Estimates come from the planner.
+        total: int | None = None
+        if include_total == 'estimate':
+            total = await self._estimate_count(base_query)
+
+        # 4. Apply sorting (ranked search modes order by relevance first)
+        rank = search_rank(search.strip(), search_mode) if search and search.strip() else None
+        if rank is not None:
+            base_query = base_query.order_by(desc(rank))
         sort_col = getattr(Employee, sort_by, Employee.created_at)
         if order == 'desc':
             base_query = base_query.order_by(desc(sort_col))
         else:
             base_query = base_query.order_by(asc(sort_col))
 
-        # 5. Execute with pagination
+        # 5. Execute with pagination, selecting the flat response columns directly
         offset_value = (page - 1) * limit
-        results = self.session.exec(base_query.offset(offset_value).limit(limit)).all()
+        columns = [col(Employee.id)] if versions_only else PUBLIC_COLUMNS
+        page_query = base_query.with_only_columns(*columns, *VERSION_COLUMNS)
+        if include_total == 'exact':
+            page_query = page_query.add_columns(func.count().over().label('total_count'))
+        rows = (await self.session.execute(page_query.offset(offset_value).limit(limit))).all()
+        items = [row._asdict() for row in rows]
+
+        if include_total == 'exact':
+            counts = [item.pop('total_count') for item in items]
+            # Past the last page the window has no row to ride on
+            total = counts[0] if counts else (await self._count(base_query) if offset_value else 0)
+
+        return items, total
+
+    async def get_employees_by_cursor(
+        self,
+        name: str | None = None,
+        status: EmployeeStatus | None = None,
+        role_id: UUID | None = None,
+        search: str | None = None,
+        cursor: str | None = None,
+        limit: int = 10,
+        sort_by: str = 'created_at',
+        order: Literal['asc', 'desc'] = 'desc',
+        search_mode: SearchMode = 'contains',
+        include_total: TotalKind = 'exact',
+        versions_only: bool = False,
+    ) -> tuple[list[dict[str, Any]], int | None, str | None, str | None]:
+        """Keyset pagination: seek past the cursor row instead of using OFFSET.
+
+        Returns the page items, the total and the next/prev cursors. The sort
+        column is always paired with Employee.id so the ordering is total; for
+        that reason ranked search modes only filter here, they do not reorder.
+        An exact total needs its own count here, since the seek predicate would
+        otherwise truncate a window count. `versions_only` works as in
+        get_filtered_employees.
+        """
+        if sort_by not in KEYSET_SORT_COLUMNS:
+            raise ValueError(
+                f'Cursor pagination only supports sort_by in {sorted(KEYSET_SORT_COLUMNS)}'
+            )
+
+        position = decode_cursor(cursor) if cursor else None
+        if position and (position.sort_by != sort_by or position.order != order):
+            raise ValueError('The cursor does not match the requested sort_by/order')
+
+        base_query = self._build_filtered_query(
+            name=name, status=status, search=search, search_mode=search_mode
+        )
+        total = await self._total(base_query, include_total)
+
+        sort_col = col(getattr(Employee, sort_by))
+        direction: CursorDirection = position.direction if position else 'next'
+        # Walking backwards means scanning in the opposite order and flipping the page after
+        scan_desc = (order == 'desc') == (direction == 'next')
+
+        if position:
+            row_key = tuple_(sort_col, col(Employee.id))
+            boundary = tuple_(position.value, position.id)
+            base_query = base_query.where(row_key < boundary if scan_desc else row_key > boundary)
+
+        if scan_desc:
+            base_query = base_query.order_by(desc(sort_col), desc(col(Employee.id)))
+        else:
+            base_query = base_query.order_by(asc(sort_col), asc(col(Employee.id)))
 
-        # 6. Flatten the results: Combine Employee and PersonalInfo into one dict
-        flattened_items = []
-        for emp, info in results:
-            # Merging dictionaries: info fields + emp fields (emp.id overrides info.id)
-            merged_data = {**info.model_dump(), **emp.model_dump()}
-            flattened_items.append(merged_data)
+        # Fetch one extra row to know whether there is another page in the scan direction
+        columns = [col(Employee.id)] if versions_only else PUBLIC_COLUMNS
+        page_query = base_query.with_only_columns(
+            *columns, *VERSION_COLUMNS, sort_col.label('sort_key')
+        )
+        items = [row._asdict() for row in await self.session.execute(page_query.limit(limit + 1))]
+        has_more = len(items) > limit
+        items = items[:limit]
+        if direction == 'prev':
+            items.reverse()
+
+        def make_cursor(item: dict[str, Any], cursor_direction: CursorDirection) -> str:
+            return encode_cursor(
+                Cursor(
+                    sort_by=sort_by,
+                    order=order,
+                    value=item['sort_key'],
+                    id=item['id'],
+                    direction=cursor_direction,
+                )
+            )
+
+        next_cursor = prev_cursor = None
+        if items:
+            first, last = items[0], items[-1]
+            if direction == 'next':
+                next_cursor = make_cursor(last, 'next') if has_more else None
+                prev_cursor = make_cursor(first, 'prev') if position else None
+            else:
+                next_cursor = make_cursor(last, 'next')
+                prev_cursor = make_cursor(first, 'prev') if has_more else None
+
+        for item in items:
+            del item['sort_key']
+        return items, total, next_cursor, prev_cursor
+
+    async def stream_filtered_employees(
+        self,
+        name: str | None = None,
+        status: EmployeeStatus | None = None,
+        role_id: UUID | None = None,
+        search: str | None = None,
+        sort_by: str = 'created_at',
+        order: Literal['asc', 'desc'] = 'desc',
+        search_mode: SearchMode = 'contains',
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream every matching row as flat dicts, `batch_size` rows at a time.
+
+        Uses a server-side cursor (stream + yield_per), so memory stays flat no
+        matter how many rows match.
+        """
+        base_query = self._build_filtered_query(
+            name=name, status=status, search=search, search_mode=search_mode
+        )
+        sort_col = col(getattr(Employee, sort_by, Employee.created_at))
+        direction = desc if order == 'desc' else asc
+        stmt = (
+            base_query.with_only_columns(*PUBLIC_COLUMNS)
+            .order_by(direction(sort_col), direction(col(Employee.id)))
+            .execution_options(yield_per=batch_size)
+        )
 
-        return flattened_items, total
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            yield [dict(row._mapping) for row in partition]
@@ -0,0 +1,66 @@
+from sqlalchemy import ColumnElement, func, literal_column, or_, union
+from sqlmodel import col, select
+
+from models.employee_model import (
+    PERSONAL_INFO_SEARCH_DOCUMENT,
+    Employee,
+    EmployeePersonalInfo,
+    SearchMode,
+)
+
+
+# Names are not natural-language words, so the 'simple' config (no stemming) is used
+SEARCH_CONFIG: ColumnElement[str] = literal_column("'simple'::regconfig")
+search_document: ColumnElement[str] = literal_column(PERSONAL_INFO_SEARCH_DOCUMENT)
+
+
+def _ts_query(term: str) -> ColumnElement[str]:
+    return func.websearch_to_tsquery(SEARCH_CONFIG, term)
+
+
+def search_predicate(term: str, mode: SearchMode = 'contains') -> ColumnElement[bool]:
+    """Build the `search` filter as an indexable `employee.id IN (...)` predicate.
+
+    An OR spanning both joined tables cannot use per-table indexes, so each table
+    is probed on its own (trigram or full-text GIN index) and the ids are unioned.
+    """
+    if mode == 'fulltext':
+        code_ids = select(Employee.id).where(Employee.employee_code == term.upper())
+        info_ids = select(EmployeePersonalInfo.employee_id).where(
+            search_document.op('@@')(_ts_query(term))
+        )
+    elif mode == 'fuzzy':
+        code_ids = select(Employee.id).where(col(Employee.employee_code).op('%')(term))
+        info_ids = select(EmployeePersonalInfo.employee_id).where(
+            or_(
+                col(EmployeePersonalInfo.first_name).op('%')(term),
+                col(EmployeePersonalInfo.last_name).op('%')(term),
+                col(EmployeePersonalInfo.personal_email).op('%')(term),
+            )
+        )
+    else:
+        pattern = f'%{term}%'
+        code_ids = select(Employee.id).where(col(Employee.employee_code).ilike(pattern))
+        info_ids = select(EmployeePersonalInfo.employee_id).where(
+            or_(
+                col(EmployeePersonalInfo.first_name).ilike(pattern),
+                col(EmployeePersonalInfo.last_name).ilike(pattern),
+                col(EmployeePersonalInfo.personal_email).ilike(pattern),
+            )
+        )
+
+    return col(Employee.id).in_(union(code_ids, info_ids))
+
+
+def search_rank(term: str, mode: SearchMode) -> ColumnElement[float] | None:
+    """Relevance score for the ranked modes; `contains` has no ranking."""
+    if mode == 'fulltext':
+        return func.ts_rank(search_document, _ts_query(term))
+    if mode == 'fuzzy':
+        return func.greatest(
+            func.similarity(Employee.employee_code, term),
+            func.similarity(EmployeePersonalInfo.first_name, term),
+            func.similarity(EmployeePersonalInfo.last_name, term),
+            func.similarity(EmployeePersonalInfo.personal_email, term),
+        )
+    return None
@@ -0,0 +1,60 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.payroll_model import PAYROLL_SUMMARY_VIEW, PayrollDimension, payroll_summary
+
+
+# Advisory lock key: one refresh at a time across every worker and host
+REFRESH_LOCK_KEY = f'refresh:{PAYROLL_SUMMARY_VIEW}'
+
+
+class PayrollRepositoryClass:
+    """Reads and refreshes the payroll_summary materialized view."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_summary(
+        self, group_by: Sequence[PayrollDimension]
+    ) -> tuple[list[dict[str, Any]], datetime | None]:
+        """Totals per requested dimensions and the time the view was last refreshed."""
+        dimensions = [payroll_summary.c[name] for name in group_by]
+        c = payroll_summary.c
+        statement = (
+            select(
+                *dimensions,
+                func.coalesce(func.sum(c.employees), 0).label('employees'),
+                func.coalesce(func.sum(c.salary_total), 0).label('salary_total'),
+                func.coalesce(func.sum(c.company_cost_total), 0).label('company_cost_total'),
+                func.max(c.refreshed_at).label('refreshed_at'),
+            )
+            .group_by(*dimensions)
+            .order_by(*dimensions)
+        )
+        rows = [row._asdict() for row in await self.session.execute(statement)]
+        stamps = [row.pop('refreshed_at') for row in rows]
+        return rows, max((stamp for stamp in stamps if stamp is not None), default=None)
+
+    async def refresh(self) -> bool:
+        """Refresh the view without blocking its readers.
+
+        Returns False without doing anything when another session holds the refresh lock.
+        """
+        try:
+            locked = await self.session.scalar(
+                text('SELECT pg_try_advisory_xact_lock(hashtext(:key))'), {'key': REFRESH_LOCK_KEY}
+            )
+            if locked:
+                await self.session.execute(
+                    text(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {PAYROLL_SUMMARY_VIEW}')
+                )
+            # Ends the transaction, which releases the lock
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return bool(locked)
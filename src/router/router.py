@@ -3,6 +3,8 @@ from fastapi import APIRouter
 from controllers import (
     employee_controller,
     health_controller,
+    metrics_controller,
+    payroll_controller,
 )
 
 
@@ -10,3 +12,5 @@ router = APIRouter()
 
 router.include_router(employee_controller.router)
 router.include_router(health_controller.router)
+router.include_router(metrics_controller.router)
+router.include_router(payroll_controller.router)
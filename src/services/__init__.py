@@ -1,8 +1,10 @@
+from services.employee_import_service import EmployeeImportService
 from services.employee_service import EmployeeService
 from services.health_service import HealthService
 
 
 __all__ = [
+    'EmployeeImportService',
     'EmployeeService',
     'HealthService',
 ]
@@ -0,0 +1,80 @@
+import csv
+from collections.abc import AsyncIterable, AsyncIterator
+
+from common.cache import CacheBackend
+from models.employee_model import EmployeeImportReject, EmployeeImportResult
+from repositories.employee_import_repository import (
+    IMPORT_COLUMNS,
+    REQUIRED_COLUMNS,
+    EmployeeImportRepositoryClass,
+)
+from services.employee_service import LIST_GENERATION
+from services.payroll_service import mark_payroll_summary_outdated
+
+
+async def _split_header(source: AsyncIterable[bytes]) -> tuple[list[str], AsyncIterator[bytes]]:
+    """Read the CSV header without consuming the stream handed to COPY."""
+    iterator = aiter(source)
+    buffered = b''
+    async for chunk in iterator:
+        buffered += chunk
+        if b'\n' in buffered:
+            break
+
+    header_line = buffered.split(b'\n', 1)[0].decode('utf-8-sig').strip()
+    header = next(csv.reader([header_line]), [])
+
+    async def replay() -> AsyncIterator[bytes]:
+        yield buffered
+        async for chunk in iterator:
+            yield chunk
+
+    return [column.strip().lower() for column in header], replay()
+
+
+class EmployeeImportService:
+    def __init__(
+        self,
+        import_repo: EmployeeImportRepositoryClass,
+        cache: CacheBackend | None = None,
+        list_cache: CacheBackend | None = None,
+    ) -> None:
+        self.import_repo = import_repo
+        self.cache = cache
+        self.list_cache = list_cache
+
+    async def import_csv(self, source: AsyncIterable[bytes]) -> EmployeeImportResult:
+        """Import an HRIS CSV dump: COPY, validate/normalize in SQL, upsert, report rejects.
+
+        The header must name EmployeeCreate fields; rows are matched to existing
+        employees by employee_code.
+        """
+        columns, stream = await _split_header(source)
+
+        unknown = [column for column in columns if column not in IMPORT_COLUMNS]
+        if unknown:
+            raise ValueError(f'Unknown CSV columns: {", ".join(unknown)}')
+        missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+        if missing:
+            raise ValueError(f'Missing required CSV columns: {", ".join(missing)}')
+        if len(set(columns)) != len(columns):
+            raise ValueError('The CSV header repeats a column')
+
+        received, inserted, updated, rejects = await self.import_repo.import_csv(stream, columns)
+        # The import does not report which employees changed: drop every cached read
+        if updated and self.cache:
+            await self.cache.clear()
+        if inserted or updated:
+            mark_payroll_summary_outdated()
+            if self.list_cache:
+                await self.list_cache.bump_generation(LIST_GENERATION)
+        return EmployeeImportResult(
+            received=received,
+            inserted=inserted,
+            updated=updated,
+            rejected=len(rejects),
+            rejects=[
+                EmployeeImportReject(row=row, employee_code=code, reason=reason)
+                for row, code, reason in rejects
+            ],
+        )
@@ -1,31 +1,230 @@
+import csv
+import hashlib
+import io
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from enum import Enum
 from typing import Any, Literal
 from uuid import UUID
 
 from fastapi import HTTPException
+from pydantic import ValidationError
+from pydantic_core import to_json
 
+from common.cache import CacheBackend
+from common.conditional import (
+    Freshness,
+    FreshnessCheck,
+    if_match_versions,
+    make_etag,
+    version_etag,
+)
+from common.config import settings
 from models.employee_model import (
+    STATUS_TRANSITIONS,
     Employee,
+    EmployeeBulkCreateRequest,
+    EmployeeBulkCreateResponse,
+    EmployeeBulkItemResult,
     EmployeeCreate,
+    EmployeeFinancialInfoResponse,
     EmployeePaginationResponse,
+    EmployeePatch,
+    EmployeePublicResponse,
     EmployeeStatus,
+    EmployeeStatusTransitionRequest,
+    EmployeeStatusTransitionResult,
+    ExportFormat,
+    SearchMode,
+    TotalKind,
+)
+from repositories.employee_repository import (
+    EMPLOYEE_UNIQUE_FIELDS,
+    PERSONAL_INFO_UNIQUE_FIELDS,
+    PUBLIC_FIELDS,
+    VERSION_FIELDS,
+    EmployeeRepositoryClass,
 )
-from repositories.employee_repository import EmployeeRepositoryClass
+from services.payroll_service import mark_payroll_summary_outdated
+
+
+def _trusted_items(rows: list[dict[str, Any]]) -> list[EmployeePublicResponse]:
+    # Rows come straight from the database columns, which already hold validated,
+    # normalized values: build the response objects without re-running the validators
+    return [EmployeePublicResponse.model_construct(**row) for row in rows]
+
+
+# Write generation of the list cache: every employee write bumps it
+LIST_GENERATION = 'employees'
+
+
+def _list_cache_key(params: dict[str, Any]) -> str:
+    """Stable key for a list query.
+
+    Text filters match case-insensitively, so they are stripped and lowercased;
+    a blank one is the same as no filter.
+    """
+    normalized = {
+        key: (value.strip().lower() or None) if key in ('name', 'search') and value else value
+        for key, value in params.items()
+    }
+    return hashlib.blake2b(repr(sorted(normalized.items())).encode(), digest_size=16).hexdigest()
+
+
+def _pop_versions(rows: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    """Take the (id, updated_at...) version of each row out of the row itself."""
+    return [(row['id'], *(row.pop(field) for field in VERSION_FIELDS)) for row in rows]
+
+
+def _freshness(
+    versions: list[tuple[Any, ...]], *extra: Any, honors_dates: bool = True
+) -> Freshness:
+    last_modified = max((max(version[1:]) for version in versions), default=None)
+    return Freshness(make_etag(*versions, *extra), last_modified, honors_dates)
+
+
+def _employee_freshness(row: dict[str, Any]) -> Freshness:
+    """Validators of a single employee: the ETag is its row version.
+
+    That lets the UPDATE of a PATCH check If-Match by itself.
+    """
+    last_modified = max(row.pop(field) for field in VERSION_FIELDS)
+    return Freshness(version_etag(row['version']), last_modified)
+
+
+def _pack(body: bytes, freshness: Freshness) -> bytes:
+    # Cached entries keep their validators, so a hit can answer a conditional GET too
+    last_modified = freshness.last_modified.isoformat() if freshness.last_modified else ''
+    return f'{freshness.etag}\n{last_modified}\n'.encode() + body
+
+
+def _unpack(raw: bytes) -> tuple[bytes, Freshness]:
+    etag, last_modified, body = raw.split(b'\n', 2)
+    return body, Freshness(
+        etag.decode(),
+        datetime.fromisoformat(last_modified.decode()) if last_modified else None,
+    )
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    # ISO 8601, as in the JSON responses
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
 
 
 class EmployeeService:
-    def __init__(self, emp_repo: EmployeeRepositoryClass) -> None:
+    def __init__(
+        self,
+        emp_repo: EmployeeRepositoryClass,
+        cache: CacheBackend | None = None,
+        list_cache: CacheBackend | None = None,
+    ) -> None:
         self.emp_repo = emp_repo
+        self.cache = cache
+        self.list_cache = list_cache
+
+    async def _invalidate(self, *employee_ids: Any) -> None:
+        if self.cache and employee_ids:
+            # A single call however many employees a bulk write touched
+            await self.cache.delete(*(str(employee_id) for employee_id in employee_ids))
+        if self.list_cache:
+            await self.list_cache.bump_generation(LIST_GENERATION)
+        mark_payroll_summary_outdated()
 
-    def update(self, employee_id: int, data: dict[str, Any]) -> Employee:
-        updated_employee = self.emp_repo.update_employee(employee_id, data)
+    async def patch_employee(
+        self, employee_id: UUID, patch: EmployeePatch, if_match: str | None
+    ) -> tuple[bytes, Freshness]:
+        """Apply a partial update guarded by If-Match; returns the new JSON and validators.
 
-        if updated_employee is None:
-            raise HTTPException(status_code=404, detail='Employee not found')
+        The version check happens inside the UPDATE itself: a concurrent edit makes
+        this one fail with 412 instead of being silently overwritten.
+        """
+        if if_match is None:
+            raise HTTPException(
+                status_code=428, detail='If-Match is required: send the ETag of the employee'
+            )
+        changes = patch.model_dump(exclude_unset=True)
+        if not changes:
+            raise ValueError('No fields to update')
 
-        return updated_employee
+        versions = if_match_versions(if_match)
+        row = await self.emp_repo.patch_employee(employee_id, changes, versions)
+        if row is None:
+            # Failure path only: tell a missing employee, a stale ETag and a refused
+            # status change apart
+            current = await self.emp_repo.get_employee_versions(employee_id)
+            if current is None:
+                raise ValueError("Employee doesn't exist")
+            stale = versions is not None and current['version'] not in versions
+            if stale or 'status' not in changes:
+                raise HTTPException(
+                    status_code=412, detail='The employee was modified since that ETag was read'
+                )
+            raise HTTPException(
+                status_code=409,
+                detail=(
+                    f'The employee cannot move to {EmployeeStatus(changes["status"]).value} '
+                    f'from its current status'
+                ),
+            )
+
+        await self._invalidate(employee_id)
+        freshness = _employee_freshness(row)
+        return _trusted_items([row])[0].model_dump_json().encode(), freshness
 
     # Search and get
-    def search_employees(
+    async def _fetch_page(
+        self,
+        filters: dict[str, Any],
+        page: int,
+        limit: int,
+        pagination: Literal['page', 'cursor'],
+        cursor: str | None,
+        include_total: TotalKind,
+        versions_only: bool,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], Freshness]:
+        """Page rows, the pagination fields of the response and their validators."""
+        if pagination == 'cursor' or cursor:
+            items, total, next_cursor, prev_cursor = await self.emp_repo.get_employees_by_cursor(
+                cursor=cursor,
+                limit=limit,
+                include_total=include_total,
+                versions_only=versions_only,
+                **filters,
+            )
+            page_fields: dict[str, Any] = {
+                'total': total,
+                'total_kind': include_total,
+                'page': 1,
+                'limit': limit,
+                'next_cursor': next_cursor,
+                'prev_cursor': prev_cursor,
+            }
+        else:
+            # Repository now returns flat dictionaries
+            safe_page = page if page > 0 else 1
+            items, total = await self.emp_repo.get_filtered_employees(
+                page=safe_page,
+                limit=limit,
+                include_total=include_total,
+                versions_only=versions_only,
+                **filters,
+            )
+            page_fields = {
+                'total': total,
+                'total_kind': include_total,
+                'page': page,
+                'limit': limit,
+            }
+
+        # A row leaving the page does not move any updated_at: only the ETag sees it
+        freshness = _freshness(_pop_versions(items), *page_fields.values(), honors_dates=False)
+        return items, page_fields, freshness
+
+    async def search_employees(
         self,
         name: str | None = None,
         status: EmployeeStatus | None = None,
@@ -35,28 +234,297 @@ class EmployeeService:
         limit: int = 10,
         sort_by: str = 'created_at',
         order: Literal['asc', 'desc'] = 'desc',
-    ) -> EmployeePaginationResponse:
-        """Fetch employees and return a structured pagination response."""
-        # Repository now returns flat dictionaries
-        safe_page = page if page > 0 else 1
-        items, total = self.emp_repo.get_filtered_employees(
+        pagination: Literal['page', 'cursor'] = 'page',
+        cursor: str | None = None,
+        search_mode: SearchMode = 'contains',
+        include_total: TotalKind = 'exact',
+        is_fresh: FreshnessCheck | None = None,
+    ) -> tuple[EmployeePaginationResponse | None, Freshness]:
+        """Fetch employees and return a structured pagination response.
+
+        `page` mode keeps the classic OFFSET paging; `cursor` mode (or any
+        request carrying a cursor) seeks by the sort key, so deep pages cost
+        the same as the first one.
+
+        With `is_fresh` (a conditional request), a versions-only probe of the page
+        runs first; when the client's copy is current the response is None.
+        """
+        filters: dict[str, Any] = {
+            'name': name,
+            'status': status,
+            'role_id': role_id,
+            'search': search,
+            'sort_by': sort_by,
+            'order': order,
+            'search_mode': search_mode,
+        }
+        paging = (filters, page, limit, pagination, cursor, include_total)
+
+        if is_fresh is not None:
+            _, _, freshness = await self._fetch_page(*paging, versions_only=True)
+            if is_fresh(freshness):
+                return None, freshness
+
+        items, page_fields, freshness = await self._fetch_page(*paging, versions_only=False)
+        response = EmployeePaginationResponse.model_construct(
+            items=_trusted_items(items), **page_fields
+        )
+        return response, freshness
+
+    async def search_employees_json(
+        self, is_fresh: FreshnessCheck | None = None, **params: Any
+    ) -> tuple[bytes | None, Freshness]:
+        """Rendered list page and its validators, read through the list cache.
+
+        `params` are the search_employees arguments. Entries are keyed on the
+        normalized query and the current write generation, so a write makes every
+        cached page unreachable at once.
+        """
+        key = None
+        if self.list_cache:
+            generation = await self.list_cache.generation(LIST_GENERATION)
+            key = f'{generation}:{_list_cache_key(params)}'
+            cached = await self.list_cache.get(key)
+            if cached is not None:
+                body, freshness = _unpack(cached)
+                return (None if is_fresh and is_fresh(freshness) else body), freshness
+
+        response, freshness = await self.search_employees(**params, is_fresh=is_fresh)
+        if response is None:
+            return None, freshness
+        body = response.model_dump_json().encode()
+        if self.list_cache and key:
+            await self.list_cache.set(key, _pack(body, freshness))
+        return body, freshness
+
+    async def _load_employee(self, employee_id: UUID) -> tuple[EmployeePublicResponse, Freshness]:
+        employee_dict = await self.emp_repo.get_employee_by_id(employee_id)
+        if not employee_dict:
+            raise ValueError("Employee doesn't exist")
+        freshness = _employee_freshness(employee_dict)
+        return _trusted_items([employee_dict])[0], freshness
+
+    async def get_employee_by_id(self, employee_id: UUID) -> EmployeePublicResponse:
+        employee, _ = await self._load_employee(employee_id)
+        return employee
+
+    async def get_employee_json(
+        self, employee_id: UUID, is_fresh: FreshnessCheck | None = None
+    ) -> tuple[bytes | None, Freshness]:
+        """Rendered employee JSON and its validators, read through the cache.
+
+        A hit is served from the cache alone: the session never checks out a connection.
+        With `is_fresh`, a miss first runs the index-only version probe; when the
+        client's copy is current the body is None and nothing is rendered.
+        """
+        key = str(employee_id)
+        if self.cache:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                body, freshness = _unpack(cached)
+                return (None if is_fresh and is_fresh(freshness) else body), freshness
+
+        if is_fresh is not None:
+            versions = await self.emp_repo.get_employee_versions(employee_id)
+            if not versions:
+                raise ValueError("Employee doesn't exist")
+            freshness = _employee_freshness(versions)
+            if is_fresh(freshness):
+                return None, freshness
+
+        employee, freshness = await self._load_employee(employee_id)
+        body = employee.model_dump_json().encode()
+        if self.cache:
+            await self.cache.set(key, _pack(body, freshness))
+        return body, freshness
+
+    async def get_financial_info(
+        self, employee_id: UUID, as_of: date | None = None
+    ) -> EmployeeFinancialInfoResponse:
+        rows = await self.emp_repo.get_financial_info([employee_id], as_of)
+        if not rows:
+            when = f' on {as_of.isoformat()}' if as_of else ''
+            raise ValueError(f'Employee has no financial info{when}')
+        return EmployeeFinancialInfoResponse.model_construct(**rows[0])
+
+    async def get_financial_info_batch(
+        self, employee_ids: list[UUID], as_of: date | None = None
+    ) -> list[EmployeeFinancialInfoResponse]:
+        """Records in force for several employees; those without one are left out."""
+        unique_ids = list(dict.fromkeys(employee_ids))
+        if len(unique_ids) > settings.employee_bulk_max_items:
+            raise ValueError(f'At most {settings.employee_bulk_max_items} employee ids per request')
+        rows = await self.emp_repo.get_financial_info(unique_ids, as_of)
+        return [EmployeeFinancialInfoResponse.model_construct(**row) for row in rows]
+
+    async def delete_employee(self, employee_id: UUID) -> None:
+        if not await self.emp_repo.soft_delete_employee(employee_id):
+            raise ValueError("Employee doesn't exist")
+        await self._invalidate(employee_id)
+
+    async def transition_status(
+        self, request: EmployeeStatusTransitionRequest
+    ) -> EmployeeStatusTransitionResult:
+        """Move many employees to a new status with set-based UPDATEs.
+
+        Only the changes in STATUS_TRANSITIONS are applied; the database checks the
+        current status of each row, so employees in any other state are skipped.
+        """
+        from_statuses = STATUS_TRANSITIONS[request.status]
+        batch_size = settings.employee_status_batch_size
+        requested = list(dict.fromkeys(request.ids or []))
+        if len(requested) > settings.employee_bulk_max_items:
+            raise ValueError(
+                f'At most {settings.employee_bulk_max_items} employee ids per request; '
+                f'use filters for larger sets'
+            )
+        if request.filters is not None:
+            moved = await self.emp_repo.transition_status(
+                request.status,
+                from_statuses,
+                filters=request.filters.model_dump(),
+                batch_size=batch_size,
+            )
+        else:
+            moved = await self.emp_repo.transition_status(
+                request.status, from_statuses, employee_ids=requested, batch_size=batch_size
+            )
+
+        if moved:
+            await self._invalidate(*moved)
+        moved_set = set(moved)
+        return EmployeeStatusTransitionResult(
+            status=request.status,
+            updated=len(moved),
+            ids=moved,
+            skipped=[employee_id for employee_id in requested if employee_id not in moved_set],
+        )
+
+    async def create_employee(self, employee: EmployeeCreate) -> Employee:
+        created = await self.emp_repo.create_employee(employee)
+        await self._invalidate(created.id)
+        return created
+
+    async def bulk_create_employees(
+        self, request: EmployeeBulkCreateRequest
+    ) -> EmployeeBulkCreateResponse:
+        """Validate a batch of employees as a whole and insert the valid ones.
+
+        Rows are checked for schema errors, duplicates inside the batch and values
+        already stored, before anything is written. In `atomic` mode a single bad
+        row rejects the batch; in `partial` mode only the bad rows are dropped.
+        """
+        if len(request.items) > settings.employee_bulk_max_items:
+            raise ValueError(
+                f'A bulk request accepts at most {settings.employee_bulk_max_items} employees'
+            )
+
+        results = [
+            EmployeeBulkItemResult(index=i, status='error') for i in range(len(request.items))
+        ]
+        valid: dict[int, EmployeeCreate] = {}
+
+        # 1. Schema validation, row by row
+        for index, raw in enumerate(request.items):
+            try:
+                valid[index] = EmployeeCreate.model_validate(raw)
+            except ValidationError as err:
+                results[index].errors = [
+                    f'{".".join(str(loc) for loc in error["loc"])}: {error["msg"]}'
+                    for error in err.errors()
+                ]
+
+        # 2. Unique values repeated inside the batch (the first occurrence wins)
+        unique_fields = EMPLOYEE_UNIQUE_FIELDS + PERSONAL_INFO_UNIQUE_FIELDS
+        seen: dict[str, set[str]] = {field: set() for field in unique_fields}
+        for index, employee in valid.items():
+            for field in unique_fields:
+                value = getattr(employee, field)
+                if value is None:
+                    continue
+                if value in seen[field]:
+                    results[index].errors.append(f'{field}: duplicated within the batch')
+                seen[field].add(value)
+
+        # 3. Unique values already stored, one query per table
+        existing = await self.emp_repo.find_existing_unique_values(seen)
+        for index, employee in valid.items():
+            for field in unique_fields:
+                if getattr(employee, field) in existing[field]:
+                    results[index].errors.append(f'{field}: already exists')
+
+        insertable = {index: emp for index, emp in valid.items() if not results[index].errors}
+        has_errors = len(insertable) < len(request.items)
+
+        if request.mode == 'atomic' and has_errors:
+            for index in insertable:
+                results[index].status = 'skipped'
+            return EmployeeBulkCreateResponse(
+                mode=request.mode,
+                created=0,
+                failed=len(request.items) - len(insertable),
+                results=results,
+            )
+
+        # 4. Multi-row INSERT ... RETURNING for every table
+        new_ids = await self.emp_repo.bulk_create_employees(
+            list(insertable.values()), skip_conflicts=request.mode == 'partial'
+        )
+        for index, new_id in zip(insertable, new_ids, strict=True):
+            if new_id is None:
+                results[index].errors.append('conflicts with a row inserted concurrently')
+            else:
+                results[index].status = 'created'
+                results[index].id = new_id
+
+        created = sum(result.status == 'created' for result in results)
+        if created:
+            await self._invalidate()
+        return EmployeeBulkCreateResponse(
+            mode=request.mode,
+            created=created,
+            failed=len(request.items) - created,
+            results=results,
+        )
+
+    async def export_employees(
+        self,
+        export_format: ExportFormat = 'csv',
+        name: str | None = None,
+        status: EmployeeStatus | None = None,
+        role_id: UUID | None = None,
+        search: str | None = None,
+        sort_by: str = 'created_at',
+        order: Literal['asc', 'desc'] = 'desc',
+        search_mode: SearchMode = 'contains',
+    ) -> AsyncIterator[bytes]:
+        """Render every matching employee as CSV or NDJSON, one chunk per DB batch."""
+        batches = self.emp_repo.stream_filtered_employees(
             name=name,
             status=status,
             role_id=role_id,
             search=search,
-            page=safe_page,
-            limit=limit,
             sort_by=sort_by,
             order=order,
+            search_mode=search_mode,
         )
 
-        return EmployeePaginationResponse(items=items, total=total, page=page, limit=limit)
-
-    def get_employee_by_id(self, employee_id: UUID) -> dict[str, Any]:
-        employee_dict = self.emp_repo.get_employee_by_id(employee_id)
-        if not employee_dict:
-            raise ValueError("Employee doesn't exist")
-        return employee_dict
+        if export_format == 'ndjson':
+            # Same encoding as the JSON responses (ISO 8601 timestamps, enum values)
+            async for batch in batches:
+                yield b''.join(to_json(row) + b'\n' for row in batch)
+            return
 
-    def create_employee(self, employee: EmployeeCreate) -> Employee:
-        return self.emp_repo.create_employee(employee)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(PUBLIC_FIELDS)
+        async for batch in batches:
+            writer.writerows(
+                [_export_value(row[field]) for field in PUBLIC_FIELDS] for row in batch
+            )
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        # Header only when nothing matched
+        if buffer.tell():
+            yield buffer.getvalue().encode()
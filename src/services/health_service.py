@@ -1,12 +1,13 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 class HealthService:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    def check(self) -> dict[str, str]:
+    async def check(self) -> dict[str, str]:
         # Usamos select(1) que devuelve un objeto Select,
         # compatible con session.exec() y el tipado de MyPy.
-        self.session.exec(select(1))
+        await self.session.exec(select(1))
         return {'status': 'ok'}
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from common.config import settings
+from common.database import async_engine
+from models.employee_model import utc_now
+from models.payroll_model import (
+    PayrollDimension,
+    PayrollGroup,
+    PayrollRefreshResult,
+    PayrollSummaryResponse,
+)
+from repositories.payroll_repository import PayrollRepositoryClass
+
+
+logger = logging.getLogger('app.payroll')
+
+# Set by employee writes in this worker: the refresher runs early instead of waiting out
+# the full interval. Writes made by other workers are picked up by their own refresher.
+_summary_outdated = asyncio.Event()
+
+
+def mark_payroll_summary_outdated() -> None:
+    _summary_outdated.set()
+
+
+class PayrollService:
+    def __init__(self, payroll_repo: PayrollRepositoryClass) -> None:
+        self.payroll_repo = payroll_repo
+
+    async def get_summary(self, group_by: Sequence[PayrollDimension]) -> PayrollSummaryResponse:
+        dimensions = list(dict.fromkeys(group_by))
+        rows, refreshed_at = await self.payroll_repo.get_summary(dimensions)
+        age_seconds = None
+        if refreshed_at is not None:
+            age_seconds = round((utc_now() - refreshed_at).total_seconds(), 3)
+        return PayrollSummaryResponse(
+            group_by=dimensions,
+            groups=[PayrollGroup.model_construct(**row) for row in rows],
+            refreshed_at=refreshed_at,
+            age_seconds=age_seconds,
+        )
+
+    async def refresh(self) -> PayrollRefreshResult:
+        refreshed = await self.payroll_repo.refresh()
+        _, refreshed_at = await self.payroll_repo.get_summary([])
+        return PayrollRefreshResult(refreshed=refreshed, refreshed_at=refreshed_at)
+
+
+async def refresh_payroll_summary_forever(
+    interval: float = settings.payroll_summary_refresh_seconds,
+    min_interval: float = settings.payroll_summary_min_refresh_seconds,
+) -> None:
+    """Refresh the summary every `interval` seconds, or sooner after a local write.
+
+    `min_interval` spaces refreshes out during write bursts. Every worker runs this
+    loop; the advisory lock makes concurrent refreshes a no-op.
+    """
+    while True:
+        try:
+            await asyncio.wait_for(_summary_outdated.wait(), timeout=interval)
+        except TimeoutError:
+            pass
+        _summary_outdated.clear()
+        try:
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                await PayrollRepositoryClass(session).refresh()
+        except Exception:
+            logger.warning('Payroll summary refresh failed', exc_info=True)
+        await asyncio.sleep(min_interval)
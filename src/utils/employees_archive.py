@@ -0,0 +1,42 @@
+import asyncio
+from datetime import timedelta
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from common.config import settings
+from common.database import async_engine
+from models.employee_model import utc_now
+from repositories.employee_archive_repository import EmployeeArchiveRepositoryClass
+
+
+async def _archive(older_than_days: int, batch_size: int, pause: float) -> int:
+    cutoff = utc_now() - timedelta(days=older_than_days)
+    total = 0
+    try:
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            repo = EmployeeArchiveRepositoryClass(session)
+            # Short transactions: locks and WAL stay bounded whatever the backlog size
+            while moved := await repo.archive_batch(cutoff, batch_size):
+                total += moved
+                print(f'  {total} employees archived')
+                if moved < batch_size:
+                    break
+                await asyncio.sleep(pause)
+    finally:
+        await async_engine.dispose()
+    return total
+
+
+def archive_terminated_employees(
+    older_than_days: int | None = None,
+    batch_size: int | None = None,
+    pause: float = 0.0,
+) -> int:
+    """Mueve a las tablas de archivo los empleados dados de baja hace más de N días."""
+    if older_than_days is None:
+        older_than_days = settings.archive_after_days
+    if batch_size is None:
+        batch_size = settings.archive_batch_size
+    if older_than_days < 0 or batch_size < 1:
+        raise ValueError('older_than_days must be >= 0 and batch_size >= 1')
+    return asyncio.run(_archive(older_than_days, batch_size, pause))
@@ -0,0 +1,301 @@
+"""High-volume, deterministic seeder for load-test datasets.
+
+Rows are generated in a process pool and loaded with COPY. Each employee is built
+from its own RNG seeded with (seed, index), so the same seed and shape always produce
+the same rows, whatever the worker count or batch size.
+"""
+
+import csv
+import io
+import random
+import string
+import time
+import unicodedata
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from functools import cache
+from typing import Any
+
+from faker import Faker
+from sqlalchemy import Table
+from sqlmodel import SQLModel
+
+from common.database import engine
+from models.employee_model import (
+    Employee,
+    EmployeeFinancialInfo,
+    EmployeePersonalInfo,
+    EmployeeStatus,
+)
+from models.payroll_model import PAYROLL_SUMMARY_VIEW
+from utils.financial_partitions import ensure_partitions
+
+
+EMPLOYEE_TABLE: Table = Employee.__table__
+PERSONAL_INFO_TABLE: Table = EmployeePersonalInfo.__table__
+FINANCIAL_INFO_TABLE: Table = EmployeeFinancialInfo.__table__
+SEED_TABLES = (EMPLOYEE_TABLE, PERSONAL_INFO_TABLE, FINANCIAL_INFO_TABLE)
+
+# employee_code is XXX-000: 26^3 letter prefixes x 1000 numbers
+MAX_EMPLOYEES = 26**3 * 1000
+NAME_POOL_SIZE = 2000
+# Fixed reference date so timestamps do not depend on when the seeder runs
+EPOCH = datetime(2026, 1, 1)
+# Employees are hired within this many years before EPOCH
+HISTORY_YEARS = 5
+CURRENCY_IDS = {
+    code: uuid.uuid5(uuid.NAMESPACE_URL, f'currency:{code}') for code in ('USD', 'EUR', 'COP')
+}
+COUNTRY_ID = uuid.uuid5(uuid.NAMESPACE_URL, 'country:CO')
+
+
+@dataclass(frozen=True)
+class SeedShape:
+    """Distribution of the generated dataset."""
+
+    seed: int = 42
+    status_mix: dict[EmployeeStatus, float] = field(
+        default_factory=lambda: {
+            EmployeeStatus.ACTIVE: 0.85,
+            EmployeeStatus.INACTIVE: 0.10,
+            EmployeeStatus.TERMINATED: 0.05,
+        }
+    )
+    # Financial records per employee (inclusive range); the last one is the current one
+    history_depth: tuple[int, int] = (1, 4)
+    city_mix: dict[str, float] = field(
+        default_factory=lambda: {
+            'bogotá': 0.35,
+            'medellín': 0.25,
+            'cali': 0.15,
+            'barranquilla': 0.10,
+            'cartagena': 0.08,
+            'bucaramanga': 0.07,
+        }
+    )
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse 'A=0.7,B=0.3' into weights."""
+    weights: dict[str, float] = {}
+    for part in spec.split(','):
+        name, sep, weight = part.partition('=')
+        if not sep or not name.strip():
+            raise ValueError(f'Invalid weight {part!r}, expected NAME=WEIGHT')
+        weights[name.strip()] = float(weight)
+    if not weights or any(weight < 0 for weight in weights.values()):
+        raise ValueError('Weights must be non-negative')
+    if sum(weights.values()) <= 0:
+        raise ValueError('At least one weight must be positive')
+    return weights
+
+
+def shape_from_options(
+    seed: int, status_mix: str, history: str, cities: str | None = None
+) -> SeedShape:
+    """Build a SeedShape from CLI options like 'ACTIVE=0.9,INACTIVE=0.1' and '1-4'."""
+    low, _, high = history.partition('-')
+    shape = SeedShape(
+        seed=seed,
+        status_mix={EmployeeStatus(name.upper()): w for name, w in parse_mix(status_mix).items()},
+        history_depth=(int(low), int(high or low)),
+    )
+    if cities:
+        shape = replace(shape, city_mix={c.lower(): w for c, w in parse_mix(cities).items()})
+    return shape
+
+
+@cache
+def _name_pools(seed: int) -> tuple[list[str], list[str]]:
+    faker = Faker('es_CO')
+    faker.seed_instance(seed)
+    first_names = [faker.first_name().lower() for _ in range(NAME_POOL_SIZE)]
+    last_names = [faker.last_name().lower() for _ in range(NAME_POOL_SIZE)]
+    return first_names, last_names
+
+
+def _employee_code(index: int) -> str:
+    prefix, number = divmod(index, 1000)
+    letters = ''.join(string.ascii_uppercase[(prefix // 26**power) % 26] for power in (2, 1, 0))
+    return f'{letters}-{number:03d}'
+
+
+def _ascii(value: str) -> str:
+    folded = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode()
+    return folded.replace(' ', '')
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _employee_rows(
+    shape: SeedShape, index: int
+) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+    rng = random.Random(shape.seed * MAX_EMPLOYEES + index)
+    first_names, last_names = _name_pools(shape.seed)
+
+    employee_id = _uuid(rng)
+    status = rng.choices(list(shape.status_mix), weights=list(shape.status_mix.values()))[0]
+    created_at = EPOCH - timedelta(seconds=rng.randrange(HISTORY_YEARS * 365 * 86400))
+    deleted_at = None
+    if status == EmployeeStatus.TERMINATED:
+        deleted_at = created_at + (EPOCH - created_at) * rng.random()
+    employee = {
+        'id': employee_id,
+        'employee_code': _employee_code(index),
+        'status': status.name,
+        'notes': None,
+        'created_at': created_at,
+        'updated_at': created_at,
+        'deleted_at': deleted_at,
+        'version': 1,
+    }
+
+    first_name, last_name = rng.choice(first_names), rng.choice(last_names)
+    personal_info = {
+        'id': _uuid(rng),
+        'employee_id': employee_id,
+        'first_name': first_name,
+        'last_name': last_name,
+        'document_number': f'{1_000_000_000 + index}',
+        'tax_id': None,
+        'gender': rng.choice(('female', 'male')),
+        'education_level': None,
+        'personal_email': f'{_ascii(first_name)}.{_ascii(last_name)}.{index}@example.com',
+        'phone': f'+57 3{index:09d}',
+        'photo': None,
+        'nickname': None,
+        'city': rng.choices(list(shape.city_mix), weights=list(shape.city_mix.values()))[0],
+        'country_id': COUNTRY_ID,
+        'address': None,
+        'created_at': created_at,
+        'updated_at': created_at,
+        'deleted_at': deleted_at,
+    }
+
+    depth = rng.randint(*shape.history_depth)
+    salary = Decimal(rng.randrange(2000, 8000))
+    currency_id = rng.choice(list(CURRENCY_IDS.values()))
+    effective_from = created_at.date()
+    last_day = (deleted_at or EPOCH).date()
+    span = max((last_day - effective_from).days // depth, 1)
+    financial_info = []
+    for position in range(depth):
+        effective_to: date | None = None
+        if position < depth - 1:
+            effective_to = effective_from + timedelta(days=span - 1)
+        stamp = datetime.combine(effective_from, datetime.min.time())
+        financial_info.append(
+            {
+                'id': _uuid(rng),
+                'employee_id': employee_id,
+                'salary_amount': salary,
+                'salary_currency_id': currency_id,
+                'company_cost_amount': (salary * Decimal('1.25')).quantize(Decimal('1')),
+                'effective_from': effective_from,
+                'effective_to': effective_to,
+                'created_at': stamp,
+                'updated_at': stamp,
+            }
+        )
+        effective_from += timedelta(days=span)
+        salary = (salary * Decimal(str(1 + rng.randint(2, 12) / 100))).quantize(Decimal('1'))
+    return employee, personal_info, financial_info
+
+
+def _csv_writer(buffer: io.StringIO) -> Any:
+    return csv.writer(buffer, lineterminator='\n')
+
+
+def build_batch(shape: SeedShape, start: int, count: int) -> dict[str, bytes]:
+    """Generate employees [start, start + count) as CSV payloads keyed by table name."""
+    buffers = {table.name: io.StringIO() for table in SEED_TABLES}
+    writers = {name: _csv_writer(buffer) for name, buffer in buffers.items()}
+    columns = {table.name: [column.name for column in table.columns] for table in SEED_TABLES}
+
+    for index in range(start, start + count):
+        employee, personal_info, financial_info = _employee_rows(shape, index)
+        for table, rows in (
+            (EMPLOYEE_TABLE, [employee]),
+            (PERSONAL_INFO_TABLE, [personal_info]),
+            (FINANCIAL_INFO_TABLE, financial_info),
+        ):
+            writer = writers[table.name]
+            for row in rows:
+                writer.writerow([row[column] for column in columns[table.name]])
+
+    return {name: buffer.getvalue().encode() for name, buffer in buffers.items()}
+
+
+def _build_batch(args: tuple[SeedShape, int, int]) -> dict[str, bytes]:
+    return build_batch(*args)
+
+
+def _batches(qty: int, batch_size: int, shape: SeedShape) -> Iterator[tuple[SeedShape, int, int]]:
+    for start in range(0, qty, batch_size):
+        yield shape, start, min(batch_size, qty - start)
+
+
+def bulk_seed_employees(
+    qty: int,
+    shape: SeedShape | None = None,
+    batch_size: int = 10_000,
+    workers: int | None = None,
+) -> None:
+    """Recreate the schema and load `qty` generated employees with COPY.
+
+    Secondary indexes are dropped during the load and rebuilt once at the end,
+    which is much cheaper than maintaining them row by row.
+    """
+    shape = shape or SeedShape()
+    if not 0 < qty <= MAX_EMPLOYEES:
+        raise ValueError(f'qty must be between 1 and {MAX_EMPLOYEES}')
+    low, high = shape.history_depth
+    if not 1 <= low <= high:
+        raise ValueError('history_depth must be a range like (1, 4)')
+
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    indexes = [index for table in SEED_TABLES for index in table.indexes]
+    with engine.begin() as connection:
+        # Every generated effective_from falls in these years: nothing goes to the default
+        ensure_partitions(connection, EPOCH.year - HISTORY_YEARS, EPOCH.year + 1)
+        for index in indexes:
+            index.drop(connection)
+
+    started = time.perf_counter()
+    print(f'🌱 Generating {qty} employees (seed={shape.seed})...')
+    raw_connection = engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order: the load order is deterministic too
+            for loaded, payloads in enumerate(
+                pool.map(_build_batch, _batches(qty, batch_size, shape)), start=1
+            ):
+                for table in SEED_TABLES:
+                    column_list = ', '.join(column.name for column in table.columns)
+                    cursor.copy_expert(
+                        f'COPY {table.name} ({column_list}) FROM STDIN WITH (FORMAT csv)',
+                        io.BytesIO(payloads[table.name]),
+                    )
+                raw_connection.commit()
+                print(f'  {min(loaded * batch_size, qty)}/{qty}')
+        cursor.close()
+    finally:
+        raw_connection.close()
+
+    print('🔧 Rebuilding indexes...')
+    with engine.begin() as connection:
+        for index in indexes:
+            index.create(connection)
+        for table in SEED_TABLES:
+            connection.exec_driver_sql(f'ANALYZE {table.name}')
+        connection.exec_driver_sql(f'REFRESH MATERIALIZED VIEW {PAYROLL_SUMMARY_VIEW}')
+
+    print(f'✨ Seeded {qty} employees in {time.perf_counter() - started:.1f}s.')
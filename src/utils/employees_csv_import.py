@@ -0,0 +1,43 @@
+import asyncio
+import csv
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from common.database import async_engine
+from models.employee_model import EmployeeImportResult
+from repositories.employee_import_repository import EmployeeImportRepositoryClass
+from services.employee_import_service import EmployeeImportService
+
+
+READ_CHUNK_SIZE = 1 << 20
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open('rb') as file:
+        while chunk := file.read(READ_CHUNK_SIZE):
+            yield chunk
+
+
+async def _import(path: Path) -> EmployeeImportResult:
+    try:
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            service = EmployeeImportService(EmployeeImportRepositoryClass(session))
+            return await service.import_csv(_read_chunks(path))
+    finally:
+        await async_engine.dispose()
+
+
+def import_employees_csv(path: str, rejects_path: str | None = None) -> EmployeeImportResult:
+    """Importa un CSV de empleados y opcionalmente escribe el reporte de rechazos."""
+    result = asyncio.run(_import(Path(path)))
+
+    if rejects_path:
+        with open(rejects_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['row', 'employee_code', 'reason'])
+            for reject in result.rejects:
+                writer.writerow([reject.row, reject.employee_code or '', reject.reason])
+
+    return result
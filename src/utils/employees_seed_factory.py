@@ -15,6 +15,7 @@ from models.employee_model import (
     EmployeePersonalInfo,
     EmployeeStatus,
 )
+from utils.financial_partitions import ensure_partitions
 
 
 T = TypeVar('T')
@@ -74,6 +75,10 @@ def seed_employees(n: int = 10) -> None:
     """Explicitly exported function for seed.py."""
     SQLModel.metadata.drop_all(engine)
     SQLModel.metadata.create_all(engine)
+    this_year = datetime.now(UTC).year
+    with engine.begin() as connection:
+        # effective_from is drawn from the last year
+        ensure_partitions(connection, this_year - 1, this_year + 1)
 
     with Session(engine) as session:
         print(f'🌱 Generating {n} employees...')
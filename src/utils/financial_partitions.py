@@ -0,0 +1,178 @@
+"""Yearly range partitions of employee_financial_info.
+
+Partitions are created ahead of time so new payroll rows never land in the default
+partition. Rows that did land there (back-dated or far-future records) are moved into
+the matching partition when it is created. Old partitions can be detached, leaving
+a standalone table, or archived into employee_financial_info_archive and dropped.
+"""
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import Connection, text
+
+from common.config import settings
+from common.database import engine
+from models.archive_model import FINANCIAL_INFO_TABLE, employee_financial_info_archive
+from models.employee_model import FINANCIAL_INFO_DEFAULT_PARTITION, FINANCIAL_INFO_PARTITION_KEY
+
+
+PARENT = FINANCIAL_INFO_TABLE.name
+KEY = FINANCIAL_INFO_PARTITION_KEY
+
+BOUND_PATTERN = re.compile(r"FROM \('([\d-]+)'\) TO \('([\d-]+)'\)")
+
+# Serializes partition changes between workers (and the CLI) for one transaction
+PARTITION_LOCK_KEY = f'{PARENT}_partitions'
+
+logger = logging.getLogger('app.partitions')
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    # [start, end) of a range partition; both None for the default partition
+    start: date | None
+    end: date | None
+
+
+def partition_name(year: int) -> str:
+    return f'{PARENT}_p{year}'
+
+
+def list_partitions(connection: Connection) -> list[Partition]:
+    """Attached partitions, ordered by range; the default one (if any) comes last."""
+    rows = connection.execute(
+        text(
+            'SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) AS bound '
+            'FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+            'WHERE i.inhparent = CAST(:parent AS regclass)'
+        ),
+        {'parent': PARENT},
+    )
+    partitions = []
+    for name, bound in rows:
+        match = BOUND_PATTERN.search(bound)
+        if match:
+            start, end = (date.fromisoformat(value) for value in match.groups())
+            partitions.append(Partition(name, start, end))
+        else:
+            partitions.append(Partition(name, None, None))
+    return sorted(partitions, key=lambda p: (p.start is None, p.start or date.min))
+
+
+def create_partition(connection: Connection, year: int) -> bool:
+    """Attach the partition for `year`; False when it already exists.
+
+    The table is built standalone, filled with the year's rows taken out of the
+    default partition, then attached. The CHECK constraint lets ATTACH skip its
+    validation scan.
+    """
+    name = partition_name(year)
+    if any(partition.name == name for partition in list_partitions(connection)):
+        return False
+
+    start, end = date(year, 1, 1).isoformat(), date(year + 1, 1, 1).isoformat()
+    in_range = f"{KEY} >= '{start}' AND {KEY} < '{end}'"
+    connection.execute(
+        text(f'CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    )
+    connection.execute(
+        text(
+            f'INSERT INTO {name} SELECT * FROM {FINANCIAL_INFO_DEFAULT_PARTITION} WHERE {in_range}'
+        )
+    )
+    connection.execute(text(f'DELETE FROM {FINANCIAL_INFO_DEFAULT_PARTITION} WHERE {in_range}'))
+    connection.execute(text(f'ALTER TABLE {name} ADD CONSTRAINT {name}_bounds CHECK ({in_range})'))
+    connection.execute(
+        text(
+            f"ALTER TABLE {PARENT} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    )
+    connection.execute(text(f'ALTER TABLE {name} DROP CONSTRAINT {name}_bounds'))
+    return True
+
+
+def ensure_partitions(connection: Connection, first_year: int, last_year: int) -> list[str]:
+    """Create every missing yearly partition in [first_year, last_year]."""
+    return [
+        partition_name(year)
+        for year in range(first_year, last_year + 1)
+        if create_partition(connection, year)
+    ]
+
+
+def detach_partitions(connection: Connection, before_year: int, archive: bool = False) -> list[str]:
+    """Detach the partitions whose whole range is before `before_year`.
+
+    Detached partitions stay as standalone tables. With `archive`, their rows are
+    copied into employee_financial_info_archive and the tables are dropped.
+    """
+    cutoff = date(before_year, 1, 1)
+    columns = ', '.join(column.name for column in FINANCIAL_INFO_TABLE.columns)
+    detached = []
+    for partition in list_partitions(connection):
+        if partition.end is None or partition.end > cutoff:
+            continue
+        connection.execute(text(f'ALTER TABLE {PARENT} DETACH PARTITION {partition.name}'))
+        if archive:
+            connection.execute(
+                text(
+                    f'INSERT INTO {employee_financial_info_archive.name} ({columns}) '
+                    f'SELECT {columns} FROM {partition.name}'
+                )
+            )
+            connection.execute(text(f'DROP TABLE {partition.name}'))
+        detached.append(partition.name)
+    return detached
+
+
+def manage_partitions(
+    ahead: int = 1, detach_before: int | None = None, archive: bool = False
+) -> tuple[list[str], list[str]]:
+    """Crea las particiones de este año y `ahead` años más; separa/archiva las viejas.
+
+    Cada partición nueva se crea en su propia transacción, para no bloquear la tabla
+    más de lo necesario.
+    """
+    current_year = date.today().year
+    created: list[str] = []
+    for year in range(current_year, current_year + ahead + 1):
+        with engine.begin() as connection:
+            _lock(connection)
+            created += ensure_partitions(connection, year, year)
+    detached: list[str] = []
+    if detach_before is not None:
+        with engine.begin() as connection:
+            _lock(connection)
+            detached = detach_partitions(connection, detach_before, archive)
+    return created, detached
+
+
+def _lock(connection: Connection) -> None:
+    connection.execute(
+        text('SELECT pg_advisory_xact_lock(hashtext(:key))'), {'key': PARTITION_LOCK_KEY}
+    )
+
+
+async def manage_partitions_forever(
+    interval: float = settings.financial_partitions_check_seconds,
+    ahead: int = settings.financial_partitions_ahead,
+) -> None:
+    """Create the upcoming partitions at startup, then every `interval` seconds.
+
+    Runs on the sync engine in a worker thread. Every worker runs this loop; the
+    advisory lock lets only one of them create a given partition. Detaching old
+    partitions is left to `seed.py partitions`.
+    """
+    while True:
+        try:
+            created, _ = await asyncio.to_thread(manage_partitions, ahead)
+            if created:
+                logger.info('Created financial info partitions: %s', ', '.join(created))
+        except Exception:
+            logger.warning('Financial info partition check failed', exc_info=True)
+        await asyncio.sleep(interval)
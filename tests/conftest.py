@@ -1,7 +1,114 @@
 import os
 import sys
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.compiler import Compiled
 
 
 SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
 if SRC_ROOT not in sys.path:
     sys.path.insert(0, SRC_ROOT)
+
+DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+class RecordedRow(dict[str, Any]):
+    """Canned Row: a dict answering `_asdict()` and `_mapping`."""
+
+    def _asdict(self) -> dict[str, Any]:
+        return dict(self)
+
+    @property
+    def _mapping(self) -> dict[str, Any]:
+        return self
+
+
+class RecordedResult(list[Any]):
+    """Canned rows, answering the Result methods the repositories use."""
+
+    def first(self) -> Any:
+        return self[0] if self else None
+
+    def one(self) -> Any:
+        (row,) = self
+        return row
+
+    def scalar_one(self) -> Any:
+        return self.one()
+
+    def all(self) -> list[Any]:
+        return self
+
+    def scalars(self) -> 'RecordedResult':
+        return self
+
+
+class RecordedStream:
+    """Streamed result: every canned entry is one partition of rows."""
+
+    def __init__(self, partitions: list[list[Any]]) -> None:
+        self._partitions = partitions
+
+    async def partitions(self) -> AsyncIterator[list[Any]]:
+        for partition in self._partitions:
+            yield partition
+
+
+class RecordingSession:
+    """AsyncSession stand-in: compiles every statement for Postgres, runs nothing.
+
+    Each execute() answers with the next entry of `results` (no rows once they run
+    out), so repository code can be driven through its loops and branches.
+    """
+
+    def __init__(self) -> None:
+        self.results: list[list[Any]] = []
+        self.compiled: list[Compiled] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement: Any, params: Any = None) -> RecordedResult:
+        self.compiled.append(statement.compile(dialect=DIALECT))
+        return RecordedResult(self.results.pop(0) if self.results else [])
+
+    async def scalar(self, statement: Any, params: Any = None) -> Any:
+        return (await self.execute(statement, params)).first()
+
+    async def exec(self, statement: Any) -> RecordedResult:
+        return await self.execute(statement)
+
+    async def stream(self, statement: Any) -> RecordedStream:
+        """Server-side cursor: the remaining `results` come back as its partitions."""
+        self.compiled.append(statement.compile(dialect=DIALECT))
+        partitions, self.results = self.results, []
+        return RecordedStream(partitions)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    @property
+    def sql(self) -> list[str]:
+        return [str(compiled) for compiled in self.compiled]
+
+    @property
+    def params(self) -> list[dict[str, Any]]:
+        """Bound values of each statement, by bind-parameter name."""
+        return [compiled.params for compiled in self.compiled]
+
+    def literal_sql(self, index: int) -> str:
+        """Statement `index` with its values inlined, to assert on whole predicates."""
+        statement = self.compiled[index].statement
+        assert statement is not None
+        compiled = statement.compile(dialect=DIALECT, compile_kwargs={'literal_binds': True})
+        return str(compiled)
+
+
+@pytest.fixture
+def session() -> RecordingSession:
+    return RecordingSession()
@@ -0,0 +1,134 @@
+import asyncio
+import uuid
+from typing import Any
+
+from conftest import RecordedResult, RecordingSession
+
+from models.employee_model import EmployeeBulkCreateRequest, EmployeeCreate
+from repositories.employee_repository import EmployeeRepositoryClass
+from services.employee_service import EmployeeService
+
+
+def item(number: int, **overrides: Any) -> dict[str, Any]:
+    return {
+        'employee_code': f'ABC-{number:03}',
+        'first_name': 'Ana',
+        'last_name': 'Diaz',
+        'document_number': f'{number:08}',
+        'personal_email': f'ana{number}@example.com',
+        **overrides,
+    }
+
+
+class FakeRepository:
+    """Unique values in `stored` already exist; ids in `conflicting` lose a race."""
+
+    def __init__(self, stored: dict[str, set[str]] | None = None) -> None:
+        self.stored = stored or {}
+        self.conflicting: set[str] = set()
+        self.inserted: list[list[EmployeeCreate]] = []
+        self.skip_conflicts: bool | None = None
+
+    async def find_existing_unique_values(self, values: dict[str, set[str]]) -> dict[str, set[str]]:
+        return {field: values[field] & self.stored.get(field, set()) for field in values}
+
+    async def bulk_create_employees(
+        self, employees_in: list[EmployeeCreate], skip_conflicts: bool = False
+    ) -> list[uuid.UUID | None]:
+        self.inserted.append(employees_in)
+        self.skip_conflicts = skip_conflicts
+        return [
+            None if employee.employee_code in self.conflicting else uuid.uuid4()
+            for employee in employees_in
+        ]
+
+
+def create(repo: FakeRepository, mode: str, items: list[dict[str, Any]]) -> Any:
+    request = EmployeeBulkCreateRequest.model_validate({'mode': mode, 'items': items})
+    return asyncio.run(EmployeeService(repo).bulk_create_employees(request))
+
+
+def test_atomic_batch_with_a_bad_row_inserts_nothing() -> None:
+    repo = FakeRepository()
+
+    response = create(repo, 'atomic', [item(1), item(2, employee_code='bad'), item(3)])
+
+    assert repo.inserted == []
+    assert (response.created, response.failed) == (0, 1)
+    assert [result.status for result in response.results] == ['skipped', 'error', 'skipped']
+    assert response.results[1].errors[0].startswith('employee_code:')
+
+
+def test_partial_batch_inserts_the_valid_rows() -> None:
+    repo = FakeRepository()
+
+    response = create(repo, 'partial', [item(1), item(2, last_name=None), item(3)])
+
+    assert repo.skip_conflicts is True
+    assert [employee.employee_code for employee in repo.inserted[0]] == ['ABC-001', 'ABC-003']
+    assert (response.created, response.failed) == (2, 1)
+    assert [result.status for result in response.results] == ['created', 'error', 'created']
+    assert response.results[0].id is not None and response.results[1].id is None
+
+
+def test_duplicates_in_the_batch_and_in_the_database_are_rejected() -> None:
+    repo = FakeRepository(stored={'tax_id': {'TAX1'}})
+
+    response = create(
+        repo,
+        'partial',
+        [
+            item(1),
+            item(2, document_number=item(1)['document_number']),
+            item(3, tax_id='tax-1'),
+            item(4),
+        ],
+    )
+
+    # The first occurrence wins; the stored value is compared after normalisation
+    assert response.results[0].status == 'created'
+    assert response.results[1].errors == ['document_number: duplicated within the batch']
+    assert response.results[2].errors == ['tax_id: already exists']
+    assert response.results[3].status == 'created'
+    assert len(repo.inserted[0]) == 2
+
+
+def test_rows_lost_to_a_concurrent_insert_are_reported() -> None:
+    repo = FakeRepository()
+    repo.conflicting = {'ABC-002'}
+
+    response = create(repo, 'partial', [item(1), item(2)])
+
+    assert (response.created, response.failed) == (1, 1)
+    assert response.results[1].status == 'error'
+    assert response.results[1].errors == ['conflicts with a row inserted concurrently']
+
+
+class ConflictingSession(RecordingSession):  # type: ignore[misc]
+    """Both employees are inserted; only the first one's personal info is."""
+
+    async def execute(self, statement: Any, params: Any = None) -> RecordedResult:
+        result = await super().execute(statement, params)
+        inserted = self.params[-1]
+        if len(self.compiled) == 1:
+            return RecordedResult([inserted['id_m0'], inserted['id_m1']])
+        if len(self.compiled) == 2:
+            return RecordedResult([inserted['employee_id_m0']])
+        return result
+
+
+def test_employees_without_personal_info_are_deleted() -> None:
+    session = ConflictingSession()
+    employees = [EmployeeCreate.model_validate(item(number)) for number in (1, 2)]
+
+    ids = asyncio.run(
+        EmployeeRepositoryClass(session).bulk_create_employees(employees, skip_conflicts=True)
+    )
+
+    first_id, orphan_id = session.params[0]['id_m0'], session.params[0]['id_m1']
+    assert ids == [first_id, None]
+    assert all('ON CONFLICT DO NOTHING' in sql for sql in session.sql[:2])
+    # The half-created employee is removed in the same transaction
+    assert len(session.compiled) == 3 and session.commits == 1
+    assert session.sql[2].startswith('DELETE FROM employee WHERE employee.id IN')
+    assert session.params[2]['id_1'] == [orphan_id]
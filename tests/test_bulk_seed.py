@@ -0,0 +1,14 @@
+from utils.employees_bulk_seed import SeedShape, build_batch
+
+
+def test_batches_do_not_depend_on_batch_boundaries() -> None:
+    shape = SeedShape(seed=7, history_depth=(2, 3))
+    whole = build_batch(shape, 0, 20)
+    halves = [build_batch(shape, 0, 10), build_batch(shape, 10, 10)]
+
+    for table, payload in whole.items():
+        assert payload == b''.join(half[table] for half in halves)
+
+
+def test_different_seeds_produce_different_data() -> None:
+    assert build_batch(SeedShape(seed=1), 0, 5) != build_batch(SeedShape(seed=2), 0, 5)
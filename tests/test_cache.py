@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from common.cache import MemoryCache
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    async def scenario() -> MemoryCache:
+        cache = MemoryCache(max_entries=2, ttl_seconds=60)
+        await cache.set('a', b'1')
+        await cache.set('b', b'2')
+        assert await cache.get('a') == b'1'
+        await cache.set('c', b'3')
+        assert await cache.get('b') is None
+        assert await cache.get('a') == b'1'
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (2, 1, 1)
+
+
+def test_memory_cache_expires_and_invalidates_entries() -> None:
+    async def scenario() -> MemoryCache:
+        cache = MemoryCache(max_entries=10, ttl_seconds=0.01)
+        await cache.set('a', b'1')
+        time.sleep(0.02)
+        assert await cache.get('a') is None
+
+        cache.ttl_seconds = 60
+        await cache.set('b', b'2')
+        await cache.set('c', b'3')
+        await cache.delete('b', 'c', 'missing')
+        assert await cache.get('b') is None
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert (cache.stats.expirations, cache.stats.invalidations) == (1, 2)
+
+
+def test_memory_cache_bounds_total_bytes_and_bumps_generations() -> None:
+    async def scenario() -> MemoryCache:
+        cache = MemoryCache(max_entries=10, ttl_seconds=60, max_bytes=8)
+        await cache.set('a', b'1234')
+        await cache.set('b', b'5678')
+        await cache.set('c', b'90')
+        assert await cache.get('a') is None
+        assert await cache.get('c') == b'90'
+
+        assert await cache.generation('employees') == 0
+        await cache.bump_generation('employees')
+        assert await cache.generation('employees') == 1
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert cache.stats.evictions == 1
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from common.conditional import (
+    Freshness,
+    freshness_check,
+    if_match_versions,
+    make_etag,
+    version_etag,
+)
+
+
+def test_if_none_match_takes_precedence_over_dates() -> None:
+    freshness = Freshness(make_etag('id', datetime(2026, 5, 1)), datetime(2026, 5, 1))
+    headers = freshness.headers()
+
+    check = freshness_check(
+        {'if-none-match': f'"other", W/{headers["ETag"]}', 'if-modified-since': 'garbage'}
+    )
+    assert check is not None and check(freshness)
+
+    stale = freshness_check(
+        {'if-none-match': '"other"', 'if-modified-since': headers['Last-Modified']}
+    )
+    assert stale is not None and not stale(freshness)
+    assert freshness_check({}) is None
+
+
+def test_if_modified_since_uses_second_resolution_and_can_be_disabled() -> None:
+    freshness = Freshness('"v1"', datetime(2026, 5, 1, 10, 0, 0, 900000))
+    check = freshness_check({'if-modified-since': 'Fri, 01 May 2026 10:00:00 GMT'})
+    assert check is not None and check(freshness)
+
+    list_page = Freshness('"v1"', freshness.last_modified, honors_dates=False)
+    assert not check(list_page)
+
+
+def test_if_match_reads_back_version_etags_only() -> None:
+    assert if_match_versions(f'{version_etag(3)}, "7"') == {3, 7}
+    assert if_match_versions('*') is None
+    # Weak and foreign tags never match: the update is refused, not forced
+    assert if_match_versions(f'W/{version_etag(3)}, {make_etag("id")}') == set()
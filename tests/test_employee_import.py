@@ -0,0 +1,86 @@
+import asyncio
+
+from conftest import RecordingSession
+
+from models.employee_model import EmployeeStatus
+from repositories.employee_import_repository import (
+    STAGING_TABLE,
+    EmployeeImportRepositoryClass,
+    _normalize_expression,
+    _validation_rules,
+)
+
+
+def test_values_are_normalized_like_the_models() -> None:
+    assert _normalize_expression('employee_code') == 'upper(btrim(employee_code))'
+    # A blank status defaults to ACTIVE
+    assert _normalize_expression('status') == "coalesce(upper(nullif(btrim(status), '')), 'ACTIVE')"
+    assert _normalize_expression('personal_email') == "lower(nullif(btrim(personal_email), ''))"
+    assert _normalize_expression('document_number') == (
+        "nullif(upper(translate(document_number, '-. ', '')), '')"
+    )
+    assert _normalize_expression('phone') == "nullif(btrim(phone), '')"
+
+
+def test_normalize_defaults_a_missing_status_column(session: RecordingSession) -> None:
+    repo = EmployeeImportRepositoryClass(session)
+
+    asyncio.run(repo._normalize(['employee_code', 'first_name']))
+
+    assert session.sql == [
+        f'UPDATE {STAGING_TABLE} SET employee_code = upper(btrim(employee_code)), '
+        f"first_name = lower(nullif(btrim(first_name), '')), status = 'ACTIVE'"
+    ]
+
+
+def test_terminated_rows_are_rejected(session: RecordingSession) -> None:
+    reasons = dict(_validation_rules())
+    assert reasons["status = 'TERMINATED'"].startswith('status TERMINATED cannot be imported')
+    repo = EmployeeImportRepositoryClass(session)
+
+    asyncio.run(repo._validate())
+
+    # One CASE with every rule, bound to all statuses, then the duplicate checks
+    case = session.sql[0]
+    assert case.startswith(f'UPDATE {STAGING_TABLE} SET error = CASE WHEN')
+    assert "WHEN status = 'TERMINATED' THEN 'status TERMINATED cannot be imported" in case
+    # Rules run in order: an unknown status is reported before TERMINATED
+    assert case.index('status NOT IN') < case.index("status = 'TERMINATED'")
+    assert session.params[0]['statuses'] == [status.value for status in EmployeeStatus]
+    assert any('employee_code repeated in the file' in sql for sql in session.sql[1:])
+
+
+def test_upsert_targets_the_live_employee_code(session: RecordingSession) -> None:
+    # RETURNING (xmax = 0): one row inserted, two updated
+    session.results = [[True, False, False]]
+    repo = EmployeeImportRepositoryClass(session)
+
+    inserted, updated = asyncio.run(repo._merge(['employee_code', 'first_name']))
+
+    assert (inserted, updated) == (1, 2)
+    employee, personal = session.sql
+    assert 'WHERE error IS NULL' in employee
+    # Matched against live employees only: a soft-deleted code gets a new employee
+    assert 'ON CONFLICT (employee_code) WHERE deleted_at IS NULL' in employee
+    assert 'DO UPDATE SET status = EXCLUDED.status, version = employee.version + 1' in employee
+    assert 'e.deleted_at IS NULL' in personal
+    # Only the columns present in the file overwrite existing personal info
+    assert 'ON CONFLICT (employee_id) DO UPDATE SET first_name = EXCLUDED.first_name\n' in personal
+
+
+def test_rejects_are_reported_by_row(session: RecordingSession) -> None:
+    class Row:
+        def __init__(self, line_no: int, employee_code: str | None, error: str) -> None:
+            self.line_no = line_no
+            self.employee_code = employee_code
+            self.error = error
+
+    session.results = [
+        [Row(2, 'ABC-001', 'status TERMINATED cannot be imported'), Row(5, None, 'x')]
+    ]
+    repo = EmployeeImportRepositoryClass(session)
+
+    rejects = asyncio.run(repo._rejects())
+
+    assert rejects == [(2, 'ABC-001', 'status TERMINATED cannot be imported'), (5, None, 'x')]
+    assert 'WHERE error IS NOT NULL ORDER BY line_no' in session.sql[0]
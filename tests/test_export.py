@@ -0,0 +1,111 @@
+import asyncio
+import csv
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+from conftest import RecordingSession
+
+from models.employee_model import EmployeePublicResponse, EmployeeStatus
+from repositories.employee_repository import PUBLIC_FIELDS, EmployeeRepositoryClass
+from services.employee_service import EmployeeService
+
+
+def row(number: int) -> dict[str, Any]:
+    values: dict[str, Any] = dict.fromkeys(PUBLIC_FIELDS)
+    return {
+        **values,
+        'id': uuid.uuid4(),
+        'version': 1,
+        'employee_code': f'ABC-{number:03}',
+        'status': EmployeeStatus.ACTIVE,
+        'first_name': 'ana',
+        'last_name': 'diaz',
+        'document_number': f'{number:08}',
+        'personal_email': f'ana{number}@example.com',
+        'country_id': uuid.uuid4(),
+    }
+
+
+class FakeRepository:
+    """stream_filtered_employees yields the given batches."""
+
+    def __init__(self, *batches: list[dict[str, Any]]) -> None:
+        self.batches = batches
+
+    async def stream_filtered_employees(
+        self, **filters: Any
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        for batch in self.batches:
+            yield batch
+
+
+def export(repo: FakeRepository, export_format: str) -> list[bytes]:
+    async def collect() -> list[bytes]:
+        service = EmployeeService(repo)
+        return [chunk async for chunk in service.export_employees(export_format)]
+
+    return asyncio.run(collect())
+
+
+def test_csv_writes_the_header_once() -> None:
+    rows = [row(1), row(2), row(3)]
+
+    chunks = export(FakeRepository(rows[:2], rows[2:]), 'csv')
+
+    # One chunk per batch, the header leading the first one
+    assert len(chunks) == 2
+    lines = list(csv.reader(io.StringIO(b''.join(chunks).decode())))
+    assert lines[0] == list(PUBLIC_FIELDS)
+    assert [line[PUBLIC_FIELDS.index('employee_code')] for line in lines[1:]] == [
+        'ABC-001',
+        'ABC-002',
+        'ABC-003',
+    ]
+    assert lines[1][PUBLIC_FIELDS.index('status')] == 'ACTIVE'
+
+
+def test_csv_without_matches_is_the_header_only() -> None:
+    assert b''.join(export(FakeRepository(), 'csv')).decode().splitlines() == [
+        ','.join(PUBLIC_FIELDS)
+    ]
+
+
+def test_ndjson_is_one_object_per_line_encoded_like_the_json_responses() -> None:
+    rows = [row(1), row(2), row(3)]
+
+    chunks = export(FakeRepository(rows[:2], rows[2:]), 'ndjson')
+
+    assert len(chunks) == 2 and all(chunk.endswith(b'\n') for chunk in chunks)
+    lines = b''.join(chunks).splitlines()
+    assert len(lines) == 3
+    for line, source in zip(lines, rows, strict=True):
+        expected = EmployeePublicResponse.model_construct(**source).model_dump_json()
+        assert json.loads(line) == json.loads(expected)
+    assert export(FakeRepository(), 'ndjson') == []
+
+
+def test_rows_are_streamed_in_partitions(session: RecordingSession) -> None:
+    first, second = [row(1), row(2)], [row(3)]
+    session.results = [
+        [SimpleNamespace(_mapping=values) for values in first],
+        [SimpleNamespace(_mapping=values) for values in second],
+    ]
+    repo = EmployeeRepositoryClass(session)
+
+    async def collect() -> list[list[dict[str, Any]]]:
+        batches = repo.stream_filtered_employees(sort_by='employee_code', order='asc', batch_size=2)
+        return [batch async for batch in batches]
+
+    assert asyncio.run(collect()) == [first, second]
+    # One server-side cursor fetching batch_size rows at a time
+    (compiled,) = session.compiled
+    assert compiled.statement is not None
+    assert compiled.statement.get_execution_options()['yield_per'] == 2
+    sql = session.literal_sql(0)
+    assert sql.startswith('SELECT employee.id, employee.version, employee.employee_code')
+    assert 'employee.deleted_at IS NULL' in sql
+    assert sql.endswith('ORDER BY employee.employee_code ASC, employee.id ASC')
@@ -0,0 +1,42 @@
+import asyncio
+import uuid
+from datetime import date
+
+from conftest import DIALECT, RecordingSession
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from models.employee_model import FINANCIAL_INFO_PERIOD, EmployeeFinancialInfo
+from repositories.employee_repository import EmployeeRepositoryClass
+
+
+def index_sql(name: str) -> str:
+    index = next(i for i in EmployeeFinancialInfo.__table__.indexes if i.name == name)
+    return str(CreateIndex(index).compile(dialect=DIALECT))
+
+
+def test_lookups_use_the_indexed_expressions(session: RecordingSession) -> None:
+    repo = EmployeeRepositoryClass(session)
+    ids = [uuid.uuid4(), uuid.uuid4()]
+
+    asyncio.run(repo.get_financial_info(ids))
+    asyncio.run(repo.get_financial_info(ids, as_of=date(2025, 6, 30)))
+    current, as_of = (session.literal_sql(index) for index in range(2))
+
+    assert 'WHERE effective_to IS NULL' in index_sql('ix_employee_financial_info_current')
+    assert 'effective_to IS NULL' in current
+    assert FINANCIAL_INFO_PERIOD in index_sql('ix_employee_financial_info_period')
+    assert f"{FINANCIAL_INFO_PERIOD} @> '2025-06-30'" in as_of
+    # Bound on the partition key: partitions starting after that day are pruned
+    assert "employee_financial_info.effective_from <= '2025-06-30'" in as_of
+    # One statement for the whole batch, restricted to live employees
+    assert [params['employee_id_1'] for params in session.params] == [ids, ids]
+    assert session.params[1]['as_of'] == date(2025, 6, 30)
+    for sql in (current, as_of):
+        assert 'employee.deleted_at IS NULL' in sql.split('WHERE', 1)[1]
+
+
+def test_table_is_partitioned_by_effective_from() -> None:
+    ddl = str(CreateTable(EmployeeFinancialInfo.__table__).compile(dialect=DIALECT))
+
+    assert 'PARTITION BY RANGE (effective_from)' in ddl
+    assert 'PRIMARY KEY (id, effective_from)' in ddl
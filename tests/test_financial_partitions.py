@@ -0,0 +1,37 @@
+import asyncio
+import logging
+
+import pytest
+
+from utils import financial_partitions
+
+
+def test_partition_loop_keeps_running_after_a_failure(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls: list[int] = []
+
+    def manage_partitions(ahead: int) -> tuple[list[str], list[str]]:
+        calls.append(ahead)
+        if len(calls) == 1:
+            raise RuntimeError('database is down')
+        return ['employee_financial_info_p2027'], []
+
+    async def sleep(seconds: float) -> None:
+        if len(calls) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(financial_partitions, 'manage_partitions', manage_partitions)
+    monkeypatch.setattr(financial_partitions.asyncio, 'sleep', sleep)
+
+    with (
+        caplog.at_level(logging.INFO, logger='app.partitions'),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        asyncio.run(financial_partitions.manage_partitions_forever(interval=60, ahead=2))
+
+    assert calls == [2, 2]
+    assert [record.getMessage() for record in caplog.records] == [
+        'Financial info partition check failed',
+        'Created financial info partitions: employee_financial_info_p2027',
+    ]
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from starlette.types import Receive, Scope, Send
+
+from common.cache import MemoryCache
+from common.idempotency import IdempotencyError, IdempotencyStore, StoredResponse
+from middleware.idempotency import run_idempotent
+
+
+def make_store(wait_seconds: float = 1) -> IdempotencyStore:
+    return IdempotencyStore(MemoryCache(max_entries=100, ttl_seconds=60), 5, wait_seconds)
+
+
+def test_duplicate_waits_for_the_first_response() -> None:
+    async def scenario() -> list[StoredResponse | None]:
+        store = make_store()
+        assert await store.claim('k', 'fp') is None
+        duplicate = asyncio.create_task(store.claim('k', 'fp'))
+        await asyncio.sleep(0.01)
+        assert not duplicate.done()
+        await store.complete('k', 'fp', StoredResponse(201, 'application/json', b'{}'))
+        return [await duplicate, await store.claim('k', 'fp')]
+
+    waited, replayed = asyncio.run(scenario())
+    assert waited == replayed == StoredResponse(201, 'application/json', b'{}')
+
+
+def test_claim_survives_the_cache_filling_up() -> None:
+    async def scenario() -> None:
+        cache = MemoryCache(max_entries=2, ttl_seconds=60, max_bytes=64)
+        store = IdempotencyStore(cache, 5, wait_seconds=0.05)
+        assert await store.claim('k', 'fp') is None
+        # Finished responses push every evictable entry out of the LRU
+        for n in range(10):
+            assert await store.claim(f'other-{n}', 'fp') is None
+            await store.complete(f'other-{n}', 'fp', StoredResponse(201, '', b'x' * 20))
+        assert cache.stats.evictions > 0
+        # The in-flight claim is still held: a retry waits instead of running again
+        with pytest.raises(IdempotencyError) as in_progress:
+            await store.claim('k', 'fp')
+        assert in_progress.value.status_code == 409
+
+    asyncio.run(scenario())
+
+
+def test_key_reused_for_another_request_or_still_running() -> None:
+    async def scenario() -> None:
+        store = make_store(wait_seconds=0.05)
+        assert await store.claim('k', 'fp') is None
+        with pytest.raises(IdempotencyError) as other_request:
+            await store.claim('k', 'other')
+        assert other_request.value.status_code == 422
+        with pytest.raises(IdempotencyError) as in_progress:
+            await store.claim('k', 'fp')
+        assert in_progress.value.status_code == 409
+        # A failed first request frees the key for the retry
+        await store.release('k')
+        assert await store.claim('k', 'fp') is None
+
+    asyncio.run(scenario())
+
+
+def test_replay_does_not_run_the_endpoint_again() -> None:
+    calls: list[bytes] = []
+
+    async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+        calls.append((await receive())['body'])
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': 201,
+                'headers': [(b'content-type', b'application/json')],
+            }
+        )
+        await send({'type': 'http.response.body', 'body': b'{"n":%d}' % len(calls)})
+
+    store = make_store()
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        key = dict(scope['headers']).get(b'idempotency-key', b'').decode()
+        await run_idempotent(endpoint, store, key, scope, receive, send)
+
+    async def scenario() -> list[Any]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            headers = {'Idempotency-Key': 'abc'}
+            first = await client.post('/Employees/', content=b'{"a":1}', headers=headers)
+            again = await client.post('/Employees/', content=b'{"a":1}', headers=headers)
+            changed = await client.post('/Employees/', content=b'{"a":2}', headers=headers)
+            return [first, again, changed]
+
+    first, again, changed = asyncio.run(scenario())
+    assert calls == [b'{"a":1}']
+    assert (first.status_code, first.json()) == (201, {'n': 1})
+    assert (again.status_code, again.json()) == (201, {'n': 1})
+    assert again.headers['idempotent-replayed'] == 'true'
+    assert changed.status_code == 422
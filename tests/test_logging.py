@@ -0,0 +1,89 @@
+import io
+import json
+import logging
+import queue
+import time
+from typing import Any
+
+from common.logging_config import (
+    BatchingQueueListener,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    RequestIdFilter,
+    SamplingFilter,
+    request_id,
+)
+
+
+class SlowStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        time.sleep(0.02)
+        self.writes += 1
+        return super().write(text)
+
+
+def test_slow_disk_does_not_block_the_caller_and_writes_in_batches() -> None:
+    log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(1000)
+    stream = SlowStream()
+    handler: logging.StreamHandler[Any] = logging.StreamHandler(stream)
+    listener = BatchingQueueListener(log_queue, [handler])
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    logger = logging.getLogger('test.slow_disk')
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    listener.start()
+
+    token = request_id.set('req-1')
+    started = time.perf_counter()
+    for number in range(200):
+        logger.warning('line %d', number)
+    elapsed = time.perf_counter() - started
+    request_id.reset(token)
+    listener.stop()
+    logger.removeHandler(queue_handler)
+
+    assert elapsed < 0.02 * 10
+    assert stream.getvalue().count('\n') == 200
+    assert stream.writes < 200
+    assert queue_handler.dropped == 0
+
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    handler = NonBlockingQueueHandler(queue.Queue(2))
+    for number in range(5):
+        handler.handle(logging.makeLogRecord({'msg': 'line %d', 'args': (number,)}))
+
+    assert handler.dropped == 3
+    assert handler.queue.get_nowait().msg == 'line 0'
+
+
+def test_sampling_keeps_warnings_and_unlisted_loggers() -> None:
+    sampling = SamplingFilter({'app.request': 0.0})
+
+    def record(name: str, level: int) -> logging.LogRecord:
+        return logging.makeLogRecord({'name': name, 'levelno': level})
+
+    assert not sampling.filter(record('app.request', logging.INFO))
+    assert not sampling.filter(record('app.request.child', logging.INFO))
+    assert sampling.filter(record('app.request', logging.WARNING))
+    assert sampling.filter(record('app.requests', logging.INFO))
+
+
+def test_json_lines_carry_request_id_and_extra_fields() -> None:
+    record = logging.makeLogRecord(
+        {'name': 'app', 'levelname': 'INFO', 'msg': 'hi %s', 'args': ('there',), 'route': '/x'}
+    )
+    token = request_id.set('abc')
+    RequestIdFilter().filter(record)
+    request_id.reset(token)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['request_id'] == 'abc'
+    assert entry['message'] == 'hi there'
+    assert entry['route'] == '/x'
@@ -0,0 +1,152 @@
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from conftest import RecordedRow, RecordingSession
+
+from common.pagination import Cursor, decode_cursor, encode_cursor
+from repositories.employee_repository import EmployeeRepositoryClass
+
+
+def test_cursor_round_trip() -> None:
+    cursor = Cursor(
+        sort_by='created_at',
+        order='desc',
+        value=datetime(2025, 3, 1, 12, 30, tzinfo=UTC),
+        id=uuid4(),
+        direction='next',
+    )
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+def test_tampered_cursor_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        decode_cursor('not-a-cursor')
+
+
+def page_rows(*codes: str) -> list[RecordedRow]:
+    """Rows as the keyset query returns them, sorted by employee_code."""
+    return [RecordedRow(id=uuid4(), employee_code=code, sort_key=code) for code in codes]
+
+
+def cursor_for(row: RecordedRow, order: str, direction: str) -> str:
+    return encode_cursor(
+        Cursor(
+            sort_by='employee_code',
+            order=order,
+            value=row['sort_key'],
+            id=row['id'],
+            direction=direction,
+        )
+    )
+
+
+def by_cursor(session: RecordingSession, **params: Any) -> Any:
+    repo = EmployeeRepositoryClass(session)
+    return asyncio.run(repo.get_employees_by_cursor(limit=2, include_total='none', **params))
+
+
+def test_first_page_fetches_one_extra_row(session: RecordingSession) -> None:
+    rows = page_rows('AAA-001', 'AAA-002', 'AAA-003')
+    session.results = [rows]
+
+    items, total, next_cursor, prev_cursor = by_cursor(session, sort_by='employee_code')
+
+    assert [item['employee_code'] for item in items] == ['AAA-001', 'AAA-002']
+    assert all('sort_key' not in item for item in items)
+    assert total is None and prev_cursor is None
+    assert next_cursor is not None
+    assert decode_cursor(next_cursor) == Cursor(
+        'employee_code', 'desc', 'AAA-002', rows[1]['id'], 'next'
+    )
+    sql = session.literal_sql(0)
+    assert '(employee.employee_code, employee.id)' not in sql
+    assert ' '.join(sql.split()).endswith(
+        'ORDER BY employee.employee_code DESC, employee.id DESC LIMIT 3'
+    )
+
+
+@pytest.mark.parametrize(
+    ('order', 'direction', 'seek', 'scan'),
+    [
+        ('desc', 'next', '<', 'DESC'),
+        ('desc', 'prev', '>', 'ASC'),
+        ('asc', 'next', '>', 'ASC'),
+        ('asc', 'prev', '<', 'DESC'),
+    ],
+)
+def test_cursor_seeks_past_its_row(
+    session: RecordingSession, order: str, direction: str, seek: str, scan: str
+) -> None:
+    (boundary,) = page_rows('BBB-000')
+    session.results = [page_rows('BBB-001', 'BBB-002')]
+
+    by_cursor(
+        session,
+        sort_by='employee_code',
+        order=order,
+        cursor=cursor_for(boundary, order, direction),
+    )
+
+    sql = session.literal_sql(0)
+    where = sql[sql.index('WHERE') : sql.index('ORDER BY')]
+    assert f"(employee.employee_code, employee.id) {seek} ('BBB-000', '{boundary['id']}')" in where
+    assert f'ORDER BY employee.employee_code {scan}, employee.id {scan}' in sql
+
+
+def test_next_page_links_back_and_ends_without_more_rows(session: RecordingSession) -> None:
+    (boundary,) = page_rows('CCC-000')
+    rows = page_rows('CCC-001', 'CCC-002')
+    session.results = [rows]
+
+    items, _, next_cursor, prev_cursor = by_cursor(
+        session, sort_by='employee_code', cursor=cursor_for(boundary, 'desc', 'next')
+    )
+
+    assert [item['id'] for item in items] == [row['id'] for row in rows]
+    # No extra row came back: this is the last page
+    assert next_cursor is None
+    assert prev_cursor is not None
+    assert decode_cursor(prev_cursor) == Cursor(
+        'employee_code', 'desc', 'CCC-001', rows[0]['id'], 'prev'
+    )
+
+
+def test_prev_page_is_flipped_back_into_order(session: RecordingSession) -> None:
+    (boundary,) = page_rows('DDD-009')
+    # Scanned backwards: nearest row to the cursor first, plus one extra row
+    rows = page_rows('DDD-003', 'DDD-002', 'DDD-001')
+    session.results = [rows]
+
+    items, _, next_cursor, prev_cursor = by_cursor(
+        session,
+        sort_by='employee_code',
+        order='asc',
+        cursor=cursor_for(boundary, 'asc', 'prev'),
+    )
+
+    assert [item['employee_code'] for item in items] == ['DDD-002', 'DDD-003']
+    assert next_cursor is not None and prev_cursor is not None
+    assert decode_cursor(next_cursor).value == 'DDD-003'
+    assert decode_cursor(prev_cursor) == Cursor(
+        'employee_code', 'asc', 'DDD-002', rows[1]['id'], 'prev'
+    )
+
+
+def test_cursor_must_match_the_sort(session: RecordingSession) -> None:
+    (boundary,) = page_rows('EEE-001')
+
+    with pytest.raises(ValueError, match='sort_by/order'):
+        by_cursor(
+            session,
+            sort_by='employee_code',
+            order='asc',
+            cursor=cursor_for(boundary, 'desc', 'next'),
+        )
+    with pytest.raises(ValueError, match='sort_by/order'):
+        by_cursor(session, sort_by='created_at', cursor=cursor_for(boundary, 'desc', 'next'))
+    with pytest.raises(ValueError, match='only supports sort_by'):
+        by_cursor(session, sort_by='first_name')
+    assert session.compiled == []
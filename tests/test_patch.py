@@ -0,0 +1,146 @@
+import asyncio
+import uuid
+from collections.abc import Collection
+from datetime import datetime
+from typing import Any
+
+import pytest
+from conftest import RecordingSession
+from fastapi import HTTPException
+
+from common.conditional import Freshness, if_match_versions
+from models.employee_model import STATUS_TRANSITIONS, EmployeePatch, EmployeeStatus
+from repositories.employee_repository import EmployeeRepositoryClass
+from services.employee_service import EmployeeService
+
+
+EMPLOYEE_ID = uuid.uuid4()
+
+
+class FakeRepository:
+    """One employee at `version`; patch_employee behaves like the conditional UPDATE."""
+
+    def __init__(self, version: int, status: EmployeeStatus = EmployeeStatus.ACTIVE) -> None:
+        self.version = version
+        self.status = status
+        self.changes: list[dict[str, Any]] = []
+
+    async def patch_employee(
+        self, employee_id: uuid.UUID, changes: dict[str, Any], versions: Collection[int] | None
+    ) -> dict[str, Any] | None:
+        if employee_id != EMPLOYEE_ID or (versions is not None and self.version not in versions):
+            return None
+        target = changes.get('status', self.status)
+        if target != self.status and self.status not in STATUS_TRANSITIONS[target]:
+            return None
+        self.status = target
+        self.version += 1
+        self.changes.append(changes)
+        stamp = datetime(2026, 1, 1)
+        return {
+            'id': employee_id,
+            'version': self.version,
+            **changes,
+            'employee_updated_at': stamp,
+            'personal_info_updated_at': stamp,
+        }
+
+    async def get_employee_versions(self, employee_id: uuid.UUID) -> dict[str, Any] | None:
+        if employee_id != EMPLOYEE_ID:
+            return None
+        return {'id': employee_id, 'version': self.version}
+
+
+def patch(
+    service: EmployeeService, if_match: str | None, employee_id: uuid.UUID = EMPLOYEE_ID
+) -> tuple[bytes, Freshness]:
+    body = EmployeePatch.model_validate({'first_name': ' Ana '})
+    return asyncio.run(service.patch_employee(employee_id, body, if_match))
+
+
+def test_patch_requires_the_current_version() -> None:
+    repo = FakeRepository(version=3)
+    service = EmployeeService(repo)
+
+    _, freshness = patch(service, '"3"')
+    assert freshness.etag == '"4"'
+    assert repo.changes == [{'first_name': 'ana'}]
+
+    # A second writer still holding version 3 is refused instead of overwriting
+    with pytest.raises(HTTPException) as stale:
+        patch(service, '"3"')
+    assert stale.value.status_code == 412
+
+    with pytest.raises(HTTPException) as missing:
+        patch(service, None)
+    assert missing.value.status_code == 428
+
+    with pytest.raises(ValueError, match="doesn't exist"):
+        patch(service, '*', employee_id=uuid.uuid4())
+
+
+def test_patch_cannot_terminate_or_skip_transitions() -> None:
+    # Terminating must go through the soft delete, which also sets deleted_at
+    with pytest.raises(ValueError, match='DELETE'):
+        EmployeePatch.model_validate({'status': 'TERMINATED'})
+
+    repo = FakeRepository(version=1, status=EmployeeStatus.INACTIVE)
+    service = EmployeeService(repo)
+    body = EmployeePatch.model_validate({'status': 'ACTIVE'})
+    asyncio.run(service.patch_employee(EMPLOYEE_ID, body, '"1"'))
+    assert repo.status == EmployeeStatus.ACTIVE
+
+    # Refused by the transition rule with a current ETag: a conflict, not a stale read
+    repo.status = EmployeeStatus.TERMINATED
+    with pytest.raises(HTTPException) as refused:
+        asyncio.run(service.patch_employee(EMPLOYEE_ID, body, '"2"'))
+    assert refused.value.status_code == 409
+
+
+def set_columns(sql: str, table: str) -> set[str]:
+    """Columns assigned by the UPDATE of `table` in a compiled patch statement."""
+    start = sql.index(f'UPDATE {table} SET ') + len(f'UPDATE {table} SET ')
+    assignments = sql[start:].split(' WHERE ', 1)[0].split(' FROM ', 1)[0]
+    return {assignment.split('=', 1)[0] for assignment in assignments.split(', ')}
+
+
+def test_patch_statement_writes_only_the_sent_fields(session: RecordingSession) -> None:
+    repo = EmployeeRepositoryClass(session)
+    changes = EmployeePatch.model_validate({'employee_code': 'abc-123', 'city': 'Cali'})
+
+    patch_body = changes.model_dump(exclude_unset=True)
+    asyncio.run(repo.patch_employee(EMPLOYEE_ID, patch_body, if_match_versions('"3"')))
+    asyncio.run(
+        repo.patch_employee(EMPLOYEE_ID, {'employee_code': 'XYZ-999'}, if_match_versions('*'))
+    )
+    conditional, unconditional = session.sql
+
+    # One statement per PATCH: each table gets the sent fields and updated_at, nothing else
+    assert set_columns(conditional, 'employee') == {'employee_code', 'updated_at', 'version'}
+    assert set_columns(conditional, 'employees_personal_info') == {'city', 'updated_at'}
+    assert 'version=(employee.version + %(version_1)s)' in conditional
+    params = session.params[0]
+    assert (params['version_1'], params['id_1']) == (1, EMPLOYEE_ID)
+    assert 'ABC-123' in params.values() and 'cali' in params.values()
+
+    # If-Match "3": the UPDATE only matches a live row still at version 3
+    where = session.literal_sql(0).split('RETURNING', 1)[0].split('WHERE', 1)[1]
+    assert 'employee.version IN (3)' in where
+    assert 'employee.deleted_at IS NULL' in where
+    assert session.params[0]['version_2'] == [3]
+
+    # If-Match *: no version predicate; personal info is only read, not written
+    assert 'employee.version IN' not in unconditional
+    assert set_columns(unconditional, 'employee') == {'employee_code', 'updated_at', 'version'}
+    assert 'UPDATE employees_personal_info' not in unconditional
+    assert session.commits == 2
+
+
+def test_patch_statement_checks_the_status_transition(session: RecordingSession) -> None:
+    repo = EmployeeRepositoryClass(session)
+
+    asyncio.run(repo.patch_employee(EMPLOYEE_ID, {'status': EmployeeStatus.ACTIVE}, None))
+
+    where = session.literal_sql(0).split('RETURNING', 1)[0].split('WHERE', 1)[1]
+    # Staying ACTIVE or coming from INACTIVE; never out of TERMINATED
+    assert "employee.status IN ('ACTIVE', 'INACTIVE')" in where
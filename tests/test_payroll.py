@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from conftest import RecordedRow, RecordingSession
+
+from models.employee_model import EmployeeStatus
+from repositories.payroll_repository import PayrollRepositoryClass
+from services import payroll_service
+from services.payroll_service import PayrollService
+
+
+REFRESHED_AT = datetime(2026, 1, 1, 12, 0)
+
+
+def group(city: str, refreshed_at: datetime | None) -> RecordedRow:
+    return RecordedRow(
+        city=city,
+        status=EmployeeStatus.ACTIVE,
+        employees=3,
+        salary_total=Decimal('9000'),
+        company_cost_total=Decimal('11250'),
+        refreshed_at=refreshed_at,
+    )
+
+
+def test_summary_aggregates_the_view(session: RecordingSession) -> None:
+    session.results = [
+        [group('cali', REFRESHED_AT - timedelta(seconds=1)), group('medellín', REFRESHED_AT)]
+    ]
+    repo = PayrollRepositoryClass(session)
+
+    rows, refreshed_at = asyncio.run(repo.get_summary(['city', 'status']))
+
+    assert refreshed_at == REFRESHED_AT
+    assert [row['city'] for row in rows] == ['cali', 'medellín']
+    assert all('refreshed_at' not in row for row in rows)
+    sql = ' '.join(session.sql[0].split())
+    # Only the pre-aggregated view is read, never the employee tables
+    assert 'FROM payroll_summary GROUP BY payroll_summary.city, payroll_summary.status' in sql
+    assert 'ORDER BY payroll_summary.city, payroll_summary.status' in sql
+    assert 'sum(payroll_summary.salary_total)' in sql
+    assert 'employee' not in sql.replace('employees', '')
+
+
+def test_staleness_comes_from_the_refresh_time(
+    session: RecordingSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(payroll_service, 'utc_now', lambda: REFRESHED_AT + timedelta(seconds=90.5))
+    session.results = [[group('cali', REFRESHED_AT)], [group('cali', None)]]
+    service = PayrollService(PayrollRepositoryClass(session))
+
+    summary = asyncio.run(service.get_summary(['city', 'city']))
+    assert (summary.refreshed_at, summary.age_seconds) == (REFRESHED_AT, 90.5)
+    assert summary.group_by == ['city']
+    assert summary.groups[0].salary_total == Decimal('9000')
+
+    # Never refreshed with data: no age to report
+    never = asyncio.run(service.get_summary(['city']))
+    assert (never.refreshed_at, never.age_seconds) == (None, None)
+
+
+@pytest.mark.parametrize('locked', [True, False])
+def test_refresh_runs_concurrently_under_the_lock(session: RecordingSession, locked: bool) -> None:
+    session.results = [[locked]]
+    repo = PayrollRepositoryClass(session)
+
+    assert asyncio.run(repo.refresh()) is locked
+
+    lock, *refresh = session.sql
+    assert lock == 'SELECT pg_try_advisory_xact_lock(hashtext(%(key)s))'
+    # Without the lock another session is refreshing: nothing to do
+    assert refresh == (['REFRESH MATERIALIZED VIEW CONCURRENTLY payroll_summary'] if locked else [])
+    # The commit ends the transaction and with it the advisory lock
+    assert session.commits == 1
@@ -0,0 +1,74 @@
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from common.conditional import Freshness
+from common.config import Settings
+from dependencies import get_employees_services
+from main import app
+from middleware import auth
+
+
+CREDENTIALS = {'X-Client-Key': 'client', 'X-Client-Secret': 'secret'}
+
+
+class FakeService:
+    async def get_employee_json(self, employee_id: uuid.UUID, is_fresh: Any = None) -> Any:
+        return b'{}', Freshness('"1"', None)
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    monkeypatch.setattr(auth, 'settings', Settings(client_key='client', client_secret='secret'))
+    app.dependency_overrides[get_employees_services] = FakeService
+    # No context manager: the lifespan (pool sampler, payroll refresh) does not start
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_protected_routes_need_the_client_credentials(client: TestClient) -> None:
+    url = f'/Employees/{uuid.uuid4()}'
+
+    assert client.get(url).status_code == 403
+    assert client.get(url, headers={**CREDENTIALS, 'X-Client-Secret': 'wrong'}).status_code == 403
+    assert client.get(url, headers=CREDENTIALS).status_code == 200
+
+
+def test_public_routes_skip_auth_and_metrics_use_route_templates(client: TestClient) -> None:
+    assert client.get('/').status_code == 200
+    client.get(f'/Employees/{uuid.uuid4()}', headers=CREDENTIALS)
+    client.get(f'/Employees/{uuid.uuid4()}')
+
+    metrics = client.get('/metrics')
+    assert metrics.status_code == 200
+    # Labelled by route template, not by the concrete id; refused requests never
+    # reach the router
+    assert (
+        'http_requests_total{method="GET",route="/Employees/{employee_id}",status="200"}'
+        in metrics.text
+    )
+    assert 'http_requests_total{method="GET",route="unmatched",status="403"}' in metrics.text
+
+
+def test_response_headers(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('middleware.version.settings', Settings(version='9.9.9'))
+    url = f'/Employees/{uuid.uuid4()}'
+
+    response = client.get(url, headers=CREDENTIALS)
+    assert response.headers['X-Version'] == '9.9.9'
+    assert len(response.headers['X-Request-ID']) == 32
+    timing = response.headers['Server-Timing']
+    assert timing.startswith('db;dur=') and 'app;dur=' in timing and 'total;dur=' in timing
+
+    # A caller's request id is reused; refused requests get the headers too
+    echoed = client.get(url, headers={**CREDENTIALS, 'X-Request-ID': 'trace-1'})
+    assert echoed.headers['X-Request-ID'] == 'trace-1'
+    refused = client.get(url)
+    assert refused.status_code == 403
+    assert refused.headers['X-Version'] == '9.9.9'
+
+    # Health-style paths skip the timing header
+    assert 'Server-Timing' not in client.get('/').headers
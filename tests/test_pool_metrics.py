@@ -0,0 +1,40 @@
+from typing import Any
+
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from common.pool_metrics import InstrumentedAsyncQueuePool, pool_snapshot
+
+
+def make_pool(max_overflow: int, monkeypatch: pytest.MonkeyPatch) -> InstrumentedAsyncQueuePool:
+    """Pool of 2 with 5 connections already checked out; checkouts open nothing."""
+
+    def creator() -> Any:
+        raise AssertionError('no connection is opened')
+
+    pool = InstrumentedAsyncQueuePool(creator, pool_size=2, max_overflow=max_overflow)
+    monkeypatch.setattr(AsyncAdaptedQueuePool, '_do_get', lambda self: object())
+    monkeypatch.setattr(pool, 'checkedout', lambda: 5)
+    return pool
+
+
+def test_checkout_waits_once_the_overflow_is_used_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = make_pool(3, monkeypatch)
+    assert pool.capacity() == 5
+
+    pool._do_get()
+
+    assert pool.stats.waits == 1
+    assert pool_snapshot(pool)['saturation'] == 1.0
+
+
+def test_unlimited_overflow_never_waits(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = make_pool(-1, monkeypatch)
+    assert pool.capacity() is None
+
+    pool._do_get()
+
+    assert pool.stats.checkouts == 1 and pool.stats.waits == 0
+    snapshot = pool_snapshot(pool)
+    assert snapshot['max_overflow'] == -1
+    assert snapshot['saturation'] is None and snapshot['peak_saturation'] is None
@@ -0,0 +1,18 @@
+from sqlalchemy import create_engine, text
+
+from common.query_metrics import instrument_engine, track_queries
+
+
+def test_statements_are_attributed_to_the_tracked_scope_only() -> None:
+    engine = create_engine('sqlite://')
+    instrument_engine(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+        with track_queries() as stats:
+            conn.execute(text('SELECT 1'))
+            conn.execute(text('SELECT 2'))
+        conn.execute(text('SELECT 3'))
+
+    assert stats.queries == 2
+    assert stats.db_time_s > 0
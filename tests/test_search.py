@@ -0,0 +1,82 @@
+import asyncio
+from typing import Any
+
+import pytest
+from conftest import DIALECT, RecordingSession
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import SQLModel, col, select
+
+from models.employee_model import PERSONAL_INFO_SEARCH_DOCUMENT, Employee, EmployeePersonalInfo
+from repositories.employee_repository import EmployeeRepositoryClass
+from repositories.employee_search import search_predicate
+
+
+def index_sql(model: type[SQLModel], name: str) -> str:
+    index = next(i for i in model.__table__.indexes if i.name == name)  # type: ignore[attr-defined]
+    return str(CreateIndex(index).compile(dialect=DIALECT))
+
+
+def predicate_sql(term: str, mode: Any) -> str:
+    statement = select(col(Employee.id)).where(search_predicate(term, mode))
+    return str(statement.compile(dialect=DIALECT, compile_kwargs={'literal_binds': True}))
+
+
+def test_fulltext_matches_the_search_document_index() -> None:
+    sql = predicate_sql('ana diaz', 'fulltext')
+
+    assert PERSONAL_INFO_SEARCH_DOCUMENT in index_sql(
+        EmployeePersonalInfo, 'ix_employees_personal_info_search_document'
+    )
+    assert (
+        f"{PERSONAL_INFO_SEARCH_DOCUMENT} @@ websearch_to_tsquery('simple'::regconfig, 'ana diaz')"
+        in sql
+    )
+    # Codes are matched exactly, through the unique index
+    assert "employee.employee_code = 'ANA DIAZ'" in sql
+
+
+def test_fuzzy_uses_the_trigram_indexed_columns() -> None:
+    sql = predicate_sql('ana', 'fuzzy')
+
+    for model, column in (
+        (Employee, 'employee_code'),
+        (EmployeePersonalInfo, 'first_name'),
+        (EmployeePersonalInfo, 'last_name'),
+        (EmployeePersonalInfo, 'personal_email'),
+    ):
+        table = model.__tablename__
+        ddl = index_sql(model, f'ix_{table}_{column}_trgm')
+        assert f'USING gin ({column} gin_trgm_ops)' in ddl
+        # The % operator, escaped for the pyformat paramstyle
+        assert f"{table}.{column} %% 'ana'" in sql
+    assert 'ILIKE' not in sql.upper()
+
+
+# Leading part of the relevance expression each ranked mode sorts by
+RANKS = {
+    'fulltext': (
+        f"ts_rank({PERSONAL_INFO_SEARCH_DOCUMENT}, websearch_to_tsquery('simple'::regconfig, 'ana'))"
+    ),
+    'fuzzy': "greatest(similarity(employee.employee_code, 'ana')",
+}
+
+
+@pytest.mark.parametrize('mode', sorted(RANKS))
+def test_ranked_modes_order_by_relevance_with_offsets_only(
+    session: RecordingSession, mode: str
+) -> None:
+    repo = EmployeeRepositoryClass(session)
+    filters: dict[str, Any] = {'search': 'ana', 'search_mode': mode, 'include_total': 'none'}
+
+    asyncio.run(repo.get_filtered_employees(**filters))
+    asyncio.run(repo.get_employees_by_cursor(**filters))
+    offset, cursor = (session.literal_sql(index) for index in range(2))
+
+    order_by = offset.split('ORDER BY', 1)[1]
+    assert order_by.lstrip().startswith(RANKS[mode])
+    assert 'DESC, employee.created_at DESC' in order_by
+    # A keyset needs a total order on (sort column, id): the rank only filters there
+    assert RANKS[mode] not in cursor
+    assert 'ORDER BY employee.created_at DESC, employee.id DESC' in cursor
+    for sql in (offset, cursor):
+        assert 'employee.id IN (SELECT employee.id' in sql
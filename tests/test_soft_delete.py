@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+
+from conftest import DIALECT, RecordingSession
+from sqlalchemy.schema import CreateIndex
+
+from models.archive_model import ARCHIVE_TABLES, employee_archive
+from models.employee_model import LIVE_ROWS, Employee, EmployeePersonalInfo, EmployeeStatus
+from repositories.employee_archive_repository import ARCHIVE_BATCH_SQL
+from repositories.employee_repository import EmployeeRepositoryClass
+
+
+def test_reads_skip_soft_deleted_rows(session: RecordingSession) -> None:
+    repo = EmployeeRepositoryClass(session)
+
+    asyncio.run(repo.get_employee_by_id(uuid.uuid4()))
+    asyncio.run(repo.get_employee_versions(uuid.uuid4()))
+    asyncio.run(repo.get_filtered_employees(include_total='none'))
+    asyncio.run(repo.get_financial_info([uuid.uuid4()]))
+    asyncio.run(repo.find_existing_unique_values({'employee_code': {'EMP-001'}}))
+
+    for index in range(len(session.compiled)):
+        where = session.literal_sql(index).split('WHERE', 1)[1]
+        assert 'employee.deleted_at IS NULL' in where
+        if index < 3:
+            assert 'employees_personal_info.deleted_at IS NULL' in where
+
+
+def test_soft_delete_terminates_and_bumps_the_version(session: RecordingSession) -> None:
+    employee_id = uuid.uuid4()
+    session.results = [[(employee_id,)]]
+    repo = EmployeeRepositoryClass(session)
+
+    assert asyncio.run(repo.soft_delete_employee(employee_id))
+
+    employee_update, personal_update = session.compiled
+    params = employee_update.params
+    assert params['status'] == EmployeeStatus.TERMINATED
+    assert params['deleted_at'] == params['updated_at'] is not None
+    assert params['id_1'] == employee_id
+    # Only a live row can be deleted; the version moves so cached ETags go stale
+    assert 'WHERE employee.id = %(id_1)s::UUID AND employee.deleted_at IS NULL' in str(
+        employee_update
+    )
+    assert 'version=(employee.version + %(version_1)s)' in str(employee_update)
+    assert personal_update.params['deleted_at'] == params['deleted_at']
+    assert session.commits == 1
+
+    # Nothing live matched: the personal info is left alone
+    session.compiled.clear()
+    assert not asyncio.run(repo.soft_delete_employee(uuid.uuid4()))
+    assert len(session.compiled) == 1
+
+
+def test_hot_indexes_are_partial() -> None:
+    unique = {
+        index.name: index
+        for table in (Employee.__table__, EmployeePersonalInfo.__table__)
+        for index in table.indexes
+        if index.unique
+    }
+    # employee_id stays unique over the whole history: one personal info per employee
+    assert set(unique) == {
+        'ix_employee_employee_code',
+        'ix_employees_personal_info_document_number',
+        'ix_employees_personal_info_tax_id',
+        'ix_employees_personal_info_personal_email',
+        'ix_employees_personal_info_phone',
+        'ix_employees_personal_info_employee_id',
+    }
+    for name, index in unique.items():
+        sql = str(CreateIndex(index).compile(dialect=DIALECT))
+        assert (f'WHERE {LIVE_ROWS}' in sql) != (name == 'ix_employees_personal_info_employee_id')
+
+
+def test_archive_batch_moves_children_first() -> None:
+    statements = [
+        ARCHIVE_BATCH_SQL.index(f'DELETE FROM {table} ')
+        for table in ('employee_financial_info', 'employees_personal_info', 'employee')
+    ]
+    assert statements == sorted(statements)
+    assert 'FOR UPDATE SKIP LOCKED' in ARCHIVE_BATCH_SQL
+    assert set(employee_archive.c.keys()) == {*Employee.__table__.c.keys(), 'archived_at'}
+
+
+def test_archive_tables_are_keyed_by_id() -> None:
+    # Same key as the migration creates (ADD PRIMARY KEY (id)), partitioned source or not
+    for _, archive in ARCHIVE_TABLES:
+        assert [column.name for column in archive.primary_key] == ['id']
@@ -0,0 +1,100 @@
+import asyncio
+import uuid
+
+import pytest
+from conftest import RecordingSession
+from pydantic import ValidationError
+
+from models.employee_model import (
+    STATUS_TRANSITIONS,
+    EmployeeStatus,
+    EmployeeStatusTransitionRequest,
+)
+from repositories.employee_repository import EmployeeRepositoryClass
+
+
+def employee_update(sql: str) -> str:
+    """The UPDATE employee ... RETURNING part of a transition statement."""
+    return sql[sql.index('UPDATE employee SET') : sql.index('RETURNING employee.id')]
+
+
+def test_ids_are_updated_in_chunks(session: RecordingSession) -> None:
+    ids = [uuid.uuid4() for _ in range(5)]
+    session.results = [ids[:2], ids[2:4], ids[4:]]
+    repo = EmployeeRepositoryClass(session)
+
+    moved = asyncio.run(
+        repo.transition_status(
+            EmployeeStatus.ACTIVE,
+            STATUS_TRANSITIONS[EmployeeStatus.ACTIVE],
+            employee_ids=ids,
+            batch_size=2,
+        )
+    )
+
+    assert moved == ids
+    # One statement and one transaction per chunk, each bound to its own ids
+    assert len(session.compiled) == session.commits == 3
+    assert [params['id_1'] for params in session.params] == [ids[:2], ids[2:4], ids[4:]]
+    for index, params in enumerate(session.params):
+        assert EmployeeStatus.ACTIVE in params.values()
+        assert params['status_1'] == [EmployeeStatus.INACTIVE]
+        update = employee_update(session.literal_sql(index))
+        assert "status='ACTIVE'" in update
+        assert 'version=(employee.version + 1)' in update
+        # Transition and live-row rules are enforced by the UPDATE itself
+        where = update.split('WHERE', 1)[1]
+        assert "employee.status IN ('INACTIVE')" in where
+        assert 'employee.deleted_at IS NULL' in where
+        # Reactivating does not touch deleted_at nor the personal info
+        assert 'deleted_at=' not in update
+        assert 'employees_personal_info' not in session.sql[index]
+
+
+def test_terminating_by_filters_soft_deletes_until_exhausted(session: RecordingSession) -> None:
+    # The first batch comes back short (a concurrent write took a row out of it)
+    session.results = [[uuid.uuid4()], [uuid.uuid4(), uuid.uuid4()]]
+    repo = EmployeeRepositoryClass(session)
+
+    moved = asyncio.run(
+        repo.transition_status(
+            EmployeeStatus.TERMINATED,
+            STATUS_TRANSITIONS[EmployeeStatus.TERMINATED],
+            filters={'name': 'ana'},
+            batch_size=2,
+        )
+    )
+
+    assert len(moved) == 3
+    # A short batch does not end the loop; only an empty one does
+    assert len(session.compiled) == session.commits == 3
+    for index, params in enumerate(session.params):
+        assert params['first_name_1'] == params['last_name_1'] == '%ana%'
+        assert 2 in params.values()
+        sql = session.literal_sql(index)
+        update = employee_update(sql)
+        assert "status='TERMINATED'" in update
+        assert 'deleted_at=' in update
+        # Both the candidate subquery and the UPDATE re-check only allow live
+        # ACTIVE/INACTIVE rows
+        assert update.count("employee.status IN ('ACTIVE', 'INACTIVE')") == 2
+        assert update.count('employee.deleted_at IS NULL') == 2
+        assert 'ORDER BY employee.id' in update and 'LIMIT 2' in update
+        # Same statement: the personal info of the moved employees is soft-deleted too
+        personal = sql[sql.index('UPDATE employees_personal_info') :]
+        assert 'deleted_at=' in personal
+        assert 'employee_id IN (SELECT moved_employee.id' in personal
+
+
+def test_transitions_never_target_their_own_source() -> None:
+    for target, sources in STATUS_TRANSITIONS.items():
+        assert target not in sources
+
+
+def test_request_needs_exactly_one_selector() -> None:
+    with pytest.raises(ValidationError):
+        EmployeeStatusTransitionRequest.model_validate({'status': 'ACTIVE'})
+    with pytest.raises(ValidationError):
+        EmployeeStatusTransitionRequest.model_validate(
+            {'status': 'ACTIVE', 'ids': [str(uuid.uuid4())], 'filters': {}}
+        )
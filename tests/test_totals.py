@@ -0,0 +1,100 @@
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any
+
+import pytest
+from conftest import RecordedRow, RecordingSession
+
+from repositories.employee_repository import VERSION_FIELDS, EmployeeRepositoryClass
+from services.employee_service import EmployeeService
+
+
+STAMP = datetime(2026, 1, 1)
+
+
+def page_row(total_count: int | None = None) -> RecordedRow:
+    row = RecordedRow(id=uuid.uuid4(), **dict.fromkeys(VERSION_FIELDS, STAMP))
+    if total_count is not None:
+        row['total_count'] = total_count
+    return row
+
+
+def offset_page(session: RecordingSession, **params: Any) -> tuple[list[dict[str, Any]], Any]:
+    repo = EmployeeRepositoryClass(session)
+    return asyncio.run(repo.get_filtered_employees(versions_only=True, **params))
+
+
+@pytest.mark.parametrize(
+    'plan', [[{'Plan': {'Plan Rows': 1234}}], '[{"Plan": {"Plan Rows": 1234}}]']
+)
+def test_estimate_reads_the_planner_rows(session: RecordingSession, plan: Any) -> None:
+    # asyncpg hands json back decoded; other drivers return the text
+    session.results = [[plan], [page_row()]]
+    service = EmployeeService(EmployeeRepositoryClass(session))
+
+    response, _ = asyncio.run(service.search_employees(include_total='estimate'))
+
+    assert response is not None
+    assert (response.total, response.total_kind) == (1234, 'estimate')
+    explain, page = session.sql
+    # The plan of the filtered query itself: nothing is counted
+    assert explain.startswith('EXPLAIN (FORMAT JSON) SELECT')
+    assert 'count(' not in explain and 'count(' not in page
+
+
+def test_exact_total_rides_along_the_page(session: RecordingSession) -> None:
+    session.results = [[page_row(total_count=57), page_row(total_count=57)]]
+
+    items, total = offset_page(session, page=2, limit=2, include_total='exact')
+
+    assert total == 57
+    assert all('total_count' not in item for item in items)
+    # One statement: the window count is computed before OFFSET/LIMIT apply
+    (sql,) = session.sql
+    assert 'count(*) OVER () AS total_count' in sql
+
+
+def test_empty_page_past_the_end_falls_back_to_a_count(session: RecordingSession) -> None:
+    session.results = [[], [5]]
+
+    items, total = offset_page(session, page=3, limit=2, include_total='exact')
+
+    assert (items, total) == ([], 5)
+    page, count = session.sql
+    assert 'OFFSET' in page
+    assert ' '.join(count.split()).startswith('SELECT count(*) AS count_1 FROM (SELECT')
+    assert 'OVER' not in count
+
+
+def test_empty_first_page_needs_no_count(session: RecordingSession) -> None:
+    items, total = offset_page(session, include_total='exact')
+
+    assert (items, total) == ([], 0)
+    assert len(session.compiled) == 1
+
+
+def test_no_total_runs_only_the_page(session: RecordingSession) -> None:
+    session.results = [[page_row()]]
+    service = EmployeeService(EmployeeRepositoryClass(session))
+
+    response, _ = asyncio.run(service.search_employees(include_total='none'))
+
+    assert response is not None
+    assert (response.total, response.total_kind) == (None, 'none')
+    (sql,) = session.sql
+    assert 'count(' not in sql and 'EXPLAIN' not in sql
+
+
+def test_cursor_mode_counts_separately(session: RecordingSession) -> None:
+    session.results = [[42], [RecordedRow(page_row(), sort_key=STAMP)]]
+    service = EmployeeService(EmployeeRepositoryClass(session))
+
+    response, _ = asyncio.run(service.search_employees(pagination='cursor', limit=5))
+
+    assert response is not None
+    assert (response.total, response.total_kind) == (42, 'exact')
+    count, page = session.sql
+    # The seek predicate would truncate a window count, so the count runs on its own
+    assert count.startswith('SELECT count(*)')
+    assert 'OVER' not in page